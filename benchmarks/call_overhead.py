@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Measure the client-side cost of building a request, without sending it:
+the generated Api methods' own work (ApiClient.dispatch checking the
+arguments against the method's endpoint spec, filling in the path and
+converting the parameters with toPathValue), and the helpers they use to
+encode parameters.
+
+    python benchmarks/call_overhead.py
+"""
+
+import sys
+import urllib
+
+sys.path = ['./', './benchmarks'] + sys.path
+from wordnik import *
+from deserialize import bestOf
+
+
+class NullClient(swagger.ApiClient):
+    """ApiClient that answers every call with the same decoded document, so
+    that only the generated method itself is timed."""
+
+    def __init__(self, doc):
+        swagger.ApiClient.__init__(self, 'key', 'http://localhost/v4')
+        self.doc = doc
+
+    def callAPI(self, resourcePath, method, queryParams, postData,
+                headerParams=None):
+        return self.doc
+
+    def deserialize(self, obj, objClass, endpoint='other'):
+        return obj
+
+
+def methodCases():
+    client = NullClient({'word': 'cat'})
+    wordApi = WordApi.WordApi(client)
+    wordsApi = WordsApi.WordsApi(client)
+    wordListApi = WordListApi.WordListApi(client)
+    return [
+        ('getWord', lambda: wordApi.getWord('cat')),
+        ('getDefinitions-5-kwargs', lambda: wordApi.getDefinitions(
+            'cat', limit=5, partOfSpeech='noun', includeRelated=True,
+            sourceDictionaries=['wiktionary', 'webster'],
+            useCanonical=True)),
+        ('searchWords-10-kwargs', lambda: wordsApi.searchWords(
+            'tree', includePartOfSpeech='noun', excludePartOfSpeech='verb',
+            caseSensitive=False, minCorpusCount=5, maxCorpusCount=-1,
+            minDictionaryCount=1, maxDictionaryCount=-1, minLength=1,
+            maxLength=-1, skip=0)),
+        ('getWordListWords', lambda: wordListApi.getWordListWords(
+            'my-list', 'token', skip=0, limit=100)),
+    ]
+
+
+def encodingCases():
+    client = swagger.ApiClient('key', 'http://localhost/v4')
+    query = {'limit': '5', 'partOfSpeech': 'noun', 'includeRelated': 'True',
+             'sourceDictionaries': 'wiktionary%2Cwebster',
+             'useCanonical': 'True'}
+    return [
+        ('toPathValue-str', lambda: client.toPathValue('bon vivant')),
+        ('toPathValue-unicode', lambda: client.toPathValue(u'\xe9lan')),
+        ('toPathValue-list', lambda: client.toPathValue(
+            ['wiktionary', 'webster', 'century'])),
+        ('toPathValue-int', lambda: client.toPathValue(5)),
+        ('urlencode-5-params', lambda: urllib.urlencode(query)),
+        ('cacheKey-5-params', lambda: cache.cacheKey(
+            '/word.json/cat/definitions', query)),
+    ]
+
+
+def run():
+    return [{'case': name, 'seconds': bestOf(func)}
+            for (name, func) in methodCases() + encodingCases()]
+
+
+if __name__ == '__main__':
+    print('%-26s %12s' % ('case', 'usec/call'))
+    for result in run():
+        print('%-26s %12.2f' % (result['case'], result['seconds'] * 1e6))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Compare two result files written by benchmarks/suite.py, e.g. from the
+previous release and from the working tree:
+
+    python benchmarks/compare.py before.json after.json
+
+Prints every time and rate found in both files with the relative change,
+marking changes larger than the threshold (10% by default) as faster or
+slower.
+"""
+
+import sys
+import json
+import argparse
+
+
+def metrics(results):
+    """Yield ((group, case, field), value, lowerIsBetter) for every time
+    and rate in a results document."""
+
+    for (group, rows) in sorted(results['groups'].items()):
+        for row in rows:
+            case = row.get('case') or row.get('model')
+            for (field, value) in sorted(row.items()):
+                if field.endswith('PerSecond'):
+                    yield (group, case, field), value, False
+                elif field.endswith('econds'):
+                    yield (group, case, field), value, True
+
+
+def compare(before, after, threshold=0.1):
+    """Return rows of (group, case, field, before, after, change, verdict),
+    where change is the relative change of the value."""
+
+    old = dict((key, value) for (key, value, lower) in metrics(before))
+    rows = []
+    for (key, value, lowerIsBetter) in metrics(after):
+        if key not in old or not old[key]:
+            continue
+        change = (value - old[key]) / float(old[key])
+        better = change < 0 if lowerIsBetter else change > 0
+        verdict = ''
+        if abs(change) >= threshold:
+            verdict = 'faster' if better else 'SLOWER'
+        rows.append(key + (old[key], value, change, verdict))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare two benchmark '
+                                     'result files.')
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative change worth flagging (default 0.1)')
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+    print('%-14s %-30s %-20s %12s %12s %8s' % (
+        'group', 'case', 'field', 'before', 'after', 'change'))
+    slower = 0
+    for (group, case, field, old, new, change, verdict) in compare(
+            before, after, args.threshold):
+        print('%-14s %-30s %-20s %12.6g %12.6g %+7.1f%% %s' % (
+            group, case, field, old, new, change * 100, verdict))
+        slower += verdict == 'SLOWER'
+    sys.exit(1 if slower else 0)
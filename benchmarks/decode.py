@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Measure decoding the raw bodies of the benchmarked responses, the step
+between receiving a response and deserializing it, and encoding them back,
+with every installed JSON backend (see wordnik.jsoncodec).
+
+    python benchmarks/decode.py
+"""
+
+import sys
+import json
+
+sys.path = ['./', './benchmarks'] + sys.path
+from wordnik import jsoncodec
+from deserialize import bestOf, cases
+
+
+def run():
+    results = []
+    for name in jsoncodec.available():
+        backend = jsoncodec.backend(name)
+        for (case, doc, objClass) in cases():
+            body = json.dumps(doc)
+            decoded = backend.loads(body)
+            seconds = bestOf(lambda: backend.loads(body))
+            results.append({
+                'case': '%s-%s' % (name, case),
+                'backend': name,
+                'bytes': len(body),
+                'seconds': seconds,
+                'megabytesPerSecond': len(body) / seconds / 1e6,
+                'encodeSeconds': bestOf(lambda: backend.dumps(decoded)),
+            })
+    return results
+
+
+if __name__ == '__main__':
+    print('%-30s %10s %12s %8s %12s' % ('case', 'bytes', 'decode (ms)',
+                                        'MB/s', 'encode (ms)'))
+    for result in run():
+        print('%-30s %10d %12.3f %8.1f %12.3f' % (
+            result['case'], result['bytes'], result['seconds'] * 1000,
+            result['megabytesPerSecond'], result['encodeSeconds'] * 1000))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""Compare the precompiled deserializers with the original eval/regex based
+ApiClient.deserialize, on small and large responses.
+
+    python benchmarks/deserialize.py
+"""
+
+import re
+import sys
+import time
+import datetime
+
+sys.path = ['./', './benchmarks'] + sys.path
+from wordnik import *
+from wordnik.models import *
+
+
+def legacyDeserialize(obj, objClass):
+    """ApiClient.deserialize as it was before the precompiled converters."""
+
+    if type(objClass) == str:
+        if 'list[' in objClass:
+            match = re.match('list\[(.*)\]', objClass)
+            subClass = match.group(1)
+            return [legacyDeserialize(subObj, subClass) for subObj in obj]
+
+        if (objClass in ['int', 'float', 'long', 'dict', 'list', 'str', 'bool', 'datetime']):
+            objClass = eval(objClass)
+        else:  # not a native type, must be model class
+            objClass = eval(objClass + '.' + objClass)
+
+    if objClass == str:
+        return obj
+    elif objClass in [int, long, float, dict, list, bool]:
+        return objClass(obj)
+    elif objClass == datetime:
+        return datetime.datetime.strptime(obj[:-5],
+                                          "%Y-%m-%dT%H:%M:%S.%f")
+
+    instance = objClass()
+
+    for attr, attrType in instance.swaggerTypes.iteritems():
+        if attr in obj:
+            value = obj[attr]
+            if attrType in ['str', 'int', 'long', 'float', 'bool']:
+                attrType = eval(attrType)
+                try:
+                    value = attrType(value)
+                except UnicodeEncodeError:
+                    value = unicode(value)
+                setattr(instance, attr, value)
+            elif (attrType == 'datetime'):
+                setattr(instance, attr, datetime.datetime.strptime(value[:-5],
+                                          "%Y-%m-%dT%H:%M:%S.%f"))
+            elif 'list[' in attrType:
+                match = re.match('list\[(.*)\]', attrType)
+                subClass = match.group(1)
+                subValues = []
+                if not value:
+                    setattr(instance, attr, None)
+                else:
+                    for subValue in value:
+                        subValues.append(legacyDeserialize(subValue,
+                                                           subClass))
+                setattr(instance, attr, subValues)
+            else:
+                setattr(instance, attr, legacyDeserialize(value, objClass))
+
+    return instance
+
+
+def cases():
+    """(name, decoded JSON, type string) for each benchmarked response."""
+
+    return [
+        ('definitions-small', stubserver.definitions(3), 'list[Definition]'),
+        ('definitions-large', stubserver.definitions(200), 'list[Definition]'),
+        ('searchWords-large', stubserver.wordSearchResults(1000),
+         'WordSearchResults'),
+        ('frequency', stubserver.frequencySummary(200), 'FrequencySummary'),
+    ]
+
+
+def bestOf(func, repeat=5, minTime=0.2):
+    """Return the best time per call of `func`, in seconds."""
+
+    number = 1
+    while True:
+        start = time.time()
+        for i in xrange(number):
+            func()
+        if time.time() - start >= minTime:
+            break
+        number *= 2
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        for i in xrange(number):
+            func()
+        elapsed = (time.time() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run():
+    results = []
+    for (name, doc, objClass) in cases():
+        legacy = bestOf(lambda: legacyDeserialize(doc, objClass))
+        compiled = bestOf(lambda: deserializer.deserialize(doc, objClass))
+        results.append({'case': name, 'legacySeconds': legacy,
+                        'compiledSeconds': compiled,
+                        'speedup': legacy / compiled})
+    return results
+
+
+if __name__ == '__main__':
+    print('%-20s %12s %12s %8s' % ('case', 'legacy (ms)', 'compiled (ms)',
+                                   'speedup'))
+    for result in run():
+        print('%-20s %12.3f %12.3f %7.1fx' % (
+            result['case'], result['legacySeconds'] * 1000,
+            result['compiledSeconds'] * 1000, result['speedup']))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Measure how long importing the package takes, each time in a fresh
+interpreter, from a bare `import wordnik` to what a short script needs to
+make its first call.
+
+    python benchmarks/import_time.py
+"""
+
+import sys
+import subprocess
+
+cases = [
+    ('import-wordnik', 'import wordnik'),
+    ('import-star', 'from wordnik import *'),
+    ('import-star-models', 'from wordnik.models import *'),
+    ('client', 'from wordnik import *\n'
+               'WordApi.WordApi(swagger.ApiClient("key", "http://localhost"))'),
+    ('client-cached', 'from wordnik import *\n'
+                      'swagger.ApiClient("key", "http://localhost", '
+                      'cache=diskcache.DiskCache(":memory:"))'),
+]
+
+timer = '''
+import sys, time
+sys.path = ['./'] + sys.path
+start = time.time()
+exec(%r)
+print(time.time() - start)
+'''
+
+
+def importSeconds(code, repeat=7):
+    """Return the best time the statements in `code` took to run in a new
+    interpreter."""
+
+    return min(float(subprocess.check_output(
+        [sys.executable, '-c', timer % code]))
+        for i in range(repeat))
+
+
+def run():
+    return [{'case': name, 'seconds': importSeconds(code)}
+            for (name, code) in cases]
+
+
+if __name__ == '__main__':
+    print('%-20s %10s' % ('case', 'ms'))
+    for result in run():
+        print('%-20s %10.2f' % (result['case'], result['seconds'] * 1000))
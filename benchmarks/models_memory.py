@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""Report the memory used per model instance by the slotted models, against
+the previous layout where every instance carried a __dict__ and its own
+copy of the swaggerTypes dict.
+
+    python benchmarks/models_memory.py
+"""
+
+import sys
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik.models import *
+
+
+def legacyClass(cls):
+    """Return an equivalent of `cls` laid out as the models used to be."""
+
+    swaggerTypes = cls.swaggerTypes
+
+    class Legacy:
+
+        def __init__(self):
+            self.swaggerTypes = dict(swaggerTypes)
+            for attr in swaggerTypes:
+                setattr(self, attr, None)
+
+    return Legacy
+
+
+def legacySize(instance):
+    return (sys.getsizeof(instance) + sys.getsizeof(instance.__dict__) +
+            sys.getsizeof(instance.swaggerTypes))
+
+
+def run():
+    results = []
+    for cls in [Definition.Definition, Example.Example,
+                WordListWord.WordListWord, ScoredWord.ScoredWord,
+                WordSearchResult.WordSearchResult]:
+        slotted = sys.getsizeof(cls())
+        legacy = legacySize(legacyClass(cls)())
+        results.append({'model': cls.__name__, 'legacyBytes': legacy,
+                        'slottedBytes': slotted,
+                        'savedBytes': legacy - slotted})
+    return results
+
+
+if __name__ == '__main__':
+    print('%-18s %12s %12s %12s' % ('model', 'before (B)', 'slotted (B)',
+                                    'saved (B)'))
+    for result in run():
+        print('%-18s %12d %12d %12d' % (
+            result['model'], result['legacyBytes'], result['slottedBytes'],
+            result['savedBytes']))
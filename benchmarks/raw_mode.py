@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""Compare the throughput of the return modes of ApiClient, from a raw
+response body to the value an Api method returns: full model objects, lazy
+models (nested fields left unconverted), namedtuples, and the decoded JSON
+as-is (raw=True).
+
+    python benchmarks/raw_mode.py
+"""
+
+import sys
+import json
+
+sys.path = ['./', './benchmarks'] + sys.path
+from wordnik import *
+from deserialize import bestOf, cases
+
+modes = [
+    ('model', {}),
+    ('lazy', {'lazy': True}),
+    ('namedtuple', {'raw': 'namedtuple'}),
+    ('raw', {'raw': True}),
+]
+
+
+def run():
+    client = swagger.ApiClient('key', 'http://localhost/v4')
+    results = []
+    for (name, doc, objClass) in cases():
+        body = json.dumps(doc)
+        result = {'case': name}
+        for (mode, options) in modes:
+            def parse():
+                with client.options(**options):
+                    return client.deserialize(json.loads(body), objClass)
+            result[mode + 'PerSecond'] = 1.0 / bestOf(parse)
+        results.append(result)
+    return results
+
+
+if __name__ == '__main__':
+    print('responses per second, decode + deserialize')
+    print('%-20s' % 'case' + ''.join('%12s' % mode for (mode, o) in modes))
+    for result in run():
+        print('%-20s' % result['case'] + ''.join(
+            '%12.0f' % result[mode + 'PerSecond'] for (mode, o) in modes))
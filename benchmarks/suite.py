@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Run every benchmark and save the results as JSON, so that releases can be
+compared with benchmarks/compare.py.
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --only deserialize --only throughput
+
+Each group holds the result rows of one benchmark module. Fields ending in
+'seconds' or 'Seconds' are times, where lower is better; fields ending in
+'PerSecond' are rates, where higher is better.
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+sys.path = ['./', './benchmarks'] + sys.path
+import call_overhead
+import decode
+import deserialize
+import import_time
+import raw_mode
+import models_memory
+import throughput
+
+groups = [
+    ('callOverhead', call_overhead.run),
+    ('decode', decode.run),
+    ('deserialize', deserialize.run),
+    ('rawMode', raw_mode.run),
+    ('modelsMemory', models_memory.run),
+    ('throughput', throughput.run),
+    ('importTime', import_time.run),
+]
+
+
+def revision():
+    """The git revision being benchmarked, if known."""
+
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.STDOUT).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(only=None):
+    results = {
+        'meta': {
+            'revision': revision(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+        },
+        'groups': {},
+    }
+    for (name, func) in groups:
+        if only and name not in only:
+            continue
+        sys.stderr.write('running %s...\n' % name)
+        results['groups'][name] = func()
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the benchmarks.')
+    parser.add_argument('--output', help='file to write the JSON results to; '
+                        'standard output by default')
+    parser.add_argument('--only', action='append', metavar='GROUP',
+                        choices=[name for (name, func) in groups],
+                        help='run only this group; may be repeated')
+    args = parser.parse_args()
+
+    results = run(args.only)
+    if args.output:
+        with open(args.output, 'w') as out:
+            json.dump(results, out, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Measure end-to-end throughput, from an Api method call to its returned
+models, against the local stub server: one thread, then several threads
+sharing a client. Every call asks for a different word, so nothing is
+coalesced. The stub runs in a process of its own, so that it does not
+compete with the client for the GIL, and answers after 5ms, as a nearby
+server would: the thread counts then show how well the client overlaps the
+waiting, rather than how fast two CPU-bound loops share one core.
+
+    python benchmarks/throughput.py
+"""
+
+import os
+import sys
+import time
+import threading
+import subprocess
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+threadCounts = [1, 8]
+
+
+def cases(wordApi):
+    return [
+        ('getWord', lambda word: wordApi.getWord(word)),
+        ('getDefinitions-50', lambda word: wordApi.getDefinitions(
+            word, limit=50)),
+    ]
+
+
+def callsPerSecond(func, threads, calls):
+    """Make `calls` calls of `func`, spread over `threads` threads."""
+
+    perThread = calls // threads
+
+    def worker(n):
+        for i in range(perThread):
+            func('word%d-%d' % (n, i))
+
+    workers = [threading.Thread(target=worker, args=(n,))
+               for n in range(threads)]
+    start = time.time()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return perThread * threads / (time.time() - start)
+
+
+def startStub(latency):
+    """Start the stub server in a new process on a free port. Returns the
+    process and the URL to point an ApiClient at."""
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'wordnik.stubserver', '--port', '0',
+         '--latency', str(latency)], cwd=root, stderr=subprocess.PIPE)
+    # It announces 'Serving the Wordnik API stub at <url>' once listening
+    line = process.stderr.readline()
+    if not line:
+        raise RuntimeError('stub server failed to start')
+    return process, line.split()[-1]
+
+
+def run(calls=1000, latency=0.005):
+    process, url = startStub(latency)
+    try:
+        client = swagger.ApiClient('key', url,
+                                   pool=transport.ConnectionPool(maxSize=32))
+        wordApi = WordApi.WordApi(client)
+        results = []
+        for (name, func) in cases(wordApi):
+            func('warmup')
+            for threads in threadCounts:
+                results.append({
+                    'case': '%s-%d-threads' % (name, threads),
+                    'callsPerSecond': callsPerSecond(func, threads, calls)})
+        return results
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == '__main__':
+    print('%-28s %12s' % ('case', 'calls/s'))
+    for result in run():
+        print('%-28s %12.0f' % (result['case'], result['callsPerSecond']))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+import urllib2
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class AsyncApiTest(LocalServerTest):
+
+    def setUp(self):
+        super(AsyncApiTest, self).setUp()
+        self.client = asyncapi.AsyncApiClient('key', self.apiUrl,
+                                              maxWorkers=20)
+        self.wordApi = asyncapi.AsyncWordApi(self.client)
+
+    def tearDown(self):
+        self.client.close()
+        super(AsyncApiTest, self).tearDown()
+
+    def respond(self, method, path):
+        time.sleep(0.1)
+        if path.startswith('/v4/word.json/missing'):
+            return 404, {'message': 'not found'}
+        word = path.split('/')[3]
+        return 200, [{'word': word, 'text': 'a definition of ' + word,
+                      'labels': [{'text': 'informal', 'type': 'register'}]}]
+
+    def testSameMethodsAsBlockingApi(self):
+        for name in ['getDefinitions', 'getExamples', 'getWord']:
+            assert hasattr(self.wordApi, name), 'missing ' + name
+        assert hasattr(asyncapi.AsyncWordsApi, 'searchWords')
+        assert hasattr(asyncapi.AsyncWordListApi, 'getWordListWords')
+        assert hasattr(asyncapi.AsyncWordListsApi, 'createWordList')
+        assert hasattr(asyncapi.AsyncAccountApi, 'getApiTokenStatus')
+
+    def testReturnsDeserializedModels(self):
+        res = self.wordApi.getDefinitions('cat', limit=1).get(5)
+        assert res[0].word == 'cat', 'word should be "cat"'
+        assert res[0].labels[0].text == 'informal', 'labels not deserialized'
+
+    def testCallsRunConcurrently(self):
+        words = ['word%d' % i for i in range(20)]
+        start = time.time()
+        pending = [self.wordApi.getDefinitions(word) for word in words]
+        results = [result.get(5) for result in pending]
+        elapsed = time.time() - start
+        assert [res[0].word for res in results] == words, 'wrong results'
+        assert elapsed < 1.0, 'calls should overlap, took %.2fs' % elapsed
+
+    def testCallback(self):
+        seen = []
+        self.wordApi.getDefinitions('cat', callback=seen.append).wait(5)
+        time.sleep(0.05)
+        assert seen and seen[0][0].word == 'cat', 'callback not called'
+
+    def testCallOptionsFollowTheCall(self):
+        client = asyncapi.AsyncApiClient('key', self.apiUrl, maxWorkers=2,
+                                         cache=cache.ResponseCache())
+        wordApi = asyncapi.AsyncWordApi(client)
+        wordApi.getDefinitions('cat').get(5)
+        with client.options(useCache=False):
+            wordApi.getDefinitions('cat').get(5)
+        client.close()
+        assert client.cache.stats()['hits'] == 0, 'cache should be bypassed'
+
+    def testErrorsAreReraised(self):
+        result = self.wordApi.getDefinitions('missing')
+        self.assertRaises(urllib2.HTTPError, result.get, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 """Unit tests for Python Wordnik API client.
 
-Requires you to set three environment varibales:
+To test against api.wordnik.com, set three environment varibales:
     API_KEY      your API key
     USER_NAME    the username of a user
     PASSWORD     the user's password
 
+Without API_KEY the tests run offline, against the bundled stub server
+(wordnik/stubserver.py).
+
 Run all tests:
 
     python BaseApiTest.py
@@ -14,19 +17,39 @@ Run all tests:
 
 import sys
 import os
+import atexit
 import unittest
 
 sys.path = ['./'] + sys.path
 from wordnik import *
 
 
+_stub = None
+
+
+def stubServer():
+    """Return the stub server shared by all tests, starting it first."""
+
+    global _stub
+    if _stub is None:
+        _stub = stubserver.StubServer().start()
+        atexit.register(_stub.stop)
+    return _stub
+
+
 class BaseApiTest(unittest.TestCase):
 
     def setUp(self):
-        self.apiUrl = 'http://api.wordnik.com/v4'
         self.apiKey = os.environ.get('API_KEY')
-        self.username = os.environ.get('USER_NAME')
-        self.password = os.environ.get('PASSWORD')
+        if self.apiKey:
+            self.apiUrl = 'http://api.wordnik.com/v4'
+            self.username = os.environ.get('USER_NAME')
+            self.password = os.environ.get('PASSWORD')
+        else:
+            self.apiUrl = stubServer().url
+            self.apiKey = 'stub-key'
+            self.username = 'stubuser'
+            self.password = 'stubpassword'
 
         client = swagger.ApiClient(self.apiKey, self.apiUrl)
         self.accountApi = AccountApi.AccountApi(client)
@@ -37,8 +60,27 @@ class BaseApiTest(unittest.TestCase):
 if __name__ == "__main__":
 
     from AccountApiTest import AccountApiTest
+    from AsyncApiTest import AsyncApiTest
+    from BatchTest import BatchTest
+    from CacheTest import CacheTest
+    from ConnectionPoolTest import ConnectionPoolTest
+    from DeserializerTest import DeserializerTest
+    from DiskCacheTest import DiskCacheTest
+    from EndpointsTest import EndpointsTest
+    from JsonCodecTest import JsonCodecTest
+    from LazyImportTest import LazyImportTest
+    from MetricsTest import MetricsTest
+    from ModelsTest import ModelsTest
+    from PagingTest import PagingTest
+    from RateLimitTest import RateLimitTest
+    from RetryTest import RetryTest
+    from SingleFlightTest import SingleFlightTest
+    from StaleWhileRevalidateTest import StaleWhileRevalidateTest
+    from StubServerTest import StubServerTest
+    from ThreadSafetyTest import ThreadSafetyTest
     from WordApiTest import WordApiTest
     from WordListApiTest import WordListApiTest
+    from WordProfileTest import WordProfileTest
     from WordsApiTest import WordsApiTest
 
     unittest.main()
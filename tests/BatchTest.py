@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+import urllib2
+import threading
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class BatchTest(LocalServerTest):
+
+    def setUp(self):
+        super(BatchTest, self).setUp()
+        self.lock = threading.Lock()
+        self.inFlight = 0
+        self.maxInFlight = 0
+        client = swagger.ApiClient('key', self.apiUrl)
+        self.wordApi = WordApi.WordApi(client)
+
+    def respond(self, method, path):
+        with self.lock:
+            self.inFlight += 1
+            self.maxInFlight = max(self.maxInFlight, self.inFlight)
+        time.sleep(0.02)
+        with self.lock:
+            self.inFlight -= 1
+        word = path.split('/')[3].split('?')[0]
+        if word.startswith('bad'):
+            return 500, {'message': 'server error'}
+        if path.split('?')[0].endswith('/definitions'):
+            return 200, [{'word': word, 'text': 'a ' + word}]
+        return 200, {'word': word, 'id': 1}
+
+    def testGetDefinitionsManyKeyedByWord(self):
+        words = ['word%d' % i for i in range(30)]
+        res = self.wordApi.getDefinitionsMany(words, maxWorkers=5, limit=1)
+        assert sorted(res.keys()) == sorted(words), 'every word should have a result'
+        for word in words:
+            assert res[word][0].word == word, 'result keyed by the wrong word'
+        assert self.maxInFlight <= 5, 'no more than 5 lookups should be in flight'
+
+    def testFailuresAreRecordedPerWord(self):
+        res = self.wordApi.getDefinitionsMany(['cat', 'bad1', 'dog'])
+        assert res['cat'][0].text == 'a cat', 'cat should succeed'
+        assert res['dog'][0].text == 'a dog', 'dog should succeed'
+        failure = res['bad1']
+        assert isinstance(failure, batch.BatchFailure), 'bad1 should fail'
+        assert isinstance(failure.exception, urllib2.HTTPError), 'wrong exception'
+
+    def testIterYieldsAsCompleted(self):
+        words = iter(['word%d' % i for i in range(10)])
+        seen = []
+        for word, result in self.wordApi.iterWordsMany(words, maxWorkers=2):
+            seen.append(word)
+            assert result.word == word, 'result paired with the wrong word'
+        assert len(seen) == 10, 'should yield every word'
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+import email.utils
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class CacheTest(LocalServerTest):
+
+    def setUp(self):
+        super(CacheTest, self).setUp()
+        self.requests = 0
+        self.etag = None  # sent with responses when set
+        self.responseHeaders = {}  # sent with every response
+        self.ifNoneMatch = []  # validators the requests were sent with
+        self.now = 1000.0
+        self.cache = cache.ResponseCache(
+            ttl=60, endpointTtls={'/word.json/{word}/definitions': 3600,
+                                  '/word.json/{word}/scrabbleScore': 0})
+        self.cache.clock = lambda: self.now
+        self.client = swagger.ApiClient('key', self.apiUrl, cache=self.cache)
+        self.wordApi = WordApi.WordApi(self.client)
+
+    def respond(self, method, path):
+        self.requests += 1
+        word = path.split('/')[3].split('?')[0]
+        if '/definitions' in path:
+            doc = [{'word': word, 'text': 'a ' + word}]
+        elif '/scrabbleScore' in path:
+            doc = {'value': 3}
+        else:
+            doc = {'word': word, 'id': self.requests}
+        headers = dict(self.responseHeaders)
+        if self.etag is None:
+            return 200, doc, headers
+        headers['ETag'] = self.etag
+        ifNoneMatch = self.handling.headers.getheader('If-None-Match')
+        self.ifNoneMatch.append(ifNoneMatch)
+        if ifNoneMatch == self.etag:
+            # Servers may leave Cache-Control out of a 304
+            return 304, None, {'ETag': self.etag}
+        return 200, doc, headers
+
+    def testRepeatedGetIsServedFromCache(self):
+        for i in range(3):
+            res = self.wordApi.getDefinitions('cat', limit=1)
+            assert res[0].text == 'a cat', 'wrong definition'
+        assert self.requests == 1, 'only the first call should hit the network'
+        stats = self.cache.stats()
+        assert stats['hits'] == 2 and stats['misses'] == 1, 'wrong counters'
+
+    def testKeyIgnoresParamOrderAndNoneValues(self):
+        key1 = cache.cacheKey('/word.json/cat//', {'a': 1, 'b': 2, 'c': None})
+        key2 = cache.cacheKey('/word.json/cat', {'b': 2, 'a': 1})
+        assert key1 == key2, 'keys should be normalized'
+        key3 = cache.cacheKey('/word.json/cat', {'a': 1, 'b': 3})
+        assert key1 != key3, 'different params should not share a key'
+
+    def testAuthTokenIsPartOfKey(self):
+        key1 = cache.cacheKey('/wordList.json/x', {}, {'auth_token': 'a'})
+        key2 = cache.cacheKey('/wordList.json/x', {}, {'auth_token': 'b'})
+        assert key1 != key2, 'users must not share cached responses'
+        assert 'auth_token' not in key1 and '=a' not in key1, \
+            'tokens should not be stored in the clear'
+
+    def testEntriesExpire(self):
+        self.wordApi.getWord('cat')
+        self.now += 61
+        self.wordApi.getWord('cat')
+        assert self.requests == 2, 'expired entry should be refetched'
+        assert self.cache.stats()['expirations'] == 1, 'should count expiry'
+
+    def testStaleEntryIsRevalidated(self):
+        self.etag = '"v1"'
+        with self.client.options(raw=True):
+            first = self.wordApi.getWord('cat')
+            self.now += 61
+            second = self.wordApi.getWord('cat')
+            self.wordApi.getWord('cat')
+        assert self.ifNoneMatch == [None, '"v1"'], 'should send the ETag'
+        assert second is first, 'a 304 should reuse the decoded data'
+        stats = self.cache.stats()
+        assert stats['revalidations'] == 1 and stats['hits'] == 1, stats
+        assert stats['entries'] == 1, 'stale entry should have been kept'
+
+    def testChangedEntryIsReplaced(self):
+        self.etag = '"v1"'
+        self.wordApi.getWord('cat')
+        self.now += 61
+        self.etag = '"v2"'
+        assert self.wordApi.getWord('cat').id == 2, 'should get the new body'
+        self.now += 61
+        self.wordApi.getWord('cat')
+        assert self.ifNoneMatch == [None, '"v1"', '"v2"'], self.ifNoneMatch
+        assert self.cache.stats()['revalidations'] == 1
+
+    def testEntryEvictedDuringRevalidation(self):
+        self.etag = '"v1"'
+        self.wordApi.getWord('cat')
+        self.now += 61
+        key = cache.cacheKey('/word.json/cat')
+        refresh = self.cache.refresh
+
+        def evictFirst(*args):
+            self.cache.invalidate(key)
+            return refresh(*args)
+        self.cache.refresh = evictFirst
+        assert self.wordApi.getWord('cat').id == 3, 'should refetch the body'
+        assert self.ifNoneMatch == [None, '"v1"', None], self.ifNoneMatch
+
+    def testEntriesWithoutValidatorsAreDropped(self):
+        self.wordApi.getWord('cat')
+        self.now += 61 + self.cache.grace
+        assert self.cache.conditionalHeaders(
+            cache.cacheKey('/word.json/cat')) == {}
+        assert self.cache.get(cache.cacheKey('/word.json/cat')) is None
+        assert self.cache.stats()['entries'] == 0
+
+    def testPerEndpointTtl(self):
+        self.wordApi.getDefinitions('cat')
+        self.now += 61
+        self.wordApi.getDefinitions('cat')
+        assert self.requests == 1, 'definitions are cached for an hour'
+        self.wordApi.getScrabbleScore('cat')
+        self.wordApi.getScrabbleScore('cat')
+        assert self.requests == 3, 'a TTL of 0 disables caching'
+
+    def testMaxAgeReplacesDefaultTtl(self):
+        self.responseHeaders = {'Cache-Control': 'public, max-age=10'}
+        self.wordApi.getWord('cat')
+        self.now += 9
+        self.wordApi.getWord('cat')
+        assert self.requests == 1, 'should be fresh for 10 seconds'
+        self.now += 2
+        self.wordApi.getWord('cat')
+        assert self.requests == 2, 'should expire after 10 seconds'
+
+    def testEndpointTtlOverridesHeaders(self):
+        self.responseHeaders = {'Cache-Control': 'max-age=10'}
+        self.wordApi.getDefinitions('cat')
+        self.now += 61
+        self.wordApi.getDefinitions('cat')
+        assert self.requests == 1, 'definitions are cached for an hour'
+
+    def testNoStore(self):
+        self.responseHeaders = {'Cache-Control': 'no-store'}
+        self.wordApi.getDefinitions('cat')
+        self.wordApi.getDefinitions('cat')
+        assert self.requests == 2, 'no-store responses must not be cached'
+        assert self.cache.stats()['entries'] == 0
+
+    def testExpires(self):
+        # Measured against the Date header the server sends, not our clock
+        self.responseHeaders = {'Expires': email.utils.formatdate(
+            time.time() + 30, usegmt=True)}
+        self.wordApi.getWord('cat')
+        self.now += 25
+        self.wordApi.getWord('cat')
+        assert self.requests == 1, 'should be fresh for 30 seconds'
+        self.now += 10
+        self.wordApi.getWord('cat')
+        assert self.requests == 2, 'should expire after 30 seconds'
+
+    def testMaxAgeZeroIsStoredOnlyForRevalidation(self):
+        self.responseHeaders = {'Cache-Control': 'no-cache'}
+        self.wordApi.getWord('cat')
+        assert self.cache.stats()['entries'] == 0
+        self.etag = '"v1"'
+        for i in range(3):
+            self.wordApi.getWord('cat')
+        assert self.ifNoneMatch == [None, '"v1"', '"v1"'], \
+            'should always revalidate'
+        stats = self.cache.stats()
+        assert stats['revalidations'] == 2 and stats['entries'] == 1, stats
+
+    def testPrivateResponsesStayOutOfSharedCaches(self):
+        headers = {'Cache-Control': 'private, max-age=60'}
+        self.cache.set('a', 'x', '"x"', '/word.json/a', headers)
+        assert self.cache.get('a') is not None, 'a private cache may keep it'
+        self.cache.shared = True
+        self.cache.set('b', 'x', '"x"', '/word.json/b', headers)
+        assert self.cache.get('b') is None, 'a shared cache must not'
+
+    def testCachePolicy(self):
+        policy = cache.CachePolicy({'Cache-Control': 'max-age=60, '
+                                    'stale-while-revalidate="30"',
+                                    'Age': '15'}, self.now)
+        assert policy.maxAge == 45, 'Age should count against max-age'
+        assert policy.staleWhileRevalidate == 30
+        assert not policy.noStore and not policy.private
+        expires = 'Mon, 05 Oct 2026 10:00:30 GMT'
+        policy = cache.CachePolicy({'Cache-Control': 'Max-Age=5',
+                                    'Expires': expires}, self.now)
+        assert policy.maxAge == 5, 'max-age should win over Expires'
+        policy = cache.CachePolicy({'Date': 'Mon, 05 Oct 2026 10:00:00 GMT',
+                                    'Expires': expires}, self.now)
+        assert policy.maxAge == 30, 'Expires should be relative to Date'
+        assert cache.CachePolicy({'Expires': '0'}, self.now).maxAge == 0, \
+            'an invalid date means already expired'
+        assert cache.CachePolicy({}, self.now).maxAge is None
+        assert cache.CachePolicy(None, self.now).maxAge is None
+
+    def testEvictsLeastRecentlyUsed(self):
+        self.cache.maxEntries = 2
+        self.wordApi.getWord('a')
+        self.wordApi.getWord('b')
+        self.wordApi.getWord('a')
+        self.wordApi.getWord('c')  # evicts b
+        self.wordApi.getWord('a')
+        assert self.requests == 3, '"a" should still be cached'
+        self.wordApi.getWord('b')
+        assert self.requests == 4, '"b" should have been evicted'
+        assert self.cache.stats()['evictions'] == 2, 'should count evictions'
+
+    def testBoundedByBytes(self):
+        self.cache.maxBytes = 50
+        for word in ['a', 'b', 'c']:
+            self.wordApi.getWord(word)
+        stats = self.cache.stats()
+        assert stats['bytes'] <= 50, 'cache should stay under maxBytes'
+        assert stats['entries'] < 3, 'something should have been evicted'
+
+    def testCanBeBypassedPerCall(self):
+        self.wordApi.getWord('cat')
+        with self.client.options(useCache=False):
+            self.wordApi.getWord('cat')
+        assert self.requests == 2, 'cache should be bypassed'
+        self.wordApi.getWord('cat')
+        assert self.requests == 2, 'cache should be used again'
+
+    def testWritesInvalidateTheResource(self):
+        words = '/wordList.json/my_list/words'
+        mine, theirs = {'auth_token': 'mine'}, {'auth_token': 'theirs'}
+        get = lambda path, token: self.client.callAPI(path, 'GET', {}, None,
+                                                      token)['id']
+        before = [get(words, mine), get('/wordList.json/my_list', mine),
+                  get('/account.json/wordLists', mine),
+                  get('/wordList.json/my_list2', None),
+                  get(words, theirs), get('/word.json/cat', None)]
+        self.client.callAPI(words, 'POST', {}, [{'word': 'dog'}], mine)
+        after = [get(words, mine), get('/wordList.json/my_list', mine),
+                 get('/account.json/wordLists', mine),
+                 get('/wordList.json/my_list2', None),
+                 get(words, theirs), get('/word.json/cat', None)]
+        assert [a != b for (a, b) in zip(before, after)] == \
+            [True, True, True, False, True, False], (before, after)
+
+    def testUnknownOptionIsRejected(self):
+        def useOption():
+            with self.client.options(colour='red'):
+                pass
+        self.assertRaises(TypeError, useOption)
+
+
+if __name__ == "__main__":
+    unittest.main()
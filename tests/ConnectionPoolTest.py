@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import time
+import socket
+import unittest
+import urllib2
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik.transport import ConnectionPool
+
+
+class ConnectionPoolTest(LocalServerTest):
+
+    def setUp(self):
+        super(ConnectionPoolTest, self).setUp()
+        self.requests = []
+
+    def respond(self, method, path):
+        self.requests.append((method, path))
+        if path.endswith('/slow'):
+            time.sleep(0.3)
+        if path.startswith('/v4/moved'):
+            return 301, None, {'Location': path.replace('/moved', '/word.json')}
+        if path.startswith('/v4/loop'):
+            return 302, None, {'Location': path}
+        return LocalServerTest.respond(self, method, path)
+
+    def closeIdleConnection(self, pool):
+        """Break the pooled connection the way a server closing it would."""
+
+        [(conn, lastUsed)] = pool._idle.values()[0]
+        conn.sock.shutdown(socket.SHUT_RDWR)
+
+    def testConnectionIsReused(self):
+        pool = ConnectionPool()
+        for i in range(5):
+            res = pool.request('GET', self.apiUrl + '/word.json/cat')
+            assert res.status == 200, 'status should be 200'
+        stats = pool.stats()
+        assert stats['created'] == 1, 'should open a single connection'
+        assert stats['reused'] == 4, 'should reuse it four times'
+        assert stats['requests'] == 5, 'should count five requests'
+        pool.close()
+
+    def testIdleConnectionsAreEvicted(self):
+        pool = ConnectionPool(idleTimeout=0.01)
+        pool.request('GET', self.apiUrl + '/word.json/cat')
+        time.sleep(0.05)
+        pool.evictIdle()
+        stats = pool.stats()
+        assert stats['evicted'] == 1, 'idle connection should be evicted'
+        assert stats['idle'] == 0, 'no idle connections should remain'
+
+    def testResendsIdempotentRequestOnClosedConnection(self):
+        pool = ConnectionPool()
+        pool.request('GET', self.apiUrl + '/word.json/cat')
+        self.closeIdleConnection(pool)
+        res = pool.request('GET', self.apiUrl + '/word.json/dog')
+        assert res.status == 200, 'should succeed on a new connection'
+        stats = pool.stats()
+        assert stats['stale'] == 1 and stats['created'] == 2, stats
+        pool.close()
+
+    def testNeverResendsPost(self):
+        pool = ConnectionPool()
+        pool.request('GET', self.apiUrl + '/word.json/cat')
+        self.closeIdleConnection(pool)
+        self.assertRaises(socket.error, pool.request, 'POST',
+                          self.apiUrl + '/wordLists.json', '{}')
+        assert pool.stats()['stale'] == 0, 'POST should not be resent'
+
+    def testTimeoutIsNotResent(self):
+        pool = ConnectionPool(timeout=0.1)
+        pool.request('GET', self.apiUrl + '/word.json/cat')
+        for method in ['POST', 'GET']:
+            self.assertRaises(socket.timeout, pool.request, method,
+                              self.apiUrl + '/slow', '{}')
+        time.sleep(0.1)
+        assert [m for (m, path) in self.requests if path.endswith('/slow')] \
+            == ['POST', 'GET'], 'timed out requests should not be resent'
+        assert pool.stats()['stale'] == 0
+
+    def testApiClientUsesPool(self):
+        client = swagger.ApiClient('key', self.apiUrl)
+        wordApi = WordApi.WordApi(client)
+        for i in range(3):
+            res = wordApi.getWord('cat')
+            assert res.word == 'cat', 'word should be "cat"'
+        assert client.pool.stats()['reused'] == 2, 'pool should be reused'
+
+    def testHttpErrorsStillRaise(self):
+        client = swagger.ApiClient('key', self.apiUrl)
+        try:
+            client.callAPI('/missing', 'GET', {}, None)
+        except urllib2.HTTPError as e:
+            assert e.code == 404, 'status should be 404'
+        else:
+            self.fail('HTTPError not raised')
+
+    def testFollowsRedirects(self):
+        client = swagger.ApiClient('key', self.apiUrl)
+        assert client.callAPI('/moved/cat', 'GET', {}, None)['word'] == 'cat'
+        assert [path for (m, path) in self.requests] == \
+            ['/v4/moved/cat', '/v4/word.json/cat']
+
+    def testUnfollowedRedirectsRaise(self):
+        client = swagger.ApiClient('key', self.apiUrl)
+        for (path, method) in [('/loop', 'GET'), ('/moved/cat', 'POST')]:
+            try:
+                client.callAPI(path, method, {}, None)
+            except urllib2.HTTPError as e:
+                assert e.code in (301, 302), e.code
+            else:
+                self.fail('HTTPError not raised for %s %s' % (method, path))
+        assert len(self.requests) == client.maxRedirects + 2
+
+    def testProxy(self):
+        proxy = self.apiUrl.replace('/v4', '')
+        pool = ConnectionPool(proxies={'http': proxy})
+        res = pool.request('GET', 'http://api.example.com/v4/word.json/cat')
+        assert res.status == 200
+        assert self.requests == [
+            ('GET', 'http://api.example.com/v4/word.json/cat')], \
+            'should send the full URL to the proxy'
+        pool.close()
+
+    def testProxyIsBypassedForNoProxyHosts(self):
+        os.environ['no_proxy'] = '127.0.0.1'
+        try:
+            pool = ConnectionPool(proxies={'http': 'http://127.0.0.1:1'})
+            assert pool.request('GET', self.apiUrl + '/word.json/cat').status \
+                == 200
+        finally:
+            del os.environ['no_proxy']
+        pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import datetime
+import unittest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik.models import *
+
+
+class DeserializerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = swagger.ApiClient('key', 'http://localhost/v4')
+
+    def testListOfModels(self):
+        res = self.client.deserialize([
+            {'word': 'cat', 'text': 'a cat', 'score': 1,
+             'labels': [{'text': 'informal', 'type': 'register'}],
+             'citations': []}], 'list[Definition]')
+        assert isinstance(res[0], Definition.Definition), 'wrong class'
+        assert res[0].text == 'a cat', 'wrong text'
+        assert res[0].score == 1.0 and type(res[0].score) == float, 'score should be a float'
+        assert res[0].labels[0].type == 'register', 'labels not deserialized'
+        assert res[0].citations == [], 'empty list should stay a list'
+        assert res[0].notes is None, 'missing field should stay None'
+
+    def testNestedModelFieldsUseTheirOwnClass(self):
+        res = self.client.deserialize({'id': 1, 'provider': {'id': 711, 'name': 'gutenberg'},
+                                       'score': {'word': 'cat', 'position': 4}},
+                                      'Example')
+        assert isinstance(res.provider, ContentProvider.ContentProvider), 'wrong provider class'
+        assert res.provider.name == 'gutenberg', 'provider not deserialized'
+        assert isinstance(res.score, ScoredWord.ScoredWord), 'wrong score class'
+
+    def testNullValuesStayNone(self):
+        res = self.client.deserialize({'word': None, 'count': None}, 'WordSearchResult')
+        assert res.word is None, 'null str should stay None'
+        assert res.count is None, 'null long should stay None'
+
+    def testUnicodeStrings(self):
+        res = self.client.deserialize({'word': u'élan'}, 'WordObject')
+        assert res.word == u'élan', 'non-ASCII word should be kept as unicode'
+        res = self.client.deserialize({'word': u'cat'}, 'WordObject')
+        assert type(res.word) == str, 'ASCII word should be a str'
+
+    def testDatetimes(self):
+        res = self.client.deserialize({'createdAt': '2012-05-04T10:11:12.000+0000'},
+                                      'WordList')
+        assert res.createdAt == datetime.datetime(2012, 5, 4, 10, 11, 12), 'wrong datetime'
+
+    def testNativeTypes(self):
+        assert self.client.deserialize(['a', 'b'], 'list[str]') == ['a', 'b']
+        assert self.client.deserialize('7', 'int') == 7
+        assert self.client.deserialize('7', int) == 7
+
+    def testClassLiteral(self):
+        res = self.client.deserialize({'value': 27}, ScrabbleScoreResult.ScrabbleScoreResult)
+        assert res.value == 27, 'wrong value'
+
+    def testRawMode(self):
+        doc = [{'word': 'cat', 'labels': [{'text': 'informal'}]}]
+        client = swagger.ApiClient('key', 'http://localhost/v4', raw=True)
+        assert client.deserialize(doc, 'list[Definition]') is doc, 'raw should return the JSON as-is'
+
+    def testNamedtupleMode(self):
+        doc = [{'word': 'cat', 'labels': [{'text': 'informal', 'type': 'register'}],
+                'createdAt': '2012-05-04T10:11:12.000+0000'}]
+        with self.client.options(raw='namedtuple'):
+            res = self.client.deserialize(doc, 'list[Definition]')
+        assert res[0].word == 'cat', 'wrong word'
+        assert res[0].labels[0].type == 'register', 'nested lists should be namedtuples'
+        assert res[0].text is None, 'missing fields should be None'
+        assert isinstance(res[0], tuple), 'should be a namedtuple'
+
+    def testRawModeIsPerCall(self):
+        doc = {'value': 27}
+        with self.client.options(raw=True):
+            assert self.client.deserialize(doc, 'ScrabbleScoreResult') is doc
+        res = self.client.deserialize(doc, 'ScrabbleScoreResult')
+        assert isinstance(res, ScrabbleScoreResult.ScrabbleScoreResult), 'models outside the block'
+
+    def testLazyModeDefersNestedFields(self):
+        doc = [{'word': 'cat', 'text': 'a cat', 'score': 2,
+                'labels': [{'text': 'informal', 'type': 'register'}]}]
+        with self.client.options(lazy=True):
+            res = self.client.deserialize(doc, 'list[Definition]')
+        definition = res[0]
+        assert isinstance(definition, Definition.Definition), 'should still be a Definition'
+        assert definition.text == 'a cat' and definition.score == 2.0, 'plain fields are converted'
+        slot = Definition.Definition.__dict__['labels']
+        self.assertRaises(AttributeError, slot.__get__, definition, Definition.Definition)
+        labels = definition.labels
+        assert isinstance(labels[0], Label.Label) and labels[0].type == 'register', 'wrong labels'
+        assert definition.labels is labels, 'should only be converted once'
+        assert definition.citations is None, 'missing nested field should be None'
+
+    def testLazyNestedModels(self):
+        client = swagger.ApiClient('key', 'http://localhost/v4', lazy=True)
+        res = client.deserialize({'examples': [{'id': 1, 'provider': {'id': 711, 'name': 'gutenberg'}}]},
+                                 'ExampleSearchResults')
+        assert res.examples[0].provider.name == 'gutenberg', 'provider not deserialized'
+        assert client.sanitizeForSerialization(res.examples[0].provider) == {
+            'id': 711, 'name': 'gutenberg'}, 'lazy models should serialize'
+        res.examples[0].sentence = 'replaced'
+        assert res.examples[0].sentence == 'replaced', 'lazy fields should be settable'
+
+    def testConvertersAreCached(self):
+        first = deserializer.converterFor('list[Definition]')
+        assert deserializer.converterFor('list[Definition]') is first, 'converter should be cached'
+
+
+if __name__ == "__main__":
+    unittest.main()
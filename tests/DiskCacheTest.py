@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class DiskCacheTest(LocalServerTest):
+
+    def setUp(self):
+        super(DiskCacheTest, self).setUp()
+        self.requests = 0
+        self.lastModified = None  # sent with responses when set
+        self.cacheControl = None  # sent with full responses when set
+        self.tempDir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempDir, 'responses.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+        super(DiskCacheTest, self).tearDown()
+
+    def respond(self, method, path):
+        self.requests += 1
+        word = path.split('/')[3].split('?')[0]
+        doc = ['%s comes from Old English' % word]
+        if self.lastModified is None:
+            return 200, doc
+        headers = {'Last-Modified': self.lastModified}
+        if self.handling.headers.getheader('If-Modified-Since') == \
+                self.lastModified:
+            return 304, None, headers
+        if self.cacheControl is not None:
+            headers['Cache-Control'] = self.cacheControl
+        return 200, doc, headers
+
+    def wordApi(self, diskCache):
+        return WordApi.WordApi(swagger.ApiClient('key', self.apiUrl,
+                                                 cache=diskCache))
+
+    def testCachePersistsAcrossRuns(self):
+        res = self.wordApi(diskcache.DiskCache(self.path)).getEtymologies('cat')
+        assert res == ['cat comes from Old English'], 'wrong etymology'
+        # A new client and cache on the same file, as in a second run
+        res = self.wordApi(diskcache.DiskCache(self.path)).getEtymologies('cat')
+        assert res == ['cat comes from Old English'], 'wrong cached etymology'
+        assert self.requests == 1, 'second run should not hit the network'
+
+    def testUsesWriteAheadLog(self):
+        diskCache = diskcache.DiskCache(self.path)
+        mode = diskCache._db().execute('PRAGMA journal_mode').fetchone()[0]
+        assert mode == 'wal', 'journal mode should be WAL'
+
+    def testEntriesExpire(self):
+        now = [1000.0]
+        diskCache = diskcache.DiskCache(self.path, ttl=60)
+        diskCache.clock = lambda: now[0]
+        wordApi = self.wordApi(diskCache)
+        wordApi.getEtymologies('cat')
+        now[0] += 61
+        wordApi.getEtymologies('cat')
+        assert self.requests == 2, 'expired entry should be refetched'
+        assert diskCache.stats()['expirations'] == 1, 'should count expiry'
+
+    def testStaleEntryIsRevalidated(self):
+        now = [1000.0]
+        self.lastModified = 'Tue, 01 Sep 2026 10:00:00 GMT'
+        diskCache = diskcache.DiskCache(self.path, ttl=60)
+        diskCache.clock = lambda: now[0]
+        wordApi = self.wordApi(diskCache)
+        wordApi.getEtymologies('cat')
+        now[0] += 61
+        res = wordApi.getEtymologies('cat')
+        assert res == ['cat comes from Old English'], 'wrong etymology'
+        assert self.requests == 2, 'stale entry should be revalidated'
+        wordApi.getEtymologies('cat')
+        assert self.requests == 2, 'revalidated entry should be fresh again'
+        stats = diskCache.stats()
+        assert stats['revalidations'] == 1 and stats['hits'] == 1, stats
+
+    def testNoCacheEntryIsAlwaysRevalidated(self):
+        self.lastModified = 'Tue, 01 Sep 2026 10:00:00 GMT'
+        self.cacheControl = 'no-cache'
+        diskCache = diskcache.DiskCache(self.path)
+        wordApi = self.wordApi(diskCache)
+        for i in range(3):
+            res = wordApi.getEtymologies('cat')
+            assert res == ['cat comes from Old English'], 'wrong etymology'
+        stats = diskCache.stats()
+        assert stats['revalidations'] == 2 and stats['entries'] == 1, \
+            'a 304 without Cache-Control should keep the entry'
+
+    def testAddsValidatorColumnsToOldFiles(self):
+        db = sqlite3.connect(self.path)
+        db.execute('CREATE TABLE responses (key TEXT PRIMARY KEY, '
+                   'body BLOB NOT NULL, size INTEGER NOT NULL, '
+                   'storedAt REAL NOT NULL, expiresAt REAL NOT NULL, '
+                   'accessedAt REAL NOT NULL)')
+        db.execute("INSERT INTO responses VALUES ('a', '\"old\"', 5, 0, "
+                   "1e12, 0)")
+        db.commit()
+        db.close()
+        diskCache = diskcache.DiskCache(self.path)
+        assert diskCache.get('a').data == 'old', 'old entries should be kept'
+        diskCache.set('b', None, '"new"', '/word.json/b', {'ETag': '"b1"'})
+        assert diskCache.conditionalHeaders('b') == {'If-None-Match': '"b1"'}
+
+    def testKeepsCacheControlLifetime(self):
+        now = [1000.0]
+        diskCache = diskcache.DiskCache(self.path, ttl=60)
+        diskCache.clock = lambda: now[0]
+        diskCache.set('a', None, '"a"', '/word.json/a',
+                      {'Cache-Control': 'max-age=600, '
+                                        'stale-while-revalidate=60'})
+        diskCache.set('b', None, '"b"', '/word.json/b',
+                      {'Cache-Control': 'private, max-age=600'})
+        now[0] += 300
+        entry = diskCache.get('a')
+        assert entry.expiresAt == 1600 and entry.staleWhileRevalidate == 60
+        assert diskCache.get('b') is None, 'private responses stay off disk'
+
+    def testEvictsLeastRecentlyUsedPastSizeCap(self):
+        now = [1000.0]
+        diskCache = diskcache.DiskCache(self.path, maxBytes=100)
+        diskCache.clock = lambda: now[0]
+        for key in ['a', 'b', 'c']:
+            now[0] += 1
+            diskCache.set(key, None, '"' + 'x' * 38 + '"', '/word.json/x')
+        now[0] += 1
+        assert diskCache.get('a') is None, '"a" should have been evicted'
+        assert diskCache.get('c') is not None, '"c" should still be cached'
+        stats = diskCache.stats()
+        assert stats['bytes'] <= 100, 'cache should stay under maxBytes'
+        assert stats['evictions'] == 1, 'should count the eviction'
+
+    def testHitsOnlyWriteOncePerTouchInterval(self):
+        now = [1000.0]
+        diskCache = diskcache.DiskCache(self.path, touchInterval=60)
+        diskCache.clock = lambda: now[0]
+        diskCache.set('a', None, '"a"', '/word.json/a')
+        db = diskCache._db()
+        changes = db.total_changes
+        for i in range(10):
+            now[0] += 1
+            assert diskCache.get('a') is not None
+        assert db.total_changes == changes, 'recent hits should not write'
+        now[0] += 60
+        diskCache.get('a')
+        assert db.total_changes == changes + 1, 'should record the access'
+        assert db.execute('SELECT accessedAt FROM responses').fetchone()[0] \
+            == now[0]
+
+    def testVacuumDropsExpiredEntries(self):
+        now = [1000.0]
+        diskCache = diskcache.DiskCache(self.path, ttl=60)
+        diskCache.clock = lambda: now[0]
+        diskCache.set('a', None, '"old"', '/word.json/a')
+        now[0] += 61
+        diskCache.set('b', None, '"new"', '/word.json/b')
+        diskCache.vacuum()
+        stats = diskCache.stats()
+        assert stats['entries'] == 1, 'only the fresh entry should remain'
+        assert stats['bytes'] == 5, 'size should be recomputed'
+
+    def testInvalidateUnder(self):
+        diskCache = diskcache.DiskCache(self.path)
+        keys = ['/wordList.json/a_b', '/wordList.json/a_b?limit=5',
+                '/wordList.json/a_b/words#auth_token=x',
+                '/wordList.json/a_bc', '/wordList.json/aXb',
+                '/account.json/wordLists#auth_token=t',
+                '/account.json/wordLists#auth_token=tt']
+        for key in keys:
+            diskCache.set(key, None, '[]', '/wordList.json/a')
+        diskCache.invalidateUnder('/wordList.json/a_b', 'auth_token=t')
+        left = [row[0] for row in diskCache._db().execute(
+            'SELECT key FROM responses ORDER BY key')]
+        assert left == ['/account.json/wordLists#auth_token=tt',
+                        '/wordList.json/aXb', '/wordList.json/a_bc'], left
+        assert diskCache.stats()['bytes'] == 6
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import sys
+import inspect
+import unittest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik.models import *
+
+
+class RecordingClient(swagger.ApiClient):
+    """Records the requests the Api methods make instead of sending them."""
+
+    def __init__(self, response=None):
+        swagger.ApiClient.__init__(self, 'key', 'http://localhost/v4')
+        self.response = response
+        self.calls = []
+
+    def callAPI(self, resourcePath, method, queryParams, postData,
+                headerParams=None):
+        self.calls.append((resourcePath, method, queryParams, postData,
+                           headerParams))
+        return self.response
+
+
+class EndpointsTest(unittest.TestCase):
+
+    def apiClasses(self):
+        return [AccountApi.AccountApi, WordApi.WordApi,
+                WordListApi.WordListApi, WordListsApi.WordListsApi,
+                WordsApi.WordsApi]
+
+    def testEveryEndpointHasAMethod(self):
+        methods = {}
+        for apiClass in self.apiClasses():
+            for name in endpoints.byName:
+                if hasattr(apiClass, name):
+                    methods[name] = getattr(apiClass, name)
+        assert sorted(methods) == sorted(endpoints.byName)
+        assert len(endpoints.byName) == len(endpoints.table), \
+            'method names should be unique'
+        for (name, method) in methods.items():
+            args = inspect.getargspec(method)
+            assert tuple(args.args[1:]) == tuple(
+                param for (param, kind) in endpoints.byName[name].positional), \
+                name
+
+    def testPrecompiledPath(self):
+        endpoint = endpoints.byName['getDefinitions']
+        assert endpoint.template == '/word.json/{word}/definitions'
+        assert endpoint.path == '/word.json/%s/definitions'
+        assert endpoint.pathParams == ('word',)
+        endpoint = endpoints.Endpoint('test', 'GET', '/a%b.{format}')
+        assert endpoint.path == '/a%b.json', 'no formatting without params'
+        endpoint = endpoints.Endpoint('test', 'GET', '/a%b/{c}/{d}', ['c', 'd'])
+        assert endpoint.path % ('x', 'y') == '/a%b/x/y'
+
+    def testQueryAndPathParams(self):
+        client = RecordingClient([{'word': 'cat', 'text': 'a cat'}])
+        definitions = WordApi.WordApi(client).getDefinitions(
+            u'caf\xe9 au lait', limit=5,
+            sourceDictionaries=['wiktionary', 'webster'], useCanonical=True)
+        assert client.calls == [(
+            '/word.json/caf%C3%A9%20au%20lait/definitions', 'GET',
+            {'limit': '5', 'sourceDictionaries': 'wiktionary%2Cwebster',
+             'useCanonical': 'True'}, None, {})]
+        assert definitions[0].text == 'a cat'
+
+    def testPositionalQueryParams(self):
+        client = RecordingClient()
+        WordsApi.WordsApi(client).reverseDictionary('a cat', skip=10)
+        AccountApi.AccountApi(client).authenticate('me', 'secret')
+        assert client.calls == [
+            ('/words.json/reverseDictionary', 'GET',
+             {'query': 'a%20cat', 'skip': '10'}, None, {}),
+            ('/account.json/authenticate/me', 'GET',
+             {'password': 'secret'}, None, {})]
+
+    def testHeadersAndBody(self):
+        client = RecordingClient()
+        wordList = WordList.WordList()
+        wordList.name = 'mine'
+        result = WordListApi.WordListApi(client).updateWordList(
+            'my-list', 'token', body=wordList)
+        AccountApi.AccountApi(client).authenticatePost('me', 'secret')
+        assert result is None, 'methods without a return type return None'
+        assert client.calls == [
+            ('/wordList.json/my-list', 'PUT', {}, wordList,
+             {'auth_token': 'token'}),
+            ('/account.json/authenticate/me', 'POST', {}, 'secret', {})]
+
+    def testEmptyResponse(self):
+        client = RecordingClient([])
+        assert WordApi.WordApi(client).getDefinitions('cat') is None
+
+    def testUnexpectedKeywordArgument(self):
+        wordApi = WordApi.WordApi(RecordingClient())
+        try:
+            wordApi.getDefinitions('cat', limt=5)
+        except TypeError as e:
+            assert str(e) == "Got an unexpected keyword argument 'limt' " \
+                "to method getDefinitions"
+        else:
+            self.fail('a misspelled argument should be rejected')
+        self.assertRaises(TypeError, wordApi.getWord, 'cat', body='x')
+
+    def testMetricsCoverEveryEndpoint(self):
+        for endpoint in endpoints.table:
+            assert endpoint.template in metrics.templates
+
+
+if __name__ == '__main__':
+    unittest.main()
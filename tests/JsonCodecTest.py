@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import sys
+import json
+import unittest
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik.models import *
+
+
+class CountingBackend(jsoncodec.Backend):
+
+    def __init__(self):
+        jsoncodec.Backend.__init__(self, 'counting', self.countLoads,
+                                   self.countDumps)
+        self.calls = []
+
+    def countLoads(self, string):
+        self.calls.append('loads')
+        return json.loads(string)
+
+    def countDumps(self, obj):
+        self.calls.append('dumps')
+        return json.dumps(obj)
+
+
+class JsonCodecTest(LocalServerTest):
+
+    def respond(self, method, path):
+        if method == 'POST':
+            return 200, {'id': 1, 'name': 'posted', 'permalink': 'posted'}
+        return 200, {'word': u'\xe9lan', 'id': 1}
+
+    def testStandardLibraryIsAlwaysAvailable(self):
+        assert jsoncodec.available()[-1] == 'json'
+        backend = jsoncodec.backend('json')
+        assert backend.loads('{"a": [1, 2.5]}') == {'a': [1, 2.5]}
+        assert json.loads(backend.dumps({'a': [1, 2.5]})) == {'a': [1, 2.5]}
+        assert backend is jsoncodec.backend('json'), 'backends are reused'
+
+    def testPreferredBackendIsTheDefault(self):
+        assert jsoncodec.backend().name == jsoncodec.available()[0]
+        client = swagger.ApiClient('key', self.apiUrl)
+        assert client.json.name == jsoncodec.available()[0]
+
+    def testUnknownBackend(self):
+        self.assertRaises(ValueError, jsoncodec.backend, 'yaml')
+        self.assertRaises(ValueError, swagger.ApiClient, 'key', self.apiUrl,
+                          jsonBackend='yaml')
+
+    def testEveryBackendDecodesTheSame(self):
+        body = json.dumps({'word': u'\xe9lan', 'count': 3, 'score': 0.1,
+                           'tags': [None, True, False], 'text': 'a/b "c"'})
+        for name in jsoncodec.available():
+            backend = jsoncodec.backend(name)
+            assert backend.loads(body) == json.loads(body), name
+            assert json.loads(backend.dumps(json.loads(body))) == \
+                json.loads(body), name
+            self.assertRaises(ValueError, backend.loads, '{"word": ')
+
+    def testClientUsesItsBackend(self):
+        backend = CountingBackend()
+        client = swagger.ApiClient('key', self.apiUrl, jsonBackend=backend)
+        word = WordApi.WordApi(client).getWord('elan')
+        assert word.word == u'\xe9lan'
+        wordList = WordList.WordList()
+        wordList.name = 'posted'
+        WordListsApi.WordListsApi(client).createWordList(
+            body=wordList, auth_token='token')
+        assert backend.calls == ['loads', 'dumps', 'loads']
+
+
+if __name__ == '__main__':
+    unittest.main()
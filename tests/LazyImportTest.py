@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+sys.path = ['./'] + sys.path
+import wordnik
+from wordnik import *
+from wordnik import models
+
+
+def moduleNames(path):
+    return sorted(name[:-3] for name in os.listdir(path)
+                  if name.endswith('.py') and name != '__init__.py')
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def importedAfter(self, code):
+        """Return the wordnik modules a fresh interpreter has imported after
+        running `code`."""
+
+        output = subprocess.check_output([sys.executable, '-c', (
+            'import sys, json\n'
+            'sys.path = ["./"] + sys.path\n'
+            '%s\n'
+            'print(json.dumps(sorted(name for (name, module) in '
+            'sys.modules.items() if module is not None and '
+            'name.startswith("wordnik."))))') % code])
+        return json.loads(output)
+
+    def testAllListsEveryModule(self):
+        assert sorted(wordnik.__all__) == moduleNames('wordnik'), \
+            'add new modules to wordnik/__init__.py'
+        assert sorted(models.__all__) == moduleNames('wordnik/models'), \
+            'add new models to wordnik/models/__init__.py'
+
+    def testImportStarImportsNothing(self):
+        assert self.importedAfter('from wordnik import *') == ['wordnik.lazy']
+        assert self.importedAfter('from wordnik.models import *') == \
+            ['wordnik.lazy', 'wordnik.models']
+
+    def testModulesAreImportedOnFirstUse(self):
+        imported = self.importedAfter(
+            'from wordnik import *\n'
+            'WordApi.WordApi(swagger.ApiClient("key", "http://localhost"))')
+        assert 'wordnik.WordApi' in imported
+        assert 'wordnik.swagger' in imported
+        for name in ['wordnik.stubserver', 'wordnik.diskcache',
+                     'wordnik.asyncapi', 'wordnik.models.Definition']:
+            assert name not in imported, name
+
+    def testLazyModulesForwardToTheModule(self):
+        module = lazy.LazyModule('wordnik.retry')
+        assert module.RetryPolicy is sys.modules['wordnik.retry'].RetryPolicy
+        assert 'RetryPolicy' in dir(module)
+        module.testAttribute = 1
+        try:
+            assert sys.modules['wordnik.retry'].testAttribute == 1
+        finally:
+            del sys.modules['wordnik.retry'].testAttribute
+        assert repr(module) == "<lazy module 'wordnik.retry'>"
+
+    def testModelsStillResolve(self):
+        # Api modules get the models through `from models import *`
+        assert isinstance(deserializer.deserialize({'word': 'cat'},
+                                                   'WordObject'),
+                          WordApi.WordObject.WordObject)
+        assert models.Definition.Definition.__module__ == \
+            'wordnik.models.Definition'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Base class for tests that talk to a throwaway HTTP/1.1 server on
+localhost instead of api.wordnik.com. The server is the stub server's,
+answering through the test instead of the stub; subclasses override
+`respond` to decide what each request returns."""
+
+import sys
+import threading
+import unittest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik.stubserver import StubHandler, StubHTTPServer
+
+
+class LocalHandler(StubHandler):
+
+    # Tests send their own validators
+    etags = False
+
+
+class LocalServerTest(unittest.TestCase):
+
+    verbose = False  # read by the handler, as on a StubServer
+
+    def setUp(self):
+        # The headers of the request being handled on the current thread
+        self.handling = threading.local()
+        self.server = StubHTTPServer(('127.0.0.1', 0), LocalHandler)
+        self.server.stub = self
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  args=(0.01,))
+        thread.daemon = True
+        thread.start()
+        self.apiUrl = 'http://127.0.0.1:%d/v4' % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.closeConnections()
+        self.server.server_close()
+
+    def handle(self, method, path, headers, body):
+        """Answer a request for the server's handler, with `respond`."""
+
+        self.handling.headers = headers
+        response = self.respond(method, path)
+        return (response[0], response[1],
+                response[2] if len(response) > 2 else {})
+
+    def respond(self, method, path):
+        """Return (status, JSON document) for a request, optionally followed
+        by a dict of extra response headers. A document of None sends an
+        empty body."""
+
+        if path.startswith('/v4/missing'):
+            return 404, {'message': 'not found'}
+        return 200, {'word': 'cat', 'id': 1}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+import sys
+import json
+import socket
+import unittest
+import urllib2
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class RecordingSink:
+
+    def __init__(self):
+        self.counts = {}
+        self.observed = []
+
+    def increment(self, endpoint, name, value):
+        key = (endpoint, name)
+        self.counts[key] = self.counts.get(key, 0) + value
+
+    def observe(self, endpoint, stage, seconds):
+        self.observed.append((endpoint, stage))
+
+
+class MetricsTest(LocalServerTest):
+
+    def setUp(self):
+        super(MetricsTest, self).setUp()
+        self.sink = RecordingSink()
+        self.metrics = metrics.Metrics(sinks=[self.sink])
+        self.client = swagger.ApiClient('key', self.apiUrl,
+                                        metrics=self.metrics)
+        self.wordApi = WordApi.WordApi(self.client)
+
+    def respond(self, method, path):
+        if path.startswith('/v4/account.json/apiTokenStatus'):
+            return 200, {'valid': True, 'remainingCalls': 100,
+                         'resetsInMillis': 10000}
+        if '/missing/' in path:
+            return 404, {'message': 'not found'}
+        return 200, [{'word': 'cat', 'text': 'a cat'}]
+
+    def testEndpointsAreKeyedByTemplate(self):
+        assert self.metrics.endpointFor('/word.json/cat/definitions') == \
+            '/word.json/{word}/definitions'
+        assert self.metrics.endpointFor('/word.json/cat') == '/word.json/{word}'
+        assert self.metrics.endpointFor('/words.json/search/tr%20ee') == \
+            '/words.json/search/{query}'
+        assert self.metrics.endpointFor('/words.json/randomWord') == \
+            '/words.json/randomWord'
+        assert self.metrics.endpointFor('/nothing/like/it') == 'other'
+
+    def testCallsAreRecorded(self):
+        for word in ['cat', 'dog', 'emu']:
+            self.wordApi.getDefinitions(word, limit=1)
+
+        snapshot = self.client.metrics.snapshot()
+        assert snapshot.keys() == ['/word.json/{word}/definitions'], \
+            'every word should share one endpoint'
+        endpoint = snapshot['/word.json/{word}/definitions']
+        assert endpoint['requests'] == 3
+        assert endpoint['errors'] == {}
+        assert endpoint['bytes'] == 3 * len(json.dumps(
+            [{'word': 'cat', 'text': 'a cat'}]))
+        for stage in ['firstByte', 'bodyRead', 'decode', 'deserialize']:
+            assert endpoint[stage]['count'] == 3, stage
+            assert endpoint[stage]['sum'] >= 0
+            assert sum(count for (bound, count)
+                       in endpoint[stage]['buckets']) == 3
+        assert endpoint['connect']['count'] == 1, \
+            'only the first call should open a connection'
+
+    def testNestedCallsKeepTheirOwnEndpoint(self):
+        # The rate limiter fetches the token status from within the call
+        self.client.rateLimiter = ratelimit.QuotaRateLimiter()
+        self.wordApi.getDefinitions('cat')
+        snapshot = self.metrics.snapshot()
+        for endpoint in ['/word.json/{word}/definitions',
+                         '/account.json/apiTokenStatus']:
+            assert snapshot[endpoint]['deserialize']['count'] == 1, endpoint
+
+    def testErrorsAreCountedByStatus(self):
+        for i in range(2):
+            try:
+                self.wordApi.getDefinitions('missing')
+            except urllib2.HTTPError:
+                pass
+        self.wordApi.getDefinitions('cat')
+
+        endpoint = self.metrics.snapshot()['/word.json/{word}/definitions']
+        assert endpoint['requests'] == 3
+        assert endpoint['errors'] == {404: 2}
+        assert endpoint['deserialize']['count'] == 1
+
+    def testNetworkErrorsAreCounted(self):
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        port = listener.getsockname()[1]
+        listener.close()
+        client = swagger.ApiClient('key', 'http://127.0.0.1:%d/v4' % port,
+                                   metrics=self.metrics)
+        try:
+            WordApi.WordApi(client).getWord('cat')
+        except urllib2.URLError:
+            pass
+        else:
+            self.fail('the call should fail')
+        endpoint = self.metrics.snapshot()['/word.json/{word}']
+        assert endpoint['errors'] == {'network': 1}
+
+    def testCacheHitsAreCounted(self):
+        client = swagger.ApiClient('key', self.apiUrl, metrics=self.metrics,
+                                   cache=cache.ResponseCache())
+        wordApi = WordApi.WordApi(client)
+        wordApi.getDefinitions('cat')
+        wordApi.getDefinitions('cat')
+
+        endpoint = self.metrics.snapshot()['/word.json/{word}/definitions']
+        assert endpoint['requests'] == 1
+        assert endpoint['cacheHits'] == 1
+        assert endpoint['deserialize']['count'] == 2
+
+    def testSinksReceiveEverything(self):
+        self.wordApi.getDefinitions('cat')
+        endpoint = '/word.json/{word}/definitions'
+        assert self.sink.counts[(endpoint, 'requests')] == 1
+        assert self.sink.counts[(endpoint, 'bytes')] > 0
+        for stage in ['firstByte', 'bodyRead', 'decode', 'deserialize']:
+            assert (endpoint, stage) in self.sink.observed, stage
+
+    def testHistogram(self):
+        histogram = metrics.Histogram(bounds=(0.01, 0.1, 1.0))
+        assert histogram.percentile(0.5) is None
+        for seconds in [0.005] * 8 + [0.05, 5.0]:
+            histogram.observe(seconds)
+        snapshot = histogram.snapshot()
+        assert snapshot['buckets'] == [[0.01, 8], [0.1, 1], [1.0, 0],
+                                       [None, 1]]
+        assert snapshot['count'] == 10
+        assert snapshot['min'] == 0.005 and snapshot['max'] == 5.0
+        assert snapshot['p50'] == 0.01
+        assert snapshot['p90'] == 0.1
+        assert snapshot['p99'] == 5.0, 'the unbounded bucket reports the max'
+
+    def testStatsdSink(self):
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(('127.0.0.1', 0))
+        receiver.settimeout(5)
+        sink = metrics.StatsdSink('127.0.0.1', receiver.getsockname()[1])
+        try:
+            sink.increment('/word.json/{word}/definitions', 'requests', 1)
+            sink.observe('/word.json/{word}', 'firstByte', 0.0125)
+            assert receiver.recv(512) == \
+                'wordnik.word_json_word_definitions.requests:1|c'
+            assert receiver.recv(512) == 'wordnik.word_json_word.firstByte:12.500|ms'
+        finally:
+            receiver.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
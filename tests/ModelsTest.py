@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import sys
+import pickle
+import unittest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+from wordnik import models
+from wordnik.models import *
+
+
+class ModelsTest(unittest.TestCase):
+
+    def modelClasses(self):
+        return [getattr(getattr(models, name), name)
+                for name in models.__all__]
+
+    def testModelsAreSlotted(self):
+        for cls in self.modelClasses():
+            instance = cls()
+            assert not hasattr(instance, '__dict__'), cls.__name__ + ' has a __dict__'
+            assert sorted(cls.__slots__) == sorted(cls.swaggerTypes), \
+                cls.__name__ + ' slots should match swaggerTypes'
+            for attr in cls.swaggerTypes:
+                assert getattr(instance, attr) is None, attr + ' should default to None'
+
+    def testPickleRoundTrip(self):
+        doc = {'word': 'cat', 'text': 'a small feline', 'score': 1.5,
+               'citations': [{'source': 'Old English', 'cite': 'catt'}]}
+        for mode in ['model', 'lazy']:
+            definition = deserializer.deserialize(doc, 'Definition', mode)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                copy = pickle.loads(pickle.dumps(definition, protocol))
+                assert type(copy) is Definition.Definition, mode
+                assert copy.text == 'a small feline' and copy.score == 1.5
+                assert copy.citations[0].cite == 'catt'
+                assert copy.labels is None
+        for cls in self.modelClasses():
+            assert type(pickle.loads(pickle.dumps(cls()))) is cls
+
+    def testSanitizeForSerialization(self):
+        client = swagger.ApiClient('key', 'http://localhost/v4')
+        wordList = WordList.WordList()
+        wordList.name = 'my test list'
+        wordList.type = 'PUBLIC'
+        words = [StringValue.StringValue(), StringValue.StringValue()]
+        words[0].word = 'cat'
+        words[1].word = 'dog'
+        assert client.sanitizeForSerialization(wordList) == {
+            'name': 'my test list', 'type': 'PUBLIC', 'id': None,
+            'permalink': None, 'createdAt': None, 'updatedAt': None,
+            'lastActivityAt': None, 'username': None, 'userId': None,
+            'description': None, 'numberWordsInList': None}
+        assert client.sanitizeForSerialization(words) == [
+            {'word': 'cat'}, {'word': 'dog'}]
+
+
+if __name__ == "__main__":
+    unittest.main()
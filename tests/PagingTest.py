@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+import traceback
+import urlparse
+import threading
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class PagingTest(LocalServerTest):
+
+    def setUp(self):
+        super(PagingTest, self).setUp()
+        self.lock = threading.Lock()
+        self.requests = []
+        self.inFlight = 0
+        self.maxInFlight = 0
+        self.total = 23
+        self.client = swagger.ApiClient('key', self.apiUrl)
+        self.wordsApi = WordsApi.WordsApi(self.client)
+        self.wordListApi = WordListApi.WordListApi(self.client)
+
+    def respond(self, method, path):
+        url = urlparse.urlparse(path)
+        query = dict(urlparse.parse_qsl(url.query))
+        skip, limit = int(query['skip']), int(query['limit'])
+        with self.lock:
+            self.requests.append((skip, limit))
+            self.inFlight += 1
+            self.maxInFlight = max(self.maxInFlight, self.inFlight)
+        time.sleep(0.05)
+        with self.lock:
+            self.inFlight -= 1
+        words = ['word%d' % i
+                 for i in range(skip, min(skip + limit, self.total))]
+        if '/wordList.json/' in url.path:
+            return 200, [{'word': word, 'id': 1} for word in words]
+        return 200, {'totalResults': self.total,
+                     'searchResults': [{'word': word, 'count': 1}
+                                       for word in words]}
+
+    def testStopsAtTotalResults(self):
+        words = [res.word for res in
+                 self.wordsApi.iterSearchWords('word', pageSize=5)]
+        assert words == ['word%d' % i for i in range(23)], 'wrong results'
+        assert self.requests == [(0, 5), (5, 5), (10, 5), (15, 5), (20, 3)], \
+            'should stop requesting at totalResults'
+
+    def testStopsOnShortPage(self):
+        self.total = 12
+        words = [res.word for res in self.wordListApi.iterWordListWords(
+            'permalink', 'token', pageSize=5)]
+        assert len(words) == 12, 'should yield every word'
+        assert len(self.requests) == 3, 'a short page should be the last'
+
+    def testSkipAndMaxResults(self):
+        words = [res.word for res in self.wordsApi.iterSearchWords(
+            'word', pageSize=5, skip=3, maxResults=7)]
+        assert words == ['word%d' % i for i in range(3, 10)], 'wrong results'
+        assert self.requests == [(3, 5), (8, 2)], 'should not over-fetch'
+
+    def testPrefetchesNextPage(self):
+        results = self.wordsApi.iterSearchWords('word', pageSize=5)
+        results.next()
+        time.sleep(0.2)
+        assert len(self.requests) == 2, 'the second page should be requested'
+
+    def testCallOptionsApplyToPrefetch(self):
+        with self.client.options(raw=True):
+            words = [res['word'] for res in
+                     self.wordsApi.iterSearchWords('word', pageSize=10)]
+        assert len(words) == 23, 'every page should be raw'
+
+    def testShardedFetchIsInOrder(self):
+        self.total = 203
+        start = time.time()
+        words = [res.word for res in self.wordsApi.iterSearchWords(
+            'word', pageSize=10, maxWorkers=5)]
+        elapsed = time.time() - start
+        assert words == ['word%d' % i for i in range(203)], 'wrong results'
+        assert len(self.requests) == 21, 'each page should be fetched once'
+        assert self.maxInFlight <= 5, 'no more than 5 pages should be in flight'
+        assert elapsed < 21 * 0.05 / 2, 'pages should be fetched concurrently'
+
+    def testShardedFetchHonoursSkipAndMaxResults(self):
+        words = [res.word for res in self.wordsApi.iterSearchWords(
+            'word', pageSize=4, skip=2, maxResults=9, maxWorkers=3)]
+        assert words == ['word%d' % i for i in range(2, 11)], 'wrong results'
+        assert sorted(self.requests) == [(2, 4), (6, 4), (10, 1)], \
+            'should not over-fetch'
+
+    def testPrefetchErrorKeepsTraceback(self):
+        def failingPage():
+            raise ValueError('bad page')
+        prefetch = paging.Prefetch(failingPage)
+        try:
+            prefetch.result()
+        except ValueError:
+            frames = [frame[2] for frame
+                      in traceback.extract_tb(sys.exc_info()[2])]
+            assert frames[-1] == 'failingPage', frames
+        else:
+            self.fail('ValueError not raised')
+
+    def testLimitIsRejected(self):
+        self.assertRaises(TypeError, self.wordsApi.iterSearchWords, 'word',
+                          limit=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
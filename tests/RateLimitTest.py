@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import sys
+import unittest
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RateLimitTest(LocalServerTest):
+
+    def setUp(self):
+        super(RateLimitTest, self).setUp()
+        self.statusCalls = 0
+        self.remainingCalls = 10
+        self.clock = FakeClock()
+        self.limiter = ratelimit.QuotaRateLimiter(refreshInterval=60, burst=2)
+        self.limiter.clock = self.clock.time
+        self.limiter.sleep = self.clock.sleep
+        client = swagger.ApiClient('key', self.apiUrl,
+                                   rateLimiter=self.limiter)
+        self.wordApi = WordApi.WordApi(client)
+
+    def respond(self, method, path):
+        if path.startswith('/v4/account.json/apiTokenStatus'):
+            self.statusCalls += 1
+            return 200, {'valid': True, 'remainingCalls': self.remainingCalls,
+                         'resetsInMillis': 10000, 'totalRequests': 5000}
+        return 200, {'word': 'cat', 'id': 1}
+
+    def testSeedsFromTokenStatus(self):
+        self.wordApi.getWord('cat')
+        assert self.statusCalls == 1, 'should fetch the token status once'
+        assert self.limiter.rate == 1.0, '10 calls over 10s is 1 call/s'
+
+    def testSpreadsCallsOverWindow(self):
+        start = self.clock.now
+        for i in range(6):
+            self.wordApi.getWord('cat')
+        # Two calls come out of the initial burst, the other four wait a
+        # second each.
+        elapsed = self.clock.now - start
+        assert abs(elapsed - 4.0) < 0.01, 'waited %.2fs, expected 4s' % elapsed
+        assert self.limiter.stats()['acquired'] == 6, 'should count calls'
+
+    def testWaitsForResetWhenQuotaIsSpent(self):
+        self.remainingCalls = 2
+        start = self.clock.now
+        for i in range(3):
+            self.wordApi.getWord('cat')
+        assert self.clock.now - start >= 10.0, 'should wait for the reset'
+        assert self.statusCalls == 2, 'should re-read the status after reset'
+
+    def testRefreshesPeriodically(self):
+        self.remainingCalls = 10000
+        self.wordApi.getWord('cat')
+        self.clock.now += 61
+        self.wordApi.getWord('cat')
+        assert self.statusCalls == 2, 'status should be refreshed after 60s'
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import socket
+import unittest
+import urllib2
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class RetryTest(LocalServerTest):
+
+    def setUp(self):
+        super(RetryTest, self).setUp()
+        self.requests = 0
+        self.failures = 0
+        self.status = 503
+        self.stall = 0
+        self.slept = []
+        self.policy = retry.RetryPolicy(maxAttempts=4, backoff=0.5)
+        self.policy.sleep = self.slept.append
+        self.client = swagger.ApiClient('key', self.apiUrl,
+                                        retryPolicy=self.policy)
+        self.wordApi = WordApi.WordApi(self.client)
+
+    def respond(self, method, path):
+        self.requests += 1
+        time.sleep(self.stall)
+        if self.requests <= self.failures:
+            return self.status, {'message': 'try again'}
+        return 200, {'word': 'cat', 'id': 1}
+
+    def testRetriesTransientStatus(self):
+        self.failures = 2
+        res = self.wordApi.getWord('cat')
+        assert res.word == 'cat', 'should succeed on the third attempt'
+        assert self.requests == 3, 'should make three requests'
+        stats = self.policy.stats()
+        assert stats['retries'] == 2, 'should count two retries'
+        assert stats['attempts'] == 3, 'should count three attempts'
+
+    def testBackoffUsesFullJitter(self):
+        self.failures = 3
+        self.wordApi.getWord('cat')
+        for attempt, delay in enumerate(self.slept):
+            assert 0 <= delay <= 0.5 * 2 ** attempt, 'delay out of range'
+
+    def testGivesUpAfterMaxAttempts(self):
+        self.failures = 10
+        self.assertRaises(urllib2.HTTPError, self.wordApi.getWord, 'cat')
+        assert self.requests == 4, 'should stop after four attempts'
+        assert self.policy.stats()['giveUps'] == 1, 'should count the give up'
+
+    def testDoesNotRetryClientErrors(self):
+        self.failures = 1
+        self.status = 404
+        self.assertRaises(urllib2.HTTPError, self.wordApi.getWord, 'cat')
+        assert self.requests == 1, '404 should not be retried'
+
+    def testDoesNotRetryPost(self):
+        self.failures = 1
+        self.assertRaises(urllib2.HTTPError, self.client.callAPI,
+                          '/wordLists.json', 'POST', {}, {'name': 'x'})
+        assert self.requests == 1, 'POST should not be retried'
+
+    def testDeadline(self):
+        self.failures = 10
+        self.policy.deadline = 0.5
+        self.policy.delayFor = lambda attempt, error=None: 1.0
+        self.assertRaises(urllib2.HTTPError, self.wordApi.getWord, 'cat')
+        assert self.requests == 1, 'no retry should start past the deadline'
+
+    def testDeadlineBoundsEachAttempt(self):
+        self.stall = 2.0
+        self.policy.deadline = 0.3
+        start = time.time()
+        self.assertRaises(urllib2.URLError, self.wordApi.getWord, 'cat')
+        assert time.time() - start < 1.0, 'a stalled attempt should time out'
+        assert self.requests == 1, 'no time should be left for a retry'
+        self.stall = 0
+        self.wordApi.getWord('cat')
+        [(conn, lastUsed)] = self.client.pool._idle.values()[0]
+        assert conn.sock.gettimeout() is None, \
+            'pooled connections should get back the pool timeout'
+
+    def testRetriesConnectionErrors(self):
+        closed = socket.socket()
+        closed.bind(('127.0.0.1', 0))
+        port = closed.getsockname()[1]
+        closed.close()
+        client = swagger.ApiClient('key', 'http://127.0.0.1:%d/v4' % port,
+                                   retryPolicy=self.policy)
+        self.assertRaises(urllib2.URLError, WordApi.WordApi(client).getWord,
+                          'cat')
+        assert self.policy.stats()['retries'] == 3, 'should retry 3 times'
+
+
+if __name__ == "__main__":
+    unittest.main()
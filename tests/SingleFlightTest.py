@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+import urllib2
+import threading
+import traceback
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class SingleFlightTest(LocalServerTest):
+
+    def setUp(self):
+        super(SingleFlightTest, self).setUp()
+        self.lock = threading.Lock()
+        self.paths = []
+        self.client = swagger.ApiClient('key', self.apiUrl)
+        self.wordApi = WordApi.WordApi(self.client)
+
+    def respond(self, method, path):
+        with self.lock:
+            self.paths.append(path)
+        time.sleep(0.2)
+        word = path.split('/')[3].split('?')[0]
+        if word == 'missing':
+            return 404, {'message': 'not found'}
+        return 200, [{'word': word, 'text': 'a ' + word}]
+
+    def callConcurrently(self, func, count):
+        results = [None] * count
+
+        def run(i):
+            try:
+                results[i] = func(i)
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def testIdenticalGetsShareOneRequest(self):
+        results = self.callConcurrently(
+            lambda i: self.wordApi.getDefinitions('cat', limit=1), 20)
+        assert len(self.paths) == 1, 'expected 1 request, got %d' % len(self.paths)
+        for definitions in results:
+            assert definitions[0].text == 'a cat', 'every caller gets the result'
+        assert results[0] is not results[1], 'each caller gets its own models'
+        assert self.client.inFlight.stats() == {'calls': 20, 'shared': 19}
+
+    def testDifferentGetsAreNotCoalesced(self):
+        self.callConcurrently(
+            lambda i: self.wordApi.getDefinitions('cat', limit=i % 2 + 1), 10)
+        assert len(self.paths) == 2, 'one request per distinct query'
+
+    def testErrorsAreShared(self):
+        results = self.callConcurrently(
+            lambda i: self.wordApi.getDefinitions('missing'), 5)
+        assert len(self.paths) == 1, 'the failing request should be shared'
+        for error in results:
+            assert isinstance(error, urllib2.HTTPError), 'every caller should fail'
+
+    def testSharedErrorsKeepTraceback(self):
+        inFlight = singleflight.SingleFlight()
+        started = threading.Event()
+
+        def failingCall():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError('failed')
+
+        leader = threading.Thread(target=self.assertRaises,
+                                  args=(ValueError, inFlight.do, 'key',
+                                        failingCall))
+        leader.start()
+        started.wait()
+        try:
+            inFlight.do('key', failingCall)
+        except ValueError:
+            frames = [frame[2] for frame
+                      in traceback.extract_tb(sys.exc_info()[2])]
+            assert frames[-1] == 'failingCall', frames
+        else:
+            self.fail('ValueError not raised')
+        leader.join()
+        assert inFlight.stats()['shared'] == 1
+
+    def testCoalescingCanBeTurnedOff(self):
+        client = swagger.ApiClient('key', self.apiUrl, coalesce=False)
+        wordApi = WordApi.WordApi(client)
+        self.callConcurrently(lambda i: wordApi.getDefinitions('cat'), 4)
+        assert len(self.paths) == 4, 'every call should be sent'
+
+        def call(i):
+            with self.client.options(coalesce=False):
+                return self.wordApi.getDefinitions('dog')
+
+        self.callConcurrently(call, 3)
+        assert len(self.paths) == 7, 'coalesce=False should send every call'
+
+
+if __name__ == "__main__":
+    unittest.main()
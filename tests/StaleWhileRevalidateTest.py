@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import urllib2
+import unittest
+import threading
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class StaleWhileRevalidateTest(LocalServerTest):
+
+    def setUp(self):
+        super(StaleWhileRevalidateTest, self).setUp()
+        self.requests = 0
+        self.failing = False
+        self.cacheControl = None
+        self.release = threading.Event()
+        self.release.set()
+        self.now = 1000.0
+        self.cache = cache.ResponseCache(ttl=60, grace=30, maxStale=300)
+        self.cache.clock = lambda: self.now
+        self.client = swagger.ApiClient('key', self.apiUrl, cache=self.cache,
+                                        serveStale=True)
+        self.wordApi = WordApi.WordApi(self.client)
+
+    def respond(self, method, path):
+        self.release.wait()
+        self.requests += 1
+        if self.failing:
+            return 503, {'message': 'unavailable'}
+        headers = {}
+        if self.cacheControl is not None:
+            headers['Cache-Control'] = self.cacheControl
+        return 200, {'word': 'cat', 'id': self.requests}, headers
+
+    def waitForRefreshes(self):
+        deadline = time.time() + 5
+        while self.client._refreshing and time.time() < deadline:
+            time.sleep(0.005)
+        assert not self.client._refreshing, 'refresh did not finish'
+
+    def testServesStaleEntryAndRefreshes(self):
+        self.wordApi.getWord('cat')
+        self.now += 70
+        assert self.wordApi.getWord('cat').id == 1, 'should answer at once'
+        self.waitForRefreshes()
+        assert self.requests == 2, 'should have refreshed in the background'
+        assert self.wordApi.getWord('cat').id == 2, 'should be fresh again'
+        assert self.requests == 2
+        assert self.cache.stats()['staleHits'] == 1
+
+    def testOneRefreshPerEntry(self):
+        self.wordApi.getWord('cat')
+        self.now += 70
+        self.release.clear()
+        for i in range(5):
+            assert self.wordApi.getWord('cat').id == 1
+        self.release.set()
+        self.waitForRefreshes()
+        assert self.requests == 2, 'refreshes should be deduplicated'
+
+    def testBlocksPastGracePeriod(self):
+        self.wordApi.getWord('cat')
+        self.now += 91
+        assert self.wordApi.getWord('cat').id == 2, 'too stale to serve'
+        assert self.cache.stats()['staleHits'] == 0
+
+    def testFailedRefreshKeepsEntryUpToHardCap(self):
+        self.wordApi.getWord('cat')
+        self.failing = True
+        self.now += 70
+        assert self.wordApi.getWord('cat').id == 1
+        self.waitForRefreshes()
+        self.now += 200  # past the grace period, inside maxStale
+        assert self.wordApi.getWord('cat').id == 1, 'should keep old value'
+        self.waitForRefreshes()
+        assert self.requests == 3, 'should keep trying to refresh'
+        self.now += 100  # past maxStale
+        self.assertRaises(urllib2.HTTPError, self.wordApi.getWord, 'cat')
+
+    def testStaleWhileRevalidateHeaderExtendsGrace(self):
+        self.cacheControl = 'max-age=60, stale-while-revalidate=200'
+        self.wordApi.getWord('cat')
+        self.now += 200
+        assert self.wordApi.getWord('cat').id == 1
+        self.waitForRefreshes()
+        self.now += 300  # past the window the header allowed
+        assert self.wordApi.getWord('cat').id == 3
+
+    def testOffUnlessAsked(self):
+        self.wordApi.getWord('cat')
+        self.now += 70
+        with self.client.options(serveStale=False):
+            assert self.wordApi.getWord('cat').id == 2, 'should block'
+        self.client.serveStale = False
+        self.now += 70
+        assert self.wordApi.getWord('cat').id == 3, 'should block'
+
+    def testDiskCache(self):
+        diskCache = diskcache.DiskCache(':memory:', ttl=60, grace=30)
+        diskCache.clock = lambda: self.now
+        diskCache.set('a', None, '"old"', '/word.json/a')
+        self.now += 70
+        assert diskCache.get('a') is None, 'expired'
+        assert diskCache.get('a', stale=True).data == 'old'
+        self.now += 30
+        assert diskCache.get('a', stale=True) is None, 'past the grace'
+        diskCache.keepStale('a')
+        assert diskCache.get('a', stale=True).data == 'old'
+        assert diskCache.stats()['staleHits'] == 2
+
+
+if __name__ == "__main__":
+    unittest.main()
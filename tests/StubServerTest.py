@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+import urllib2
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class StubServerTest(unittest.TestCase):
+
+    def startStub(self, **kwargs):
+        self.stub = stubserver.StubServer(**kwargs).start()
+        self.addCleanup(self.stub.stop)
+        client = swagger.ApiClient('key', self.stub.url)
+        self.wordApi = WordApi.WordApi(client)
+        self.wordsApi = WordsApi.WordsApi(client)
+
+    def testConfigurableSizes(self):
+        self.startStub(sizes={'definitions': 300, 'searchResults': 42})
+        assert len(self.wordApi.getDefinitions('cat')) == 200, \
+            'the default limit should apply'
+        assert len(self.wordApi.getDefinitions('cat', limit=250)) == 250
+        res = self.wordsApi.searchWords('tree', skip=40, limit=10)
+        assert res.totalResults == 42
+        assert [r.word for r in res.searchResults] == ['tree40', 'tree41']
+
+    def testInjectedLatency(self):
+        self.startStub(latency=0.1)
+        start = time.time()
+        self.wordApi.getWord('cat')
+        assert time.time() - start >= 0.1, 'response should be delayed'
+
+    def testInjectedErrors(self):
+        self.startStub(errorRate=0.5, errorStatus=502, seed=1)
+        failures = 0
+        for i in range(40):
+            try:
+                self.wordApi.getWord('cat')
+            except urllib2.HTTPError as e:
+                assert e.code == 502, 'wrong injected status'
+                failures += 1
+        assert 5 < failures < 35, '%d of 40 calls failed' % failures
+        assert self.stub.stats()['injectedErrors'] == failures
+
+    def testConditionalGet(self):
+        self.startStub()
+        url = self.stub.url + '/word.json/cat/definitions'
+        response = urllib2.urlopen(urllib2.Request(url,
+                                                   headers={'api_key': 'key'}))
+        etag = response.info().getheader('ETag')
+        response.read()
+        assert etag, 'GETs should carry an ETag'
+        try:
+            urllib2.urlopen(urllib2.Request(
+                url, headers={'api_key': 'key', 'If-None-Match': etag}))
+        except urllib2.HTTPError as e:
+            assert e.code == 304, 'a matching ETag should get a 304'
+        else:
+            self.fail('a matching ETag should get a 304')
+
+    def testRequiresApiKey(self):
+        self.startStub()
+        try:
+            urllib2.urlopen(self.stub.url + '/word.json/cat')
+        except urllib2.HTTPError as e:
+            assert e.code == 401, 'missing api_key should be refused'
+        else:
+            self.fail('missing api_key should be refused')
+
+    def testUnknownRoutes(self):
+        self.startStub()
+        client = swagger.ApiClient('key', self.stub.url)
+        for path, status in [('/nothing.json/here', 404),
+                             ('/word.json/cat/nothing', 404)]:
+            try:
+                client.callAPI(path, 'GET', {}, None)
+            except urllib2.HTTPError as e:
+                assert e.code == status, '%s should give %d' % (path, status)
+            else:
+                self.fail(path + ' should fail')
+        try:
+            client.callAPI('/word.json/cat', 'DELETE', {}, None)
+        except urllib2.HTTPError as e:
+            assert e.code == 405, 'wrong method should give 405'
+        else:
+            self.fail('DELETE of a word should fail')
+
+
+if __name__ == "__main__":
+    unittest.main()
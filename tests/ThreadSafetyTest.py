@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import sys
+import unittest
+import urlparse
+import threading
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class ThreadSafetyTest(LocalServerTest):
+    """Many threads sharing one fully configured client."""
+
+    threads = 32
+    callsPerThread = 40
+
+    def setUp(self):
+        super(ThreadSafetyTest, self).setUp()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.wrongCookies = []
+        policy = retry.RetryPolicy(maxAttempts=5, backoff=0.001)
+        self.client = swagger.ApiClient('key', self.apiUrl,
+                                        cache=cache.ResponseCache(),
+                                        retryPolicy=policy)
+        self.wordApi = WordApi.WordApi(self.client)
+        self.accountApi = AccountApi.AccountApi(self.client)
+
+    def respond(self, method, path):
+        with self.lock:
+            self.requests += 1
+            count = self.requests
+        url = urlparse.urlparse(path)
+        parts = url.path.split('/')
+        if parts[2] == 'account.json':
+            user = parts[4]
+            return (200, {'token': 'token-' + user, 'userId': 1},
+                    {'Set-Cookie': 'session=' + user})
+        if count % 7 == 0:
+            return 503, {'message': 'try again'}
+        word = parts[3]
+        user = word.split('-')[0]
+        if user != 'shared':
+            cookie = self.handling.headers.getheader('Cookie')
+            if cookie != 'session=' + user:
+                with self.lock:
+                    self.wrongCookies.append((word, cookie))
+        if len(parts) > 4:
+            return 200, [{'word': word, 'text': 'a ' + word}]
+        return 200, {'word': word, 'id': 1}
+
+    def worker(self, i, errors):
+        user = 'user%d' % i
+        try:
+            self.accountApi.authenticate(user, 'password')
+            assert self.client.cookie == 'session=' + user, 'cookie not kept'
+            for j in range(self.callsPerThread):
+                word = '%s-word%d' % (user, j % 5)
+                if j % 2:
+                    result = self.wordApi.getWord(word)
+                    assert result.word == word, 'wrong word'
+                else:
+                    result = self.wordApi.getDefinitions(word)
+                    assert result[0].text == 'a ' + word, 'wrong definition'
+                result = self.wordApi.getWord('shared-word%d' % (j % 3))
+                assert result.word == 'shared-word%d' % (j % 3), 'wrong word'
+            assert self.client.cookie == 'session=' + user, 'cookie changed'
+        except Exception as e:
+            errors.append((user, e))
+
+    def testSharedClient(self):
+        errors = []
+        threads = [threading.Thread(target=self.worker, args=(i, errors))
+                   for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, errors[:5]
+        assert not self.wrongCookies, self.wrongCookies[:5]
+        assert self.client.cookie is None, 'main thread has no session'
+        stats = self.client.cache.stats()
+        # authenticate is a GET too, so it goes through the cache as well
+        calls = self.threads * (self.callsPerThread * 2 + 1)
+        assert stats['hits'] + stats['misses'] == calls, stats
+        assert stats['entries'] == self.threads * 11 + 3, stats
+        assert self.client.pool.stats()['requests'] == self.requests
+
+
+if __name__ == "__main__":
+    unittest.main()
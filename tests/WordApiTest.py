@@ -15,7 +15,7 @@ from wordnik import *
 class WordApiTest(BaseApiTest):
 
     def testWordApis(self):
-        response = urllib2.urlopen('http://api.wordnik.com/v4/word.json')
+        response = urllib2.urlopen(self.apiUrl + '/word.json')
         doc = json.loads(response.read())
         assert len(doc['apis']) == 12, 'there should be 10 word apis'
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import pickle
+import unittest
+import urllib2
+import urlparse
+
+from LocalServerTest import LocalServerTest
+
+sys.path = ['./'] + sys.path
+from wordnik import *
+
+
+class WordProfileTest(LocalServerTest):
+
+    documents = {
+        '': {'word': 'cat', 'id': 1},
+        'definitions': [{'word': 'cat', 'text': 'a small feline'}],
+        'examples': {'examples': [{'text': 'The cat sat.'}]},
+        'pronunciations': [{'raw': 'kat', 'seq': 0}],
+        'hyphenation': [{'text': 'cat', 'seq': 0}],
+        'audio': [{'fileUrl': 'http://example.com/cat.mp3'}],
+        'etymologies': ['from Old English catt'],
+        'relatedWords': [{'relationshipType': 'synonym', 'words': ['feline']}],
+        'frequency': {'word': 'cat', 'totalCount': 10},
+    }
+
+    def setUp(self):
+        super(WordProfileTest, self).setUp()
+        self.paths = []
+        client = swagger.ApiClient('key', self.apiUrl)
+        self.wordApi = WordApi.WordApi(client)
+
+    def respond(self, method, path):
+        url = urlparse.urlparse(path)
+        self.paths.append(path)
+        time.sleep(0.1)
+        parts = url.path.split('/')
+        part = parts[4] if len(parts) > 4 else ''
+        if parts[3] == 'missing' or self.documents[part] is None:
+            return 404, {'message': 'not found'}
+        return 200, self.documents[part]
+
+    def testFetchesEveryPartConcurrently(self):
+        start = time.time()
+        profile = self.wordApi.getWordProfile('cat')
+        elapsed = time.time() - start
+        assert len(self.paths) == 9, 'should make one call per part'
+        assert elapsed < 0.5, 'calls should overlap, took %.2fs' % elapsed
+        assert profile.word == 'cat'
+        assert profile.wordObject.id == 1
+        assert profile.definitions[0].text == 'a small feline'
+        assert profile.examples.examples[0].text == 'The cat sat.'
+        assert profile.textPronunciations[0].raw == 'kat'
+        assert profile.hyphenation[0].text == 'cat'
+        assert profile.audio[0].fileUrl == 'http://example.com/cat.mp3'
+        assert profile.etymologies == ['from Old English catt']
+        assert profile.relatedWords[0].words == ['feline']
+        assert profile.frequency.totalCount == 10
+
+    def testIncludeAndPartArguments(self):
+        profile = self.wordApi.getWordProfile(
+            'cat', include=['definitions', 'frequency'],
+            definitions={'limit': 3})
+        assert len(self.paths) == 2, 'should only fetch the included parts'
+        assert any(path.endswith('/definitions?limit=3')
+                   for path in self.paths), 'part arguments not passed on'
+        assert profile.definitions is not None
+        assert profile.examples is None, 'excluded parts should stay None'
+
+    def testUnknownPartIsRejected(self):
+        self.assertRaises(TypeError, self.wordApi.getWordProfile, 'cat',
+                          include=['synonyms'])
+
+    def testFailedPartIsRecorded(self):
+        self.documents = dict(self.documents, frequency=None)
+        profile = self.wordApi.getWordProfile(
+            'cat', include=['definitions', 'frequency'])
+        assert profile.definitions[0].text == 'a small feline', \
+            'parts that succeeded should be kept'
+        assert profile.frequency is None
+        assert profile.errors.keys() == ['frequency']
+        assert isinstance(profile.errors['frequency'], urllib2.HTTPError)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(profile, protocol))
+            assert copy.definitions[0].text == 'a small feline'
+            assert copy.word == 'cat' and copy.errors is None
+
+    def testNoErrorsWhenEveryPartSucceeds(self):
+        profile = self.wordApi.getWordProfile('cat', include=['definitions'])
+        assert profile.errors is None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,8 @@ import sys
 import os
 
 from models import *
+from endpoints import byName
+import paging
 
 
 class AccountApi(object):
@@ -39,38 +41,8 @@ class AccountApi(object):
         Returns: AuthenticationToken
         """
 
-        allParams = ['username', 'password']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method authenticate" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/account.{format}/authenticate/{username}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('password' in params):
-            queryParams['password'] = self.apiClient.toPathValue(params['password'])
-        if ('username' in params):
-            replacement = str(self.apiClient.toPathValue(params['username']))
-            resourcePath = resourcePath.replace('{' + 'username' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'AuthenticationToken')
-        return responseObject
+        return self.apiClient.dispatch(byName['authenticate'],
+                                       (username, password), kwargs)
         
         
     def authenticatePost(self, username, body, **kwargs):
@@ -83,36 +55,8 @@ class AccountApi(object):
         Returns: AuthenticationToken
         """
 
-        allParams = ['username', 'body']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method authenticatePost" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/account.{format}/authenticate/{username}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'POST'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('username' in params):
-            replacement = str(self.apiClient.toPathValue(params['username']))
-            resourcePath = resourcePath.replace('{' + 'username' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'AuthenticationToken')
-        return responseObject
+        return self.apiClient.dispatch(byName['authenticatePost'],
+                                       (username, body), kwargs)
         
         
     def getWordListsForLoggedInUser(self, auth_token, **kwargs):
@@ -126,38 +70,8 @@ class AccountApi(object):
         Returns: list[WordList]
         """
 
-        allParams = ['auth_token', 'skip', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getWordListsForLoggedInUser" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/account.{format}/wordLists'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('skip' in params):
-            queryParams['skip'] = self.apiClient.toPathValue(params['skip'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[WordList]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getWordListsForLoggedInUser'],
+                                       (auth_token,), kwargs)
         
         
     def getApiTokenStatus(self, **kwargs):
@@ -169,34 +83,7 @@ class AccountApi(object):
         Returns: ApiTokenStatus
         """
 
-        allParams = ['api_key']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getApiTokenStatus" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/account.{format}/apiTokenStatus'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('api_key' in params):
-            headerParams['api_key'] = params['api_key']
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'ApiTokenStatus')
-        return responseObject
+        return self.apiClient.dispatch(byName['getApiTokenStatus'], (), kwargs)
         
         
     def getLoggedInUser(self, auth_token, **kwargs):
@@ -208,34 +95,32 @@ class AccountApi(object):
         Returns: User
         """
 
-        allParams = ['auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getLoggedInUser" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/account.{format}/user'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
+        return self.apiClient.dispatch(byName['getLoggedInUser'],
+                                       (auth_token,), kwargs)
+        
+        
+    def iterWordListsForLoggedInUser(self, auth_token, pageSize=50, maxResults=None, **kwargs):
+        """Iterate over every result of getWordListsForLoggedInUser, fetching the next page in the background while the current one is consumed
 
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        postData = (params['body'] if 'body' in params else None)
+        Args:
+            auth_token, str: auth_token of logged-in user (required)
+            pageSize, int: Results to request per call (optional)
+            maxResults, int: Stop after this many results (optional)
+            skip, int: Results to skip before the first one yielded (optional)
+            Any other keyword argument accepted by getWordListsForLoggedInUser is passed on with every call.
+            
+        Returns: iterator of WordList
+        """
 
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
+        if 'limit' in kwargs:
+            raise TypeError("Use pageSize or maxResults instead of limit with method iterWordListsForLoggedInUser")
+        skip = kwargs.pop('skip', 0)
 
-        if not response:
-            return None
+        def fetchPage(skip, limit):
+            return self.getWordListsForLoggedInUser(auth_token, skip=skip, limit=limit, **kwargs)
 
-        responseObject = self.apiClient.deserialize(response, 'User')
-        return responseObject
+        return paging.iterPages(self.apiClient, fetchPage, None, pageSize,
+                                skip, maxResults)
         
         
     
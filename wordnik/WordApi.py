@@ -21,6 +21,10 @@ import sys
 import os
 
 from models import *
+from endpoints import byName
+import batch
+import paging
+from wordprofile import WordProfile
 
 
 class WordApi(object):
@@ -42,44 +46,7 @@ class WordApi(object):
         Returns: ExampleSearchResults
         """
 
-        allParams = ['word', 'includeDuplicates', 'useCanonical', 'skip', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getExamples" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/examples'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('includeDuplicates' in params):
-            queryParams['includeDuplicates'] = self.apiClient.toPathValue(params['includeDuplicates'])
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('skip' in params):
-            queryParams['skip'] = self.apiClient.toPathValue(params['skip'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'ExampleSearchResults')
-        return responseObject
+        return self.apiClient.dispatch(byName['getExamples'], (word,), kwargs)
         
         
     def getWord(self, word, **kwargs):
@@ -93,40 +60,7 @@ class WordApi(object):
         Returns: WordObject
         """
 
-        allParams = ['word', 'useCanonical', 'includeSuggestions']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getWord" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('includeSuggestions' in params):
-            queryParams['includeSuggestions'] = self.apiClient.toPathValue(params['includeSuggestions'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'WordObject')
-        return responseObject
+        return self.apiClient.dispatch(byName['getWord'], (word,), kwargs)
         
         
     def getDefinitions(self, word, **kwargs):
@@ -144,48 +78,8 @@ class WordApi(object):
         Returns: list[Definition]
         """
 
-        allParams = ['word', 'partOfSpeech', 'sourceDictionaries', 'limit', 'includeRelated', 'useCanonical', 'includeTags']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getDefinitions" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/definitions'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('partOfSpeech' in params):
-            queryParams['partOfSpeech'] = self.apiClient.toPathValue(params['partOfSpeech'])
-        if ('includeRelated' in params):
-            queryParams['includeRelated'] = self.apiClient.toPathValue(params['includeRelated'])
-        if ('sourceDictionaries' in params):
-            queryParams['sourceDictionaries'] = self.apiClient.toPathValue(params['sourceDictionaries'])
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('includeTags' in params):
-            queryParams['includeTags'] = self.apiClient.toPathValue(params['includeTags'])
-        if ('word' in params):
-            replacement = self.apiClient.toPathValue(params['word']).encode('utf8')
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[Definition]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getDefinitions'], (word,),
+                                       kwargs)
         
         
     def getTopExample(self, word, **kwargs):
@@ -198,38 +92,8 @@ class WordApi(object):
         Returns: Example
         """
 
-        allParams = ['word', 'useCanonical']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getTopExample" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/topExample'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'Example')
-        return responseObject
+        return self.apiClient.dispatch(byName['getTopExample'], (word,),
+                                       kwargs)
         
         
     def getRelatedWords(self, word, **kwargs):
@@ -244,42 +108,8 @@ class WordApi(object):
         Returns: list[Related]
         """
 
-        allParams = ['word', 'relationshipTypes', 'useCanonical', 'limitPerRelationshipType']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getRelatedWords" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/relatedWords'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('relationshipTypes' in params):
-            queryParams['relationshipTypes'] = self.apiClient.toPathValue(params['relationshipTypes'])
-        if ('limitPerRelationshipType' in params):
-            queryParams['limitPerRelationshipType'] = self.apiClient.toPathValue(params['limitPerRelationshipType'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[Related]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getRelatedWords'], (word,),
+                                       kwargs)
         
         
     def getTextPronunciations(self, word, **kwargs):
@@ -295,44 +125,8 @@ class WordApi(object):
         Returns: list[TextPron]
         """
 
-        allParams = ['word', 'sourceDictionary', 'typeFormat', 'useCanonical', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getTextPronunciations" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/pronunciations'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('sourceDictionary' in params):
-            queryParams['sourceDictionary'] = self.apiClient.toPathValue(params['sourceDictionary'])
-        if ('typeFormat' in params):
-            queryParams['typeFormat'] = self.apiClient.toPathValue(params['typeFormat'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[TextPron]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getTextPronunciations'],
+                                       (word,), kwargs)
         
         
     def getHyphenation(self, word, **kwargs):
@@ -347,42 +141,8 @@ class WordApi(object):
         Returns: list[Syllable]
         """
 
-        allParams = ['word', 'sourceDictionary', 'useCanonical', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getHyphenation" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/hyphenation'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('sourceDictionary' in params):
-            queryParams['sourceDictionary'] = self.apiClient.toPathValue(params['sourceDictionary'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[Syllable]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getHyphenation'], (word,),
+                                       kwargs)
         
         
     def getWordFrequency(self, word, **kwargs):
@@ -397,42 +157,8 @@ class WordApi(object):
         Returns: FrequencySummary
         """
 
-        allParams = ['word', 'useCanonical', 'startYear', 'endYear']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getWordFrequency" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/frequency'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('startYear' in params):
-            queryParams['startYear'] = self.apiClient.toPathValue(params['startYear'])
-        if ('endYear' in params):
-            queryParams['endYear'] = self.apiClient.toPathValue(params['endYear'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'FrequencySummary')
-        return responseObject
+        return self.apiClient.dispatch(byName['getWordFrequency'], (word,),
+                                       kwargs)
         
         
     def getPhrases(self, word, **kwargs):
@@ -447,42 +173,7 @@ class WordApi(object):
         Returns: list[Bigram]
         """
 
-        allParams = ['word', 'limit', 'wlmi', 'useCanonical']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getPhrases" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/phrases'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('wlmi' in params):
-            queryParams['wlmi'] = self.apiClient.toPathValue(params['wlmi'])
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[Bigram]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getPhrases'], (word,), kwargs)
         
         
     def getEtymologies(self, word, **kwargs):
@@ -495,38 +186,8 @@ class WordApi(object):
         Returns: list[str]
         """
 
-        allParams = ['word', 'useCanonical']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getEtymologies" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/word.{format}/{word}/etymologies'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[str]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getEtymologies'], (word,),
+                                       kwargs)
         
         
     def getAudio(self, word, **kwargs):
@@ -540,81 +201,142 @@ class WordApi(object):
         Returns: list[AudioFile]
         """
 
-        allParams = ['word', 'useCanonical', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getAudio" % key)
-            params[key] = val
-        del params['kwargs']
+        return self.apiClient.dispatch(byName['getAudio'], (word,), kwargs)
+        
+        
+    def getScrabbleScore(self, word, **kwargs):
+        """Returns the Scrabble score for a word
 
-        resourcePath = '/word.{format}/{word}/audio'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
+        Args:
+            word, str: Word to get scrabble score for. (required)
+            
+        Returns: ScrabbleScoreResult
+        """
 
-        queryParams = {}
-        headerParams = {}
+        return self.apiClient.dispatch(byName['getScrabbleScore'], (word,),
+                                       kwargs)
+        
+        
+    def getDefinitionsMany(self, words, maxWorkers=8, **kwargs):
+        """Return definitions for many words, looked up concurrently
 
-        if ('useCanonical' in params):
-            queryParams['useCanonical'] = self.apiClient.toPathValue(params['useCanonical'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
+        Args:
+            words, iterable of str: Words to return definitions for (required)
+            maxWorkers, int: Maximum number of lookups in flight (optional)
+            Any other keyword argument accepted by getDefinitions is applied to every word.
+            
+        Returns: dict mapping each word to its list[Definition], or to a batch.BatchFailure if its lookup raised
+        """
 
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
+        return dict(self.iterDefinitionsMany(words, maxWorkers, **kwargs))
+        
+        
+    def iterDefinitionsMany(self, words, maxWorkers=8, **kwargs):
+        """Like getDefinitionsMany, but yields (word, list[Definition]) pairs as each lookup completes
+        """
 
-        if not response:
-            return None
+        def lookup(word):
+            return self.getDefinitions(word, **kwargs)
 
-        responseObject = self.apiClient.deserialize(response, 'list[AudioFile]')
-        return responseObject
+        return batch.imapUnordered(self.apiClient.withCurrentOptions(lookup),
+                                   words, maxWorkers)
         
         
-    def getScrabbleScore(self, word, **kwargs):
-        """Returns the Scrabble score for a word
+    def getWordsMany(self, words, maxWorkers=8, **kwargs):
+        """Return the WordObject for many words, looked up concurrently
 
         Args:
-            word, str: Word to get scrabble score for. (required)
+            words, iterable of str: Words to return WordObjects for (required)
+            maxWorkers, int: Maximum number of lookups in flight (optional)
+            Any other keyword argument accepted by getWord is applied to every word.
             
-        Returns: ScrabbleScoreResult
+        Returns: dict mapping each word to its WordObject, or to a batch.BatchFailure if its lookup raised
         """
 
-        allParams = ['word']
+        return dict(self.iterWordsMany(words, maxWorkers, **kwargs))
+        
+        
+    def iterWordsMany(self, words, maxWorkers=8, **kwargs):
+        """Like getWordsMany, but yields (word, WordObject) pairs as each lookup completes
+        """
 
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getScrabbleScore" % key)
-            params[key] = val
-        del params['kwargs']
+        def lookup(word):
+            return self.getWord(word, **kwargs)
 
-        resourcePath = '/word.{format}/{word}/scrabbleScore'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
+        return batch.imapUnordered(self.apiClient.withCurrentOptions(lookup),
+                                   words, maxWorkers)
+        
+        
+    def iterExamples(self, word, pageSize=50, maxResults=None, **kwargs):
+        """Iterate over every result of getExamples, fetching the next page in the background while the current one is consumed
+
+        Args:
+            word, str: Word to return examples for (required)
+            pageSize, int: Results to request per call (optional)
+            maxResults, int: Stop after this many results (optional)
+            skip, int: Results to skip before the first one yielded (optional)
+            Any other keyword argument accepted by getExamples is passed on with every call.
+            
+        Returns: iterator of Example
+        """
 
-        queryParams = {}
-        headerParams = {}
+        if 'limit' in kwargs:
+            raise TypeError("Use pageSize or maxResults instead of limit with method iterExamples")
+        skip = kwargs.pop('skip', 0)
 
-        if ('word' in params):
-            replacement = str(self.apiClient.toPathValue(params['word']))
-            resourcePath = resourcePath.replace('{' + 'word' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
+        def fetchPage(skip, limit):
+            return self.getExamples(word, skip=skip, limit=limit, **kwargs)
 
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
+        return paging.iterPages(self.apiClient, fetchPage, 'examples', pageSize,
+                                skip, maxResults)
+        
+        
+    def getWordProfile(self, word, include=None, maxWorkers=None, **kwargs):
+        """Fetch several kinds of information about a word at once, issuing the calls concurrently
 
-        if not response:
-            return None
+        Args:
+            word, str: Word to look up (required)
+            include, list[str]: Parts to fetch, any of wordObject, definitions, examples, textPronunciations, hyphenation, audio, etymologies, relatedWords and frequency; all of them by default (optional)
+            maxWorkers, int: Maximum number of calls in flight; one per part by default (optional)
+            Keyword arguments named after a part give extra arguments for its call, e.g. definitions={'limit': 3}.
+            
+        Returns: wordprofile.WordProfile; a part whose call raised stays None and its exception is recorded in the profile's errors dict
+        """
 
-        responseObject = self.apiClient.deserialize(response, 'ScrabbleScoreResult')
-        return responseObject
+        parts = {
+            'wordObject': self.getWord,
+            'definitions': self.getDefinitions,
+            'examples': self.getExamples,
+            'textPronunciations': self.getTextPronunciations,
+            'hyphenation': self.getHyphenation,
+            'audio': self.getAudio,
+            'etymologies': self.getEtymologies,
+            'relatedWords': self.getRelatedWords,
+            'frequency': self.getWordFrequency,
+        }
+        if include is None:
+            include = WordProfile.parts
+        for part in list(include) + kwargs.keys():
+            if part not in parts:
+                raise TypeError("Got an unexpected part '%s' to method getWordProfile" % part)
+
+        def fetch(part):
+            return parts[part](word, **kwargs.get(part, {}))
+
+        profile = WordProfile(word)
+        results = batch.imapUnordered(self.apiClient.withCurrentOptions(fetch),
+                                      include, maxWorkers or max(len(include), 1))
+        try:
+            for (part, result) in results:
+                if isinstance(result, batch.BatchFailure):
+                    if profile.errors is None:
+                        profile.errors = {}
+                    profile.errors[part] = result.exception
+                else:
+                    setattr(profile, part, result)
+        finally:
+            results.close()
+        return profile
         
         
     
@@ -21,6 +21,8 @@ import sys
 import os
 
 from models import *
+from endpoints import byName
+import paging
 
 
 class WordListApi(object):
@@ -40,33 +42,8 @@ class WordListApi(object):
         Returns: 
         """
 
-        allParams = ['permalink', 'body', 'auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method updateWordList" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordList.{format}/{permalink}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'PUT'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        if ('permalink' in params):
-            replacement = str(self.apiClient.toPathValue(params['permalink']))
-            resourcePath = resourcePath.replace('{' + 'permalink' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
+        return self.apiClient.dispatch(byName['updateWordList'],
+                                       (permalink, auth_token), kwargs)
         
         
     def deleteWordList(self, permalink, auth_token, **kwargs):
@@ -79,33 +56,8 @@ class WordListApi(object):
         Returns: 
         """
 
-        allParams = ['permalink', 'auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method deleteWordList" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordList.{format}/{permalink}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'DELETE'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        if ('permalink' in params):
-            replacement = str(self.apiClient.toPathValue(params['permalink']))
-            resourcePath = resourcePath.replace('{' + 'permalink' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
+        return self.apiClient.dispatch(byName['deleteWordList'],
+                                       (permalink, auth_token), kwargs)
         
         
     def getWordListByPermalink(self, permalink, auth_token, **kwargs):
@@ -118,38 +70,8 @@ class WordListApi(object):
         Returns: WordList
         """
 
-        allParams = ['permalink', 'auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getWordListByPermalink" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordList.{format}/{permalink}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        if ('permalink' in params):
-            replacement = str(self.apiClient.toPathValue(params['permalink']))
-            resourcePath = resourcePath.replace('{' + 'permalink' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'WordList')
-        return responseObject
+        return self.apiClient.dispatch(byName['getWordListByPermalink'],
+                                       (permalink, auth_token), kwargs)
         
         
     def addWordsToWordList(self, permalink, auth_token, **kwargs):
@@ -163,33 +85,8 @@ class WordListApi(object):
         Returns: 
         """
 
-        allParams = ['permalink', 'body', 'auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method addWordsToWordList" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordList.{format}/{permalink}/words'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'POST'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        if ('permalink' in params):
-            replacement = str(self.apiClient.toPathValue(params['permalink']))
-            resourcePath = resourcePath.replace('{' + 'permalink' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
+        return self.apiClient.dispatch(byName['addWordsToWordList'],
+                                       (permalink, auth_token), kwargs)
         
         
     def getWordListWords(self, permalink, auth_token, **kwargs):
@@ -206,46 +103,8 @@ class WordListApi(object):
         Returns: list[WordListWord]
         """
 
-        allParams = ['permalink', 'auth_token', 'sortBy', 'sortOrder', 'skip', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getWordListWords" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordList.{format}/{permalink}/words'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('sortBy' in params):
-            queryParams['sortBy'] = self.apiClient.toPathValue(params['sortBy'])
-        if ('sortOrder' in params):
-            queryParams['sortOrder'] = self.apiClient.toPathValue(params['sortOrder'])
-        if ('skip' in params):
-            queryParams['skip'] = self.apiClient.toPathValue(params['skip'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        if ('permalink' in params):
-            replacement = str(self.apiClient.toPathValue(params['permalink']))
-            resourcePath = resourcePath.replace('{' + 'permalink' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[WordListWord]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getWordListWords'],
+                                       (permalink, auth_token), kwargs)
         
         
     def deleteWordsFromWordList(self, permalink, auth_token, **kwargs):
@@ -259,33 +118,33 @@ class WordListApi(object):
         Returns: 
         """
 
-        allParams = ['permalink', 'body', 'auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method deleteWordsFromWordList" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordList.{format}/{permalink}/deleteWords'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'POST'
+        return self.apiClient.dispatch(byName['deleteWordsFromWordList'],
+                                       (permalink, auth_token), kwargs)
+        
+        
+    def iterWordListWords(self, permalink, auth_token, pageSize=100, maxResults=None, **kwargs):
+        """Iterate over every result of getWordListWords, fetching the next page in the background while the current one is consumed
 
-        queryParams = {}
-        headerParams = {}
+        Args:
+            permalink, str: ID of WordList to use (required)
+            auth_token, str: The auth token of the logged-in user, obtained by calling /account.{format}/authenticate/{username} (described above) (required)
+            pageSize, int: Results to request per call (optional)
+            maxResults, int: Stop after this many results (optional)
+            skip, int: Results to skip before the first one yielded (optional)
+            Any other keyword argument accepted by getWordListWords is passed on with every call.
+            
+        Returns: iterator of WordListWord
+        """
 
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        if ('permalink' in params):
-            replacement = str(self.apiClient.toPathValue(params['permalink']))
-            resourcePath = resourcePath.replace('{' + 'permalink' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
+        if 'limit' in kwargs:
+            raise TypeError("Use pageSize or maxResults instead of limit with method iterWordListWords")
+        skip = kwargs.pop('skip', 0)
 
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
+        def fetchPage(skip, limit):
+            return self.getWordListWords(permalink, auth_token, skip=skip, limit=limit, **kwargs)
 
+        return paging.iterPages(self.apiClient, fetchPage, None, pageSize,
+                                skip, maxResults)
         
         
     
@@ -21,6 +21,7 @@ import sys
 import os
 
 from models import *
+from endpoints import byName
 
 
 class WordListsApi(object):
@@ -39,34 +40,8 @@ class WordListsApi(object):
         Returns: WordList
         """
 
-        allParams = ['body', 'auth_token']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method createWordList" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/wordLists.{format}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'POST'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('auth_token' in params):
-            headerParams['auth_token'] = params['auth_token']
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'WordList')
-        return responseObject
+        return self.apiClient.dispatch(byName['createWordList'], (auth_token,),
+                                       kwargs)
         
         
     
@@ -21,6 +21,8 @@ import sys
 import os
 
 from models import *
+from endpoints import byName
+import paging
 
 
 class WordsApi(object):
@@ -49,58 +51,7 @@ class WordsApi(object):
         Returns: WordSearchResults
         """
 
-        allParams = ['query', 'includePartOfSpeech', 'excludePartOfSpeech', 'caseSensitive', 'minCorpusCount', 'maxCorpusCount', 'minDictionaryCount', 'maxDictionaryCount', 'minLength', 'maxLength', 'skip', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method searchWords" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/words.{format}/search/{query}'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('caseSensitive' in params):
-            queryParams['caseSensitive'] = self.apiClient.toPathValue(params['caseSensitive'])
-        if ('includePartOfSpeech' in params):
-            queryParams['includePartOfSpeech'] = self.apiClient.toPathValue(params['includePartOfSpeech'])
-        if ('excludePartOfSpeech' in params):
-            queryParams['excludePartOfSpeech'] = self.apiClient.toPathValue(params['excludePartOfSpeech'])
-        if ('minCorpusCount' in params):
-            queryParams['minCorpusCount'] = self.apiClient.toPathValue(params['minCorpusCount'])
-        if ('maxCorpusCount' in params):
-            queryParams['maxCorpusCount'] = self.apiClient.toPathValue(params['maxCorpusCount'])
-        if ('minDictionaryCount' in params):
-            queryParams['minDictionaryCount'] = self.apiClient.toPathValue(params['minDictionaryCount'])
-        if ('maxDictionaryCount' in params):
-            queryParams['maxDictionaryCount'] = self.apiClient.toPathValue(params['maxDictionaryCount'])
-        if ('minLength' in params):
-            queryParams['minLength'] = self.apiClient.toPathValue(params['minLength'])
-        if ('maxLength' in params):
-            queryParams['maxLength'] = self.apiClient.toPathValue(params['maxLength'])
-        if ('skip' in params):
-            queryParams['skip'] = self.apiClient.toPathValue(params['skip'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        if ('query' in params):
-            replacement = str(self.apiClient.toPathValue(params['query']))
-            resourcePath = resourcePath.replace('{' + 'query' + '}',
-                                                replacement)
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'WordSearchResults')
-        return responseObject
+        return self.apiClient.dispatch(byName['searchWords'], (query,), kwargs)
         
         
     def getWordOfTheDay(self, **kwargs):
@@ -112,34 +63,7 @@ class WordsApi(object):
         Returns: WordOfTheDay
         """
 
-        allParams = ['date']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getWordOfTheDay" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/words.{format}/wordOfTheDay'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('date' in params):
-            queryParams['date'] = self.apiClient.toPathValue(params['date'])
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'WordOfTheDay')
-        return responseObject
+        return self.apiClient.dispatch(byName['getWordOfTheDay'], (), kwargs)
         
         
     def reverseDictionary(self, query, **kwargs):
@@ -166,64 +90,8 @@ class WordsApi(object):
         Returns: DefinitionSearchResults
         """
 
-        allParams = ['query', 'findSenseForWord', 'includeSourceDictionaries', 'excludeSourceDictionaries', 'includePartOfSpeech', 'excludePartOfSpeech', 'expandTerms', 'sortBy', 'sortOrder', 'minCorpusCount', 'maxCorpusCount', 'minLength', 'maxLength', 'includeTags', 'skip', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method reverseDictionary" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/words.{format}/reverseDictionary'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('query' in params):
-            queryParams['query'] = self.apiClient.toPathValue(params['query'])
-        if ('findSenseForWord' in params):
-            queryParams['findSenseForWord'] = self.apiClient.toPathValue(params['findSenseForWord'])
-        if ('includeSourceDictionaries' in params):
-            queryParams['includeSourceDictionaries'] = self.apiClient.toPathValue(params['includeSourceDictionaries'])
-        if ('excludeSourceDictionaries' in params):
-            queryParams['excludeSourceDictionaries'] = self.apiClient.toPathValue(params['excludeSourceDictionaries'])
-        if ('includePartOfSpeech' in params):
-            queryParams['includePartOfSpeech'] = self.apiClient.toPathValue(params['includePartOfSpeech'])
-        if ('excludePartOfSpeech' in params):
-            queryParams['excludePartOfSpeech'] = self.apiClient.toPathValue(params['excludePartOfSpeech'])
-        if ('minCorpusCount' in params):
-            queryParams['minCorpusCount'] = self.apiClient.toPathValue(params['minCorpusCount'])
-        if ('maxCorpusCount' in params):
-            queryParams['maxCorpusCount'] = self.apiClient.toPathValue(params['maxCorpusCount'])
-        if ('minLength' in params):
-            queryParams['minLength'] = self.apiClient.toPathValue(params['minLength'])
-        if ('maxLength' in params):
-            queryParams['maxLength'] = self.apiClient.toPathValue(params['maxLength'])
-        if ('expandTerms' in params):
-            queryParams['expandTerms'] = self.apiClient.toPathValue(params['expandTerms'])
-        if ('includeTags' in params):
-            queryParams['includeTags'] = self.apiClient.toPathValue(params['includeTags'])
-        if ('sortBy' in params):
-            queryParams['sortBy'] = self.apiClient.toPathValue(params['sortBy'])
-        if ('sortOrder' in params):
-            queryParams['sortOrder'] = self.apiClient.toPathValue(params['sortOrder'])
-        if ('skip' in params):
-            queryParams['skip'] = self.apiClient.toPathValue(params['skip'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'DefinitionSearchResults')
-        return responseObject
+        return self.apiClient.dispatch(byName['reverseDictionary'], (query,),
+                                       kwargs)
         
         
     def getRandomWords(self, **kwargs):
@@ -246,56 +114,7 @@ class WordsApi(object):
         Returns: list[WordObject]
         """
 
-        allParams = ['includePartOfSpeech', 'excludePartOfSpeech', 'sortBy', 'sortOrder', 'hasDictionaryDef', 'minCorpusCount', 'maxCorpusCount', 'minDictionaryCount', 'maxDictionaryCount', 'minLength', 'maxLength', 'limit']
-
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getRandomWords" % key)
-            params[key] = val
-        del params['kwargs']
-
-        resourcePath = '/words.{format}/randomWords'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
-
-        queryParams = {}
-        headerParams = {}
-
-        if ('hasDictionaryDef' in params):
-            queryParams['hasDictionaryDef'] = self.apiClient.toPathValue(params['hasDictionaryDef'])
-        if ('includePartOfSpeech' in params):
-            queryParams['includePartOfSpeech'] = self.apiClient.toPathValue(params['includePartOfSpeech'])
-        if ('excludePartOfSpeech' in params):
-            queryParams['excludePartOfSpeech'] = self.apiClient.toPathValue(params['excludePartOfSpeech'])
-        if ('minCorpusCount' in params):
-            queryParams['minCorpusCount'] = self.apiClient.toPathValue(params['minCorpusCount'])
-        if ('maxCorpusCount' in params):
-            queryParams['maxCorpusCount'] = self.apiClient.toPathValue(params['maxCorpusCount'])
-        if ('minDictionaryCount' in params):
-            queryParams['minDictionaryCount'] = self.apiClient.toPathValue(params['minDictionaryCount'])
-        if ('maxDictionaryCount' in params):
-            queryParams['maxDictionaryCount'] = self.apiClient.toPathValue(params['maxDictionaryCount'])
-        if ('minLength' in params):
-            queryParams['minLength'] = self.apiClient.toPathValue(params['minLength'])
-        if ('maxLength' in params):
-            queryParams['maxLength'] = self.apiClient.toPathValue(params['maxLength'])
-        if ('sortBy' in params):
-            queryParams['sortBy'] = self.apiClient.toPathValue(params['sortBy'])
-        if ('sortOrder' in params):
-            queryParams['sortOrder'] = self.apiClient.toPathValue(params['sortOrder'])
-        if ('limit' in params):
-            queryParams['limit'] = self.apiClient.toPathValue(params['limit'])
-        postData = (params['body'] if 'body' in params else None)
-
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
-
-        if not response:
-            return None
-
-        responseObject = self.apiClient.deserialize(response, 'list[WordObject]')
-        return responseObject
+        return self.apiClient.dispatch(byName['getRandomWords'], (), kwargs)
         
         
     def getRandomWord(self, **kwargs):
@@ -315,50 +134,63 @@ class WordsApi(object):
         Returns: WordObject
         """
 
-        allParams = ['includePartOfSpeech', 'excludePartOfSpeech', 'hasDictionaryDef', 'minCorpusCount', 'maxCorpusCount', 'minDictionaryCount', 'maxDictionaryCount', 'minLength', 'maxLength']
+        return self.apiClient.dispatch(byName['getRandomWord'], (), kwargs)
+        
+        
+    def iterSearchWords(self, query, pageSize=100, maxResults=None, maxWorkers=1, **kwargs):
+        """Iterate over every result of searchWords, fetching the next page in the background while the current one is consumed
+
+        Args:
+            query, str: Search query (required)
+            pageSize, int: Results to request per call (optional)
+            maxResults, int: Stop after this many results (optional)
+            maxWorkers, int: Once the first page has given totalResults, fetch the remaining pages on this many threads; results still come out in order (optional)
+            skip, int: Results to skip before the first one yielded (optional)
+            Any other keyword argument accepted by searchWords is passed on with every call.
+            
+        Returns: iterator of WordSearchResult
+        """
 
-        params = locals()
-        for (key, val) in params['kwargs'].iteritems():
-            if key not in allParams:
-                raise TypeError("Got an unexpected keyword argument '%s' to method getRandomWord" % key)
-            params[key] = val
-        del params['kwargs']
+        if 'limit' in kwargs:
+            raise TypeError("Use pageSize or maxResults instead of limit with method iterSearchWords")
+        skip = kwargs.pop('skip', 0)
 
-        resourcePath = '/words.{format}/randomWord'
-        resourcePath = resourcePath.replace('{format}', 'json')
-        method = 'GET'
+        def fetchPage(skip, limit):
+            return self.searchWords(query, skip=skip, limit=limit, **kwargs)
 
-        queryParams = {}
-        headerParams = {}
+        if maxWorkers > 1:
+            return paging.iterShards(self.apiClient, fetchPage, 'searchResults',
+                                     pageSize, skip, maxResults, maxWorkers)
+        return paging.iterPages(self.apiClient, fetchPage, 'searchResults', pageSize,
+                                skip, maxResults)
+        
+        
+    def iterReverseDictionary(self, query, pageSize=100, maxResults=None, maxWorkers=1, **kwargs):
+        """Iterate over every result of reverseDictionary, fetching the next page in the background while the current one is consumed
 
-        if ('hasDictionaryDef' in params):
-            queryParams['hasDictionaryDef'] = self.apiClient.toPathValue(params['hasDictionaryDef'])
-        if ('includePartOfSpeech' in params):
-            queryParams['includePartOfSpeech'] = self.apiClient.toPathValue(params['includePartOfSpeech'])
-        if ('excludePartOfSpeech' in params):
-            queryParams['excludePartOfSpeech'] = self.apiClient.toPathValue(params['excludePartOfSpeech'])
-        if ('minCorpusCount' in params):
-            queryParams['minCorpusCount'] = self.apiClient.toPathValue(params['minCorpusCount'])
-        if ('maxCorpusCount' in params):
-            queryParams['maxCorpusCount'] = self.apiClient.toPathValue(params['maxCorpusCount'])
-        if ('minDictionaryCount' in params):
-            queryParams['minDictionaryCount'] = self.apiClient.toPathValue(params['minDictionaryCount'])
-        if ('maxDictionaryCount' in params):
-            queryParams['maxDictionaryCount'] = self.apiClient.toPathValue(params['maxDictionaryCount'])
-        if ('minLength' in params):
-            queryParams['minLength'] = self.apiClient.toPathValue(params['minLength'])
-        if ('maxLength' in params):
-            queryParams['maxLength'] = self.apiClient.toPathValue(params['maxLength'])
-        postData = (params['body'] if 'body' in params else None)
+        Args:
+            query, str: Search term (required)
+            pageSize, int: Results to request per call (optional)
+            maxResults, int: Stop after this many results (optional)
+            maxWorkers, int: Once the first page has given totalResults, fetch the remaining pages on this many threads; results still come out in order (optional)
+            skip, int: Results to skip before the first one yielded (optional)
+            Any other keyword argument accepted by reverseDictionary is passed on with every call.
+            
+        Returns: iterator of Definition
+        """
 
-        response = self.apiClient.callAPI(resourcePath, method, queryParams,
-                                          postData, headerParams)
+        if 'limit' in kwargs:
+            raise TypeError("Use pageSize or maxResults instead of limit with method iterReverseDictionary")
+        skip = kwargs.pop('skip', 0)
 
-        if not response:
-            return None
+        def fetchPage(skip, limit):
+            return self.reverseDictionary(query, skip=skip, limit=limit, **kwargs)
 
-        responseObject = self.apiClient.deserialize(response, 'WordObject')
-        return responseObject
+        if maxWorkers > 1:
+            return paging.iterShards(self.apiClient, fetchPage, 'results',
+                                     pageSize, skip, maxResults, maxWorkers)
+        return paging.iterPages(self.apiClient, fetchPage, 'results', pageSize,
+                                skip, maxResults)
         
         
     
@@ -1,10 +1,33 @@
 #!/usr/bin/env python
-"""Add all of the modules in the current directory to __all__"""
-import os
+"""All of the modules in this package are listed in __all__. They are bound
+lazily (see `lazy`), so `from wordnik import *` imports none of them until
+they are used."""
 
-__all__ = []
+from lazy import bindLazily
 
-for module in os.listdir(os.path.dirname(__file__)):
-    if module != '__init__.py' and module[-3:] == '.py':
-        __all__.append(module[:-3])
+__all__ = [
+    'AccountApi',
+    'WordApi',
+    'WordListApi',
+    'WordListsApi',
+    'WordsApi',
+    'asyncapi',
+    'batch',
+    'cache',
+    'deserializer',
+    'diskcache',
+    'endpoints',
+    'jsoncodec',
+    'lazy',
+    'metrics',
+    'paging',
+    'ratelimit',
+    'retry',
+    'singleflight',
+    'stubserver',
+    'swagger',
+    'transport',
+    'wordprofile',
+]
 
+bindLazily(globals(), __name__, __all__)
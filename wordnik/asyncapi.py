@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Non-blocking variants of the generated Api classes.
+
+Every method of `AsyncWordApi`, `AsyncWordsApi`, `AsyncWordListApi`,
+`AsyncWordListsApi` and `AsyncAccountApi` takes the same arguments as its
+blocking counterpart, but returns immediately with an `AsyncResult`. The
+call itself runs on the bounded worker pool of an `AsyncApiClient`, over the
+client's shared keep-alive connections, so many lookups can be in flight at
+once:
+
+    client = asyncapi.AsyncApiClient(apiKey, apiUrl, maxWorkers=100)
+    wordApi = asyncapi.AsyncWordApi(client)
+    pending = [wordApi.getDefinitions(word) for word in words]
+    definitions = [result.get() for result in pending]
+
+`AsyncResult.get()` returns the same deserialized models as the blocking
+method, or re-raises its exception. A `callback` keyword argument may also be
+passed; it is called on a worker thread with the result on success.
+"""
+
+from multiprocessing.pool import ThreadPool
+
+import swagger
+from transport import ConnectionPool
+import WordApi
+import WordsApi
+import WordListApi
+import WordListsApi
+import AccountApi
+
+
+class AsyncApiClient(swagger.ApiClient):
+    """ApiClient that can also run calls in the background.
+
+    Args:
+        maxWorkers -- number of calls that may be in flight at once. The
+            default connection pool keeps this many connections alive.
+        Other keyword arguments are passed on to `swagger.ApiClient`.
+    """
+
+    def __init__(self, apiKey=None, apiServer=None, pool=None,
+                 maxWorkers=32, **kwargs):
+        if pool is None:
+            pool = ConnectionPool(maxSize=maxWorkers)
+        swagger.ApiClient.__init__(self, apiKey, apiServer, pool=pool,
+                                   **kwargs)
+        self.maxWorkers = maxWorkers
+        self.executor = ThreadPool(maxWorkers)
+
+    def submit(self, func, *args, **kwargs):
+        """Schedule `func(*args, **kwargs)` on the worker pool and return its
+        `AsyncResult`. An optional `callback` keyword argument is passed to
+        the pool rather than to `func`. Call options set with `options()` in
+        the submitting thread also apply to the call."""
+
+        callback = kwargs.pop('callback', None)
+        return self.executor.apply_async(self.withCurrentOptions(func), args,
+                                         kwargs, callback)
+
+    def close(self):
+        """Wait for pending calls to finish, then release the worker threads
+        and pooled connections."""
+
+        self.executor.close()
+        self.executor.join()
+        self.pool.close()
+
+
+def asyncApiClass(apiClass):
+    """Build the non-blocking counterpart of a generated Api class. Each of
+    its public methods is wrapped so that it is submitted to the client's
+    worker pool instead of being run in the caller's thread. Generators such
+    as the iter* helpers are left out, since they already stream."""
+
+    def __init__(self, apiClient):
+        self.apiClient = apiClient
+        self.api = apiClass(apiClient)
+
+    attrs = {'__init__': __init__,
+             '__doc__': 'Non-blocking version of %s; every method returns '
+                        'an AsyncResult.' % apiClass.__name__}
+    for name, func in vars(apiClass).items():
+        if (not name.startswith('_') and not name.startswith('iter') and
+                callable(func)):
+            attrs[name] = _asyncMethod(name, func)
+
+    return type('Async' + apiClass.__name__, (object,), attrs)
+
+
+def _asyncMethod(name, func):
+
+    def method(self, *args, **kwargs):
+        return self.apiClient.submit(getattr(self.api, name), *args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = func.__doc__
+    return method
+
+
+AsyncWordApi = asyncApiClass(WordApi.WordApi)
+AsyncWordsApi = asyncApiClass(WordsApi.WordsApi)
+AsyncWordListApi = asyncApiClass(WordListApi.WordListApi)
+AsyncWordListsApi = asyncApiClass(WordListsApi.WordListsApi)
+AsyncAccountApi = asyncApiClass(AccountApi.AccountApi)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""Helpers for running one API call per item over a bounded thread pool.
+Results are streamed back as they complete, and a failing item is recorded
+as a `BatchFailure` instead of aborting the rest of the batch."""
+
+import sys
+import Queue
+
+
+class BatchFailure:
+    """Stands in for the result of an item whose call raised.
+
+    Attributes:
+        item -- the input item, e.g. the word that was looked up
+        exception -- the exception raised by the call
+        excInfo -- the full sys.exc_info() tuple, including traceback
+    """
+
+    def __init__(self, item, excInfo):
+        self.item = item
+        self.exception = excInfo[1]
+        self.excInfo = excInfo
+
+    def __repr__(self):
+        return 'BatchFailure(%r, %r)' % (self.item, self.exception)
+
+
+# reraise(excInfo) raises a sys.exc_info() tuple caught on another thread
+# again, with its original traceback. The three-argument raise is Python 2
+# syntax, so it is compiled here rather than written out, which keeps the
+# module parseable by Python 3 tools.
+exec('def reraise(excInfo):\n'
+     '    raise excInfo[0], excInfo[1], excInfo[2]\n')
+
+
+def imapUnordered(func, items, maxWorkers=8, maxPending=None):
+    """Call `func(item)` for each of `items` on up to `maxWorkers` threads
+    and yield `(item, result)` pairs in completion order. `result` is a
+    `BatchFailure` when the call raised.
+
+    `items` is consumed lazily and at most `maxPending` calls (twice the
+    number of workers by default) are queued or running at any time, so
+    memory stays flat however long the input is."""
+
+    if maxPending is None:
+        maxPending = maxWorkers * 2
+    done = Queue.Queue()
+
+    def run(item):
+        try:
+            done.put((item, func(item)))
+        except Exception:
+            done.put((item, BatchFailure(item, sys.exc_info())))
+
+    # Imported here, as multiprocessing is slow to import and only needed
+    # once work is actually spread over threads
+    from multiprocessing.pool import ThreadPool
+    executor = ThreadPool(maxWorkers)
+    try:
+        pending = 0
+        for item in items:
+            executor.apply_async(run, (item,))
+            pending += 1
+            if pending >= maxPending:
+                yield done.get()
+                pending -= 1
+        while pending:
+            yield done.get()
+            pending -= 1
+    finally:
+        executor.terminate()
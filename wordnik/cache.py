@@ -0,0 +1,434 @@
+#!/usr/bin/env python
+"""Caching of GET responses: cache keys, the freshness rules shared by all
+cache backends, and an in-process LRU cache bounded by entry count and by
+bytes. See `diskcache` for a persistent backend."""
+
+import re
+import time
+import hashlib
+import urllib
+import email.utils
+import threading
+from collections import OrderedDict
+
+
+def cacheKey(resourcePath, queryParams=None, headerParams=None):
+    """Return the cache key for a GET request: the resource path with
+    duplicate and trailing slashes removed, followed by the non-None query
+    parameters in sorted order. Header parameters such as `auth_token` are
+    part of the key too, hashed, so one user's response is never served to
+    another and session tokens are not written to disk caches."""
+
+    path = re.sub('/+', '/', resourcePath).rstrip('/') or '/'
+    key = path
+    if queryParams:
+        params = sorted((k, v) for (k, v) in queryParams.iteritems()
+                        if v is not None)
+        if params:
+            key = key + '?' + urllib.urlencode(params)
+    tag = headerTag(headerParams)
+    if tag is not None:
+        key = key + '#' + tag
+    return key
+
+
+def headerTag(headerParams):
+    """Return the part of a cache key that stands for `headerParams`, a
+    hash of them, or None if there are none."""
+
+    if not headerParams:
+        return None
+    return hashlib.sha1(
+        urllib.urlencode(sorted(headerParams.iteritems()))).hexdigest()
+
+
+def resourceRoot(resourcePath):
+    """Return the path of the resource a request addresses, i.e. its first
+    two segments, e.g. '/wordList.json/my-list' for
+    '/wordList.json/my-list/words'."""
+
+    path = re.sub('/+', '/', resourcePath).rstrip('/') or '/'
+    return '/'.join(path.split('/')[:3])
+
+
+def splitKey(key):
+    """Return the path and the header tag (or None) of a cache key."""
+
+    key, sep, tag = key.partition('#')
+    return key.partition('?')[0], tag if sep else None
+
+
+def compileTemplate(template):
+    """Compile a resource path template such as
+    '/word.json/{word}/definitions' into a regex matching concrete paths."""
+
+    parts = re.split('(\{[^}]+\})', template)
+    pattern = ''.join('[^/]+' if part.startswith('{') else re.escape(part)
+                      for part in parts)
+    return re.compile(pattern + '$')
+
+
+class CacheEntry:
+    """A cached response: the decoded JSON `data`, the size in bytes of the
+    raw body it was decoded from, when it expires, the `ETag` and
+    `Last-Modified` validators the server sent with it, if any, for how
+    many seconds past its expiry its `Cache-Control` allows serving it while
+    it is revalidated, and until when it may be served stale."""
+
+    def __init__(self, data, size, storedAt, expiresAt, etag=None,
+                 lastModified=None, staleWhileRevalidate=0, staleUntil=None):
+        self.data = data
+        self.size = size
+        self.storedAt = storedAt
+        self.expiresAt = expiresAt
+        self.etag = etag
+        self.lastModified = lastModified
+        self.staleWhileRevalidate = staleWhileRevalidate
+        self.staleUntil = staleUntil if staleUntil is not None else expiresAt
+
+    def isFresh(self, now):
+        return now < self.expiresAt
+
+    def canRevalidate(self):
+        return self.etag is not None or self.lastModified is not None
+
+
+def validators(headers):
+    """Return the (ETag, Last-Modified) validators of a response's headers,
+    None for each that is missing."""
+
+    if headers is None:
+        return None, None
+    return headers.get('ETag'), headers.get('Last-Modified')
+
+
+def parseCacheControl(value):
+    """Return the directives of a `Cache-Control` header as a dict of their
+    lowercased names to their values, or to True for those without one."""
+
+    directives = {}
+    for part in (value or '').split(','):
+        name, equals, arg = part.partition('=')
+        name = name.strip().lower()
+        if name:
+            directives[name] = arg.strip().strip('"') if equals else True
+    return directives
+
+
+def parseSeconds(value):
+    """Return a directive's delta-seconds value, or None if it is not a
+    number."""
+
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parseHttpDate(value):
+    """Return an HTTP date header's value as a timestamp, or None."""
+
+    parsed = email.utils.parsedate_tz(value) if value else None
+    if parsed is None:
+        return None
+    return email.utils.mktime_tz(parsed)
+
+
+class CachePolicy:
+    """What a response's `Cache-Control`, `Expires`, `Date` and `Age`
+    headers allow a cache to do with it.
+
+    Attributes:
+        noStore -- True if the response must not be cached at all
+        private -- True if only a cache serving a single user may keep it
+        maxAge -- seconds the response stays fresh for, counted from when
+            it was received, or None if the headers do not say
+        staleWhileRevalidate -- seconds past its expiry during which the
+            response may still be served while it is revalidated
+    """
+
+    def __init__(self, headers, now):
+        directives = parseCacheControl(
+            headers.get('Cache-Control') if headers is not None else None)
+        self.noStore = 'no-store' in directives
+        self.private = 'private' in directives
+        self.staleWhileRevalidate = parseSeconds(
+            directives.get('stale-while-revalidate')) or 0
+
+        maxAge = parseSeconds(directives.get('max-age'))
+        if maxAge is None and 'no-cache' in directives:
+            maxAge = 0
+        if maxAge is None and headers is not None and 'Expires' in headers:
+            # Measured against the server's clock where possible, so that
+            # clock skew does not matter. An invalid date means already
+            # expired.
+            expires = parseHttpDate(headers.get('Expires'))
+            date = parseHttpDate(headers.get('Date'))
+            if expires is None:
+                maxAge = 0
+            else:
+                maxAge = max(expires - (date if date is not None else now), 0)
+        if maxAge is not None and headers is not None:
+            # Time the response already spent in caches along the way
+            maxAge = max(maxAge - (parseSeconds(headers.get('Age')) or 0), 0)
+        self.maxAge = maxAge
+
+
+def conditionalHeaders(etag, lastModified):
+    """Return the request headers asking the server to answer 304 Not
+    Modified if a response with these validators is still current."""
+
+    headers = {}
+    if etag is not None:
+        headers['If-None-Match'] = etag
+    if lastModified is not None:
+        headers['If-Modified-Since'] = lastModified
+    return headers
+
+
+class BaseCache:
+    """Behaviour shared by the response cache backends. A backend stores
+    responses with `set(key, data, body, resourcePath, headers)` and returns
+    fresh `CacheEntry` objects from `get(key)`.
+
+    How long a response stays fresh follows its `Cache-Control: max-age`
+    or `Expires` header, unless its endpoint has a TTL of its own; the
+    default TTL applies to responses that say neither. Responses marked
+    `no-store` are never cached, nor are `private` ones in a shared cache.
+
+    Expired entries that came with an `ETag` or `Last-Modified` validator
+    are kept until evicted, so that they can be revalidated:
+    `conditionalHeaders(key)` returns the headers for a conditional GET,
+    and `refresh(key, resourcePath, headers)` renews the entry when the
+    server answers 304 Not Modified.
+
+    Expired entries are also kept for a grace period, during which
+    `get(key, stale=True)` still returns them, so that a client can answer
+    with one at once and refresh it in the background. If that refresh
+    fails, `keepStale(key)` lets the entry be served for up to `maxStale`
+    seconds past its expiry.
+
+    Args:
+        ttl -- default time to live of an entry, in seconds
+        endpointTtls -- dict of resource path templates, e.g.
+            '/word.json/{word}/definitions', to the TTL for that endpoint,
+            which overrides the response headers. A TTL of 0 disables
+            caching for the endpoint.
+        shared -- True if the cache serves several users, so must not
+            keep responses marked `private`
+        grace -- seconds past its expiry during which an entry may still
+            be served stale; a response's `stale-while-revalidate` can
+            lengthen it
+        maxStale -- hard cap on how long past its expiry an entry is ever
+            served, however often refreshing it fails
+    """
+
+    def __init__(self, ttl, endpointTtls=None, shared=False, grace=60,
+                 maxStale=3600):
+        self.ttl = ttl
+        self.endpointTtls = [(compileTemplate(template), endpointTtl)
+                             for (template, endpointTtl)
+                             in (endpointTtls or {}).iteritems()]
+        self.shared = shared
+        self.grace = grace
+        self.maxStale = maxStale
+        self.clock = time.time
+
+    def ttlFor(self, resourcePath):
+        """Return the TTL configured for a concrete resource path."""
+
+        endpointTtl = self._endpointTtl(resourcePath)
+        return endpointTtl if endpointTtl is not None else self.ttl
+
+    def lifetime(self, resourcePath, policy, default=None):
+        """Return for how many seconds a response for `resourcePath` with
+        the `CachePolicy` `policy` stays fresh, or None if it must not be
+        cached. `default` replaces the default TTL, e.g. with the previous
+        lifetime of an entry being revalidated; like a `max-age` of 0, a
+        default of 0 means the entry is kept but always revalidated."""
+
+        if policy.noStore or (policy.private and self.shared):
+            return None
+        ttl = self._endpointTtl(resourcePath)
+        if ttl is None:
+            if policy.maxAge is not None:
+                return policy.maxAge
+            if default is not None:
+                return default
+            ttl = self.ttl
+        return ttl if ttl > 0 else None
+
+    def staleUntil(self, expiresAt, staleWhileRevalidate):
+        """Return until when an entry expiring at `expiresAt` may be served
+        stale."""
+
+        return expiresAt + min(max(self.grace, staleWhileRevalidate),
+                               self.maxStale)
+
+    def _endpointTtl(self, resourcePath):
+        for (pattern, endpointTtl) in self.endpointTtls:
+            if pattern.match(resourcePath):
+                return endpointTtl
+        return None
+
+
+class ResponseCache(BaseCache):
+    """Thread-safe in-memory LRU cache of decoded GET responses.
+
+    Args:
+        maxEntries -- maximum number of cached responses
+        maxBytes -- maximum total size of the cached raw response bodies
+        ttl, endpointTtls, shared, grace, maxStale -- see `BaseCache`
+    """
+
+    def __init__(self, maxEntries=10000, maxBytes=64 * 1024 * 1024, ttl=300,
+                 endpointTtls=None, shared=False, grace=60, maxStale=3600):
+        BaseCache.__init__(self, ttl, endpointTtls, shared, grace, maxStale)
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0,
+                       'evictions': 0, 'expirations': 0, 'revalidations': 0,
+                       'staleHits': 0}
+
+    def get(self, key, stale=False):
+        """Return the fresh `CacheEntry` stored under `key`, or None. With
+        `stale`, an expired entry that may still be served stale is
+        returned too."""
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            now = self.clock()
+            if not entry.isFresh(now):
+                servable = now < entry.staleUntil
+                if servable or entry.canRevalidate():
+                    self._entries[key] = entry
+                else:
+                    self._bytes -= entry.size
+                if stale and servable:
+                    self._stats['staleHits'] += 1
+                    return entry
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+            self._entries[key] = entry  # most recently used
+            self._stats['hits'] += 1
+            return entry
+
+    def conditionalHeaders(self, key):
+        """Return the headers for revalidating the entry stored under `key`,
+        or an empty dict if there is none or it has no validators."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        return conditionalHeaders(entry.etag, entry.lastModified)
+
+    def keepStale(self, key):
+        """Let the entry stored under `key`, whose refresh failed, be served
+        stale for up to `maxStale` seconds past its expiry."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.staleUntil = max(entry.staleUntil,
+                                       entry.expiresAt + self.maxStale)
+
+    def refresh(self, key, resourcePath, headers=None):
+        """Renew the entry stored under `key` after the server answered 304
+        Not Modified with `headers`, and return it; None if it has been
+        evicted in the meantime. Its decoded data is reused as it is."""
+
+        etag, lastModified = validators(headers)
+        now = self.clock()
+        policy = CachePolicy(headers, now)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._stats['revalidations'] += 1
+            ttl = self.lifetime(resourcePath, policy,
+                                entry.expiresAt - entry.storedAt)
+            if ttl is None:
+                self._bytes -= entry.size
+                return entry  # still current, but no longer cacheable
+            entry.storedAt = now
+            entry.expiresAt = now + ttl
+            if etag is not None:
+                entry.etag = etag
+            if lastModified is not None:
+                entry.lastModified = lastModified
+            if policy.maxAge is not None:
+                entry.staleWhileRevalidate = policy.staleWhileRevalidate
+            entry.staleUntil = self.staleUntil(entry.expiresAt,
+                                               entry.staleWhileRevalidate)
+            self._entries[key] = entry
+            return entry
+
+    def set(self, key, data, body, resourcePath, headers=None):
+        """Cache the decoded `data` of the raw response `body` returned for
+        `resourcePath` with `headers`, unless they or its endpoint's TTL
+        forbid it or it could never fit."""
+
+        size = len(body)
+        now = self.clock()
+        policy = CachePolicy(headers, now)
+        ttl = self.lifetime(resourcePath, policy)
+        etag, lastModified = validators(headers)
+        if (ttl is None or size > self.maxBytes or
+                (ttl == 0 and etag is None and lastModified is None)):
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = CacheEntry(
+                data, size, now, now + ttl, etag, lastModified,
+                policy.staleWhileRevalidate,
+                self.staleUntil(now + ttl, policy.staleWhileRevalidate))
+            self._bytes += size
+            self._stats['stores'] += 1
+            while (len(self._entries) > self.maxEntries or
+                   self._bytes > self.maxBytes):
+                oldKey, oldest = self._entries.popitem(last=False)
+                self._bytes -= oldest.size
+                self._stats['evictions'] += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def invalidateUnder(self, path, tag=None):
+        """Drop the entries for `path` and the paths below it, plus, if
+        `tag` is given, every entry fetched with that header tag."""
+
+        with self._lock:
+            for key in self._entries.keys():
+                keyPath, keyTag = splitKey(key)
+                if (keyPath == path or keyPath.startswith(path + '/') or
+                        (tag is not None and keyTag == tag)):
+                    self._bytes -= self._entries.pop(key).size
+
+    def clear(self):
+        with self._lock:
+            self._entries = OrderedDict()
+            self._bytes = 0
+
+    def stats(self):
+        """Return a snapshot of the hit/miss/eviction counters and the
+        current size of the cache."""
+
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+        return stats
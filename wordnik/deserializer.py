@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+"""Precompiled deserializers for the Swagger type strings used by the
+generated Api classes, such as 'Definition', 'list[Definition]' or 'long'.
+
+The first time a type is seen it is compiled into a converter function: the
+model class is looked up once, each field's type is resolved to its own
+converter, and list element types are unwrapped. Converters are cached, so
+deserializing a response is plain dict access and function calls.
+
+There is a separate set of converters for each mode:
+    model -- builds model objects, coercing every field
+    namedtuple -- builds namedtuples, leaving field values as decoded
+    lazy -- builds model objects whose nested list[...] and model-typed
+        fields are only converted the first time they are read
+"""
+
+import re
+import datetime
+import threading
+from collections import namedtuple
+
+from models import *
+
+
+# Server timestamps always end in a '+0000' UTC offset, which strptime can't
+# parse, so the last 5 characters are dropped.
+timestampFormat = '%Y-%m-%dT%H:%M:%S.%f'
+
+listType = re.compile('list\[(.*)\]$')
+
+modes = ('model', 'namedtuple', 'lazy')
+
+# Converters ready for use, read without locking. A model's converter is
+# registered before its fields are compiled, so that models can refer to
+# themselves; until the outermost compile is over, new converters are kept
+# in _building, where only the compiling thread (holding the lock) sees
+# them.
+_converters = dict((mode, {}) for mode in modes)
+_building = dict((mode, {}) for mode in modes)
+_depth = [0]
+_lock = threading.RLock()
+
+
+def converterFor(objClass, mode='model'):
+    """Return the cached `mode` converter for `objClass`, a type string or a
+    class literal, compiling it first if needed."""
+
+    try:
+        return _converters[mode][objClass]
+    except KeyError:
+        pass
+    with _lock:
+        for converters in (_converters[mode], _building[mode]):
+            if objClass in converters:
+                return converters[objClass]
+        _depth[0] += 1
+        compiled = False
+        try:
+            _compile(objClass, mode)
+            converter = _building[mode][objClass]
+            compiled = True
+        finally:
+            _depth[0] -= 1
+            if not _depth[0]:
+                # Publish everything the outermost compile built, or drop
+                # it if the compile failed part way.
+                for (buildMode, building) in _building.iteritems():
+                    if compiled:
+                        _converters[buildMode].update(building)
+                    building.clear()
+        return converter
+
+
+def deserialize(obj, objClass, mode='model'):
+    """Deserialize decoded JSON `obj` into an instance of `objClass`."""
+
+    return converterFor(objClass, mode)(obj)
+
+
+def modelClass(name):
+    """Return the model class called `name`."""
+
+    return getattr(globals()[name], name)
+
+
+def toStr(value):
+    if type(value) is unicode:
+        try:
+            return str(value)
+        except UnicodeEncodeError:
+            return value
+    if value is None or type(value) is str:
+        return value
+    return str(value)
+
+
+def toDatetime(value):
+    return datetime.datetime.strptime(value[:-5], timestampFormat)
+
+
+def identity(value):
+    return value
+
+
+# Converters for top-level native types; these match the historical
+# behaviour of ApiClient.deserialize, which returned strings untouched.
+nativeConverters = {
+    'str': identity,
+    'int': int,
+    'long': long,
+    'float': float,
+    'bool': bool,
+    'dict': dict,
+    'list': list,
+    'datetime': toDatetime,
+}
+
+# Converters for model fields of native types
+fieldConverters = {
+    'str': toStr,
+    'int': int,
+    'long': long,
+    'float': float,
+    'bool': bool,
+    'datetime': toDatetime,
+}
+
+
+class LazyField(object):
+    """Descriptor for a nested field of a lazily deserialized model. The
+    field's slot stays empty until it is first read; it is then filled from
+    the decoded JSON kept on the instance."""
+
+    __slots__ = ('attr', 'slot', 'convert')
+
+    def __init__(self, attr, slot, convert):
+        self.attr = attr
+        self.slot = slot  # the model class's own slot descriptor
+        self.convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        raw = instance._raw
+        value = self.convert(raw[self.attr]) if self.attr in raw else None
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+def _compile(objClass, mode):
+    """Build the `mode` converter for `objClass` and store it in
+    `_building`. Must be called with the lock held."""
+
+    converters = _building[mode]
+    if not isinstance(objClass, basestring):
+        if objClass is datetime or objClass is datetime.datetime:
+            name = 'datetime'
+        else:
+            name = objClass.__name__
+        converters[objClass] = converterFor(name, mode)
+        return
+
+    match = listType.match(objClass)
+    if match:
+        convert = converterFor(match.group(1), mode)
+        if mode == 'namedtuple' and convert is identity:
+            converters[objClass] = identity
+        else:
+            converters[objClass] = _listConverter(convert)
+    elif objClass in nativeConverters:
+        if mode == 'namedtuple':
+            converters[objClass] = identity
+        else:
+            converters[objClass] = nativeConverters[objClass]
+    elif mode == 'namedtuple':
+        _compileTupleModel(objClass)
+    elif mode == 'lazy':
+        _compileLazyModel(objClass)
+    else:
+        _compileModel(objClass)
+
+
+def _listConverter(convert):
+
+    def convertList(obj):
+        return [convert(item) for item in obj]
+
+    return convertList
+
+
+def _fieldConverter(attrType, mode):
+    """Return the converter for a model field of type `attrType`. None
+    values are left as None, and an empty or missing list becomes []."""
+
+    match = listType.match(attrType)
+    if match:
+        convert = converterFor(match.group(1), mode)
+
+        def convertList(value):
+            if not value:
+                return []
+            return [convert(item) for item in value]
+
+        return convertList
+
+    convert = fieldConverters.get(attrType)
+    if convert is toStr:
+        return toStr  # handles None itself
+    if convert is None:
+        convert = converterFor(attrType, mode)
+
+    def convertValue(value):
+        if value is None:
+            return None
+        return convert(value)
+
+    return convertValue
+
+
+def _isNested(attrType):
+    return attrType not in fieldConverters
+
+
+def _compileModel(name):
+    cls = modelClass(name)
+    fields = []
+
+    def convertModel(obj):
+        instance = cls()
+        for (attr, convert) in fields:
+            if attr in obj:
+                setattr(instance, attr, convert(obj[attr]))
+        return instance
+
+    # Register before compiling the fields, so that a model can refer to
+    # itself.
+    _building['model'][name] = convertModel
+    for (attr, attrType) in cls.swaggerTypes.iteritems():
+        fields.append((attr, _fieldConverter(attrType, 'model')))
+
+
+def _compileTupleModel(name):
+    cls = modelClass(name)
+    attrs = list(cls.__slots__)
+    tupleClass = namedtuple(name, attrs)
+    fields = []
+
+    def convertModel(obj):
+        get = obj.get
+        values = []
+        for (attr, convert) in fields:
+            value = get(attr)
+            if value is not None and convert is not identity:
+                value = convert(value)
+            values.append(value)
+        return tupleClass(*values)
+
+    _building['namedtuple'][name] = convertModel
+    for attr in attrs:
+        fields.append((attr, converterFor(cls.swaggerTypes[attr],
+                                          'namedtuple')))
+
+
+def _compileLazyModel(name):
+    """Compile a lazy converter, which builds instances of a subclass of
+    the model. The subclass keeps the decoded JSON in `_raw` and overrides
+    each nested field with a `LazyField`; plain fields are converted up
+    front as usual."""
+
+    cls = modelClass(name)
+    fields = []
+    attrs = {'__slots__': ('_raw',)}
+
+    def convertModel(obj):
+        instance = lazyClass.__new__(lazyClass)
+        for (attr, convert) in fields:
+            if attr in obj:
+                setattr(instance, attr, convert(obj[attr]))
+            else:
+                setattr(instance, attr, None)
+        instance._raw = obj
+        return instance
+
+    _building['lazy'][name] = convertModel
+    for (attr, attrType) in cls.swaggerTypes.iteritems():
+        convert = _fieldConverter(attrType, 'lazy')
+        if _isNested(attrType):
+            attrs[attr] = LazyField(attr, cls.__dict__[attr], convert)
+        else:
+            fields.append((attr, convert))
+    lazyClass = type('Lazy' + name, (cls,), attrs)
@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+"""Persistent response cache backed by a local SQLite file, so that raw JSON
+responses survive between runs and can be shared by several processes.
+
+The cache file can be compacted from the command line:
+
+    python -m wordnik.diskcache /path/to/cache.sqlite vacuum
+"""
+
+import sys
+import sqlite3
+import threading
+
+from cache import (BaseCache, CacheEntry, CachePolicy, validators,
+                   conditionalHeaders)
+import jsoncodec
+
+
+class DiskCache(BaseCache):
+    """SQLite-backed cache of raw GET response bodies.
+
+    The database runs in WAL mode, so any number of readers (threads or
+    processes) can use it while one of them writes. Entries expire after
+    their TTL, and once the stored bodies grow past `maxBytes` the least
+    recently used entries are evicted.
+
+    Args:
+        path -- file name of the SQLite database; created if missing
+        maxBytes -- cap on the total size of the stored bodies
+        ttl, endpointTtls -- see `cache.BaseCache`. Dictionary content
+            changes rarely, so the default TTL is a week.
+        shared -- see `cache.BaseCache`. The file may outlive the session
+            and be read by other processes, so by default responses marked
+            `private` are not written to it.
+        grace, maxStale -- see `cache.BaseCache`
+        timeout -- seconds to wait for another writer's lock
+        touchInterval -- seconds within which repeated hits on an entry do
+            not update its last access time again. Recording every hit
+            would make each read a write transaction, serializing the
+            processes sharing the file; eviction order is only that coarse.
+        jsonBackend -- name of the `jsoncodec` backend that decodes the
+            stored bodies; the fastest installed one by default
+    """
+
+    def __init__(self, path, maxBytes=1024 * 1024 * 1024, ttl=7 * 86400,
+                 endpointTtls=None, shared=True, grace=60, maxStale=3600,
+                 timeout=30.0, jsonBackend=None, touchInterval=60.0):
+        BaseCache.__init__(self, ttl, endpointTtls, shared, grace, maxStale)
+        self.path = path
+        self.maxBytes = maxBytes
+        self.timeout = timeout
+        self.touchInterval = touchInterval
+        self.json = jsoncodec.backend(jsonBackend)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0,
+                       'evictions': 0, 'expirations': 0, 'revalidations': 0,
+                       'staleHits': 0}
+
+        db = self._db()
+        with db:
+            db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                       'key TEXT PRIMARY KEY, body BLOB NOT NULL, '
+                       'size INTEGER NOT NULL, storedAt REAL NOT NULL, '
+                       'expiresAt REAL NOT NULL, accessedAt REAL NOT NULL)')
+            db.execute('CREATE INDEX IF NOT EXISTS responsesAccessedAt '
+                       'ON responses (accessedAt)')
+            db.execute('CREATE INDEX IF NOT EXISTS responsesExpiresAt '
+                       'ON responses (expiresAt)')
+            # Files written by earlier versions lack the later columns
+            columns = [row[1] for row
+                       in db.execute('PRAGMA table_info(responses)')]
+            for (column, definition) in [
+                    ('etag', 'TEXT'), ('lastModified', 'TEXT'),
+                    ('staleWhileRevalidate', 'REAL NOT NULL DEFAULT 0'),
+                    ('staleUntil', 'REAL NOT NULL DEFAULT 0')]:
+                if column not in columns:
+                    db.execute('ALTER TABLE responses ADD COLUMN %s %s'
+                               % (column, definition))
+        # Running total of the stored bytes, so that the size cap can be
+        # checked without summing the table on every write. Other processes
+        # sharing the file make it approximate; it is recomputed whenever
+        # the cap is hit.
+        self._bytes = self._totalBytes()
+
+    def get(self, key, stale=False):
+        """Return the fresh `CacheEntry` stored under `key`, or None. With
+        `stale`, an expired entry that may still be served stale is
+        returned too."""
+
+        db = self._db()
+        row = db.execute('SELECT body, size, storedAt, expiresAt, etag, '
+                         'lastModified, staleWhileRevalidate, staleUntil, '
+                         'accessedAt FROM responses WHERE key = ?',
+                         (key,)).fetchone()
+        now = self.clock()
+        if row is None:
+            self._count('misses')
+            return None
+        body, size, storedAt, expiresAt = row[:4]
+        if now >= expiresAt:
+            if not (stale and now < row[7]):
+                self._count('expirations')
+                self._count('misses')
+                return None
+            self._count('staleHits')
+        else:
+            self._count('hits')
+        if now - row[8] >= self.touchInterval:
+            with db:
+                db.execute('UPDATE responses SET accessedAt = ? WHERE key = ?',
+                           (now, key))
+        return CacheEntry(self.json.loads(str(body)) if body else None, size,
+                          storedAt, expiresAt, *row[4:8])
+
+    def conditionalHeaders(self, key):
+        """Return the headers for revalidating the entry stored under `key`,
+        or an empty dict if there is none or it has no validators."""
+
+        row = self._db().execute('SELECT etag, lastModified FROM responses '
+                                 'WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return {}
+        return conditionalHeaders(*row)
+
+    def keepStale(self, key):
+        """Let the entry stored under `key`, whose refresh failed, be served
+        stale for up to `maxStale` seconds past its expiry."""
+
+        db = self._db()
+        with db:
+            db.execute('UPDATE responses SET staleUntil = '
+                       'MAX(staleUntil, expiresAt + ?) WHERE key = ?',
+                       (self.maxStale, key))
+
+    def refresh(self, key, resourcePath, headers=None):
+        """Renew the entry stored under `key` after the server answered 304
+        Not Modified with `headers`, and return it; None if it has been
+        evicted in the meantime. The stored body is decoded again, as only
+        the raw bytes are kept on disk."""
+
+        etag, lastModified = validators(headers)
+        now = self.clock()
+        policy = CachePolicy(headers, now)
+        db = self._db()
+        with db:
+            row = db.execute('SELECT body, size, storedAt, expiresAt, etag, '
+                             'lastModified, staleWhileRevalidate, staleUntil '
+                             'FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            body, size, storedAt, expiresAt = row[:4]
+            entry = CacheEntry(self.json.loads(str(body)) if body else None,
+                               size, storedAt, expiresAt, *row[4:])
+            ttl = self.lifetime(resourcePath, policy, expiresAt - storedAt)
+            if ttl is None:
+                db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            else:
+                entry.storedAt = now
+                entry.expiresAt = now + ttl
+                if etag is not None:
+                    entry.etag = etag
+                if lastModified is not None:
+                    entry.lastModified = lastModified
+                if policy.maxAge is not None:
+                    entry.staleWhileRevalidate = policy.staleWhileRevalidate
+                entry.staleUntil = self.staleUntil(entry.expiresAt,
+                                                   entry.staleWhileRevalidate)
+                db.execute('UPDATE responses SET storedAt = ?, expiresAt = ?, '
+                           'accessedAt = ?, etag = ?, lastModified = ?, '
+                           'staleWhileRevalidate = ?, staleUntil = ? '
+                           'WHERE key = ?',
+                           (now, entry.expiresAt, now, entry.etag,
+                            entry.lastModified, entry.staleWhileRevalidate,
+                            entry.staleUntil, key))
+        self._count('revalidations')
+        if ttl is None:
+            self._resync()
+        return entry
+
+    def set(self, key, data, body, resourcePath, headers=None):
+        """Store the raw response `body` returned for `resourcePath` with
+        `headers`, unless they or its endpoint's TTL forbid it or it could
+        never fit."""
+
+        size = len(body)
+        now = self.clock()
+        policy = CachePolicy(headers, now)
+        ttl = self.lifetime(resourcePath, policy)
+        etag, lastModified = validators(headers)
+        if (ttl is None or size > self.maxBytes or
+                (ttl == 0 and etag is None and lastModified is None)):
+            return
+        db = self._db()
+        with db:
+            old = db.execute('SELECT size FROM responses WHERE key = ?',
+                             (key,)).fetchone()
+            db.execute('INSERT OR REPLACE INTO responses '
+                       '(key, body, size, storedAt, expiresAt, accessedAt, '
+                       'etag, lastModified, staleWhileRevalidate, staleUntil) '
+                       'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                       (key, sqlite3.Binary(body), size, now, now + ttl, now,
+                        etag, lastModified, policy.staleWhileRevalidate,
+                        self.staleUntil(now + ttl,
+                                        policy.staleWhileRevalidate)))
+        self._count('stores')
+        with self._lock:
+            self._bytes += size - (old[0] if old else 0)
+            overCap = self._bytes > self.maxBytes
+        if overCap:
+            self._evict()
+
+    def invalidate(self, key):
+        db = self._db()
+        with db:
+            db.execute('DELETE FROM responses WHERE key = ?', (key,))
+        self._resync()
+
+    def invalidateUnder(self, path, tag=None):
+        """Delete the entries for `path` and the paths below it, plus, if
+        `tag` is given, every entry fetched with that header tag."""
+
+        # Compared with substr() rather than LIKE, whose wildcards may
+        # occur in paths
+        query = ('DELETE FROM responses WHERE key = ? '
+                 'OR substr(key, 1, ?) IN (?, ?, ?)')
+        args = [path, len(path) + 1, path + '/', path + '?', path + '#']
+        if tag is not None:
+            query += ' OR substr(key, -?) = ?'
+            args += [len(tag) + 1, '#' + tag]
+        db = self._db()
+        with db:
+            db.execute(query, args)
+        self._resync()
+
+    def clear(self):
+        db = self._db()
+        with db:
+            db.execute('DELETE FROM responses')
+        self._resync()
+
+    def purgeExpired(self):
+        """Delete every expired entry, including those that could still be
+        served stale. Returns the number deleted."""
+
+        db = self._db()
+        with db:
+            deleted = db.execute('DELETE FROM responses WHERE expiresAt <= ?',
+                                 (self.clock(),)).rowcount
+        self._resync()
+        return deleted
+
+    def vacuum(self):
+        """Purge expired entries, then compact the database file and
+        truncate its write-ahead log."""
+
+        self.purgeExpired()
+        db = self._db()
+        db.execute('VACUUM')
+        db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def stats(self):
+        """Return a snapshot of the hit/miss/eviction counters and the
+        current size of the cache."""
+
+        entries = self._db().execute(
+            'SELECT COUNT(*) FROM responses').fetchone()[0]
+        with self._lock:
+            stats = dict(self._stats)
+            stats['bytes'] = self._bytes
+        stats['entries'] = entries
+        return stats
+
+    def _evict(self):
+        """Delete least recently used entries until the cache is back under
+        `maxBytes`."""
+
+        db = self._db()
+        total = self._resync()
+        while total > self.maxBytes:
+            rows = db.execute('SELECT key, size FROM responses '
+                              'ORDER BY accessedAt LIMIT 100').fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, size in rows:
+                victims.append((key,))
+                total -= size
+                if total <= self.maxBytes:
+                    break
+            with db:
+                db.executemany('DELETE FROM responses WHERE key = ?', victims)
+            self._count('evictions', len(victims))
+        self._resync()
+
+    def _totalBytes(self):
+        return self._db().execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def _resync(self):
+        total = self._totalBytes()
+        with self._lock:
+            self._bytes = total
+        return total
+
+    def _db(self):
+        """Return this thread's connection; SQLite connections cannot be
+        shared between threads."""
+
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.timeout)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db = db
+        return db
+
+    def _count(self, stat, amount=1):
+        with self._lock:
+            self._stats[stat] += amount
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[2] not in ('vacuum', 'purge', 'stats'):
+        sys.exit('usage: python -m wordnik.diskcache PATH vacuum|purge|stats')
+    diskCache = DiskCache(sys.argv[1])
+    command = sys.argv[2]
+    if command == 'vacuum':
+        diskCache.vacuum()
+    elif command == 'purge':
+        sys.stdout.write('%d expired entries deleted\n' %
+                         diskCache.purgeExpired())
+    else:
+        stats = diskCache.stats()
+        sys.stdout.write('%d entries, %d bytes\n' % (stats['entries'],
+                                                     stats['bytes']))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""Spec table of the endpoints behind the generated Api methods. Each
+method hands its arguments to `ApiClient.dispatch` along with its
+`Endpoint`, which says how they map onto the request and what the response
+deserializes to."""
+
+import re
+
+
+class Endpoint(object):
+    """How one Api method's arguments become a request.
+
+    Args:
+        name -- name of the Api method
+        method -- HTTP method
+        template -- resource path template, e.g. '/word.{format}/{word}'
+        params -- names of the method's positional arguments, in order
+        query -- arguments sent as query parameters
+        headers -- arguments sent as headers
+        body -- True if the method takes a `body` to send as JSON
+        returns -- type the response deserializes to, or None if the
+            method returns nothing
+    """
+
+    __slots__ = ('name', 'method', 'template', 'path', 'pathParams',
+                 'positional', 'kinds', 'returns')
+
+    def __init__(self, name, method, template, params=(), query=(),
+                 headers=(), body=False, returns=None):
+        self.name = name
+        self.method = method
+        # The template the path is keyed by, e.g. in `cache.BaseCache`
+        # and `metrics.Metrics`
+        self.template = template.replace('{format}', 'json')
+        # Precompiled: the path as a format string taking the path
+        # parameters in order, e.g. '/word.json/%s/definitions'
+        parts = re.split('\{(\w+)\}', self.template)
+        self.pathParams = tuple(parts[1::2])
+        if self.pathParams:
+            self.path = '%s'.join(part.replace('%', '%%')
+                                  for part in parts[::2])
+        else:
+            self.path = self.template
+        # What each argument is sent as: 'path', 'query', 'header' or
+        # 'body'. Positional arguments are looked up by position, keyword
+        # arguments by name.
+        self.kinds = dict([(param, 'query') for param in query] +
+                          [(param, 'header') for param in headers] +
+                          ([('body', 'body')] if body else []) +
+                          [(param, 'path') for param in self.pathParams])
+        self.positional = tuple((param, self.kinds[param])
+                                for param in params)
+        self.returns = returns
+
+    def __repr__(self):
+        return '<Endpoint %s %s %s>' % (self.name, self.method, self.template)
+
+
+table = [
+    # AccountApi
+    Endpoint('authenticate', 'GET',
+             '/account.{format}/authenticate/{username}',
+             ['username', 'password'], query=['password'],
+             returns='AuthenticationToken'),
+    Endpoint('authenticatePost', 'POST',
+             '/account.{format}/authenticate/{username}', ['username', 'body'],
+             body=True, returns='AuthenticationToken'),
+    Endpoint('getWordListsForLoggedInUser', 'GET',
+             '/account.{format}/wordLists', ['auth_token'],
+             query=['skip', 'limit'], headers=['auth_token'],
+             returns='list[WordList]'),
+    Endpoint('getApiTokenStatus', 'GET', '/account.{format}/apiTokenStatus',
+             headers=['api_key'], returns='ApiTokenStatus'),
+    Endpoint('getLoggedInUser', 'GET', '/account.{format}/user',
+             ['auth_token'], headers=['auth_token'], returns='User'),
+
+    # WordApi
+    Endpoint('getExamples', 'GET', '/word.{format}/{word}/examples',
+             ['word'],
+             query=['includeDuplicates', 'useCanonical', 'skip', 'limit'],
+             returns='ExampleSearchResults'),
+    Endpoint('getWord', 'GET', '/word.{format}/{word}',
+             ['word'], query=['useCanonical', 'includeSuggestions'],
+             returns='WordObject'),
+    Endpoint('getDefinitions', 'GET', '/word.{format}/{word}/definitions',
+             ['word'],
+             query=['limit', 'partOfSpeech', 'includeRelated',
+                    'sourceDictionaries', 'useCanonical', 'includeTags'],
+             returns='list[Definition]'),
+    Endpoint('getTopExample', 'GET', '/word.{format}/{word}/topExample',
+             ['word'], query=['useCanonical'], returns='Example'),
+    Endpoint('getRelatedWords', 'GET', '/word.{format}/{word}/relatedWords',
+             ['word'],
+             query=['useCanonical', 'relationshipTypes',
+                    'limitPerRelationshipType'],
+             returns='list[Related]'),
+    Endpoint('getTextPronunciations', 'GET',
+             '/word.{format}/{word}/pronunciations', ['word'],
+             query=['useCanonical', 'sourceDictionary', 'typeFormat',
+                    'limit'],
+             returns='list[TextPron]'),
+    Endpoint('getHyphenation', 'GET', '/word.{format}/{word}/hyphenation',
+             ['word'], query=['useCanonical', 'sourceDictionary', 'limit'],
+             returns='list[Syllable]'),
+    Endpoint('getWordFrequency', 'GET', '/word.{format}/{word}/frequency',
+             ['word'], query=['useCanonical', 'startYear', 'endYear'],
+             returns='FrequencySummary'),
+    Endpoint('getPhrases', 'GET', '/word.{format}/{word}/phrases',
+             ['word'], query=['limit', 'wlmi', 'useCanonical'],
+             returns='list[Bigram]'),
+    Endpoint('getEtymologies', 'GET', '/word.{format}/{word}/etymologies',
+             ['word'], query=['useCanonical'], returns='list[str]'),
+    Endpoint('getAudio', 'GET', '/word.{format}/{word}/audio',
+             ['word'], query=['useCanonical', 'limit'],
+             returns='list[AudioFile]'),
+    Endpoint('getScrabbleScore', 'GET', '/word.{format}/{word}/scrabbleScore',
+             ['word'], returns='ScrabbleScoreResult'),
+
+    # WordListApi
+    Endpoint('updateWordList', 'PUT', '/wordList.{format}/{permalink}',
+             ['permalink', 'auth_token'], headers=['auth_token'], body=True),
+    Endpoint('deleteWordList', 'DELETE', '/wordList.{format}/{permalink}',
+             ['permalink', 'auth_token'], headers=['auth_token']),
+    Endpoint('getWordListByPermalink', 'GET', '/wordList.{format}/{permalink}',
+             ['permalink', 'auth_token'], headers=['auth_token'],
+             returns='WordList'),
+    Endpoint('addWordsToWordList', 'POST',
+             '/wordList.{format}/{permalink}/words',
+             ['permalink', 'auth_token'], headers=['auth_token'], body=True),
+    Endpoint('getWordListWords', 'GET', '/wordList.{format}/{permalink}/words',
+             ['permalink', 'auth_token'],
+             query=['sortBy', 'sortOrder', 'skip', 'limit'],
+             headers=['auth_token'], returns='list[WordListWord]'),
+    Endpoint('deleteWordsFromWordList', 'POST',
+             '/wordList.{format}/{permalink}/deleteWords',
+             ['permalink', 'auth_token'], headers=['auth_token'], body=True),
+
+    # WordListsApi
+    Endpoint('createWordList', 'POST', '/wordLists.{format}',
+             ['auth_token'], headers=['auth_token'], body=True,
+             returns='WordList'),
+
+    # WordsApi
+    Endpoint('searchWords', 'GET', '/words.{format}/search/{query}',
+             ['query'],
+             query=['caseSensitive', 'includePartOfSpeech',
+                    'excludePartOfSpeech', 'minCorpusCount',
+                    'maxCorpusCount', 'minDictionaryCount',
+                    'maxDictionaryCount', 'minLength', 'maxLength', 'skip',
+                    'limit'],
+             returns='WordSearchResults'),
+    Endpoint('getWordOfTheDay', 'GET', '/words.{format}/wordOfTheDay',
+             query=['date'], returns='WordOfTheDay'),
+    Endpoint('reverseDictionary', 'GET', '/words.{format}/reverseDictionary',
+             ['query'],
+             query=['query', 'findSenseForWord', 'includeSourceDictionaries',
+                    'excludeSourceDictionaries', 'includePartOfSpeech',
+                    'excludePartOfSpeech', 'minCorpusCount',
+                    'maxCorpusCount', 'minLength', 'maxLength',
+                    'expandTerms', 'includeTags', 'sortBy', 'sortOrder',
+                    'skip', 'limit'],
+             returns='DefinitionSearchResults'),
+    Endpoint('getRandomWords', 'GET', '/words.{format}/randomWords',
+             query=['hasDictionaryDef', 'includePartOfSpeech',
+                    'excludePartOfSpeech', 'minCorpusCount',
+                    'maxCorpusCount', 'minDictionaryCount',
+                    'maxDictionaryCount', 'minLength', 'maxLength', 'sortBy',
+                    'sortOrder', 'limit'],
+             returns='list[WordObject]'),
+    Endpoint('getRandomWord', 'GET', '/words.{format}/randomWord',
+             query=['hasDictionaryDef', 'includePartOfSpeech',
+                    'excludePartOfSpeech', 'minCorpusCount',
+                    'maxCorpusCount', 'minDictionaryCount',
+                    'maxDictionaryCount', 'minLength', 'maxLength'],
+             returns='WordObject'),
+]
+
+# Api method names to their Endpoint
+byName = dict((endpoint.name, endpoint) for endpoint in table)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""JSON backends for encoding request bodies and decoding responses. The
+fastest installed library is used by default: ujson, then simplejson, then
+the standard library's json module. A client can be pinned to one with
+`ApiClient(..., jsonBackend='json')`."""
+
+import json
+
+
+class Backend:
+    """A JSON library, wrapped to the one interface the client uses. Like
+    json.loads, `loads` must raise ValueError for invalid input.
+
+    Args:
+        name -- name the backend is chosen by
+        loads -- function decoding a JSON string
+        dumps -- function encoding an object as a JSON string
+    """
+
+    def __init__(self, name, loads, dumps):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return '<jsoncodec.Backend %s>' % self.name
+
+
+def _ujson():
+    import ujson
+    # precise_float so that floats decode to the same values as with json
+    return Backend('ujson', lambda s: ujson.loads(s, precise_float=True),
+                   ujson.dumps)
+
+
+def _simplejson():
+    import simplejson
+    return Backend('simplejson', simplejson.loads, simplejson.dumps)
+
+
+def _json():
+    return Backend('json', json.loads, json.dumps)
+
+
+# Backend names to factories, in order of preference
+factories = [
+    ('ujson', _ujson),
+    ('simplejson', _simplejson),
+    ('json', _json),
+]
+
+_backends = {}
+# Name of the preferred installed backend, once looked up
+_preferred = []
+
+
+def backend(name=None):
+    """Return the backend called `name`, or the preferred installed one.
+    Raises ValueError for an unknown name and ImportError when the library
+    is not installed."""
+
+    if name is None:
+        if not _preferred:
+            _preferred.append(available()[0])
+        name = _preferred[0]
+    if name not in _backends:
+        factory = dict(factories).get(name)
+        if factory is None:
+            raise ValueError('Unknown JSON backend: %s' % name)
+        _backends[name] = factory()
+    return _backends[name]
+
+
+def available():
+    """Return the names of the installed backends, fastest first."""
+
+    names = []
+    for (name, factory) in factories:
+        try:
+            backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Lazy loading of the package's modules. The package `__init__` files bind
+a `LazyModule` in place of each module, so that `from wordnik import *` and
+`from models import *` are cheap, and a module is only imported when one of
+its attributes is first read."""
+
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for the module called `name`: the first attribute lookup
+    imports it, and every lookup and assignment is forwarded to it. Its own
+    names are private, so that they cannot hide the module's."""
+
+    def __init__(self, name):
+        types.ModuleType.__init__(self, name)
+        self.__dict__['_LazyModule__module'] = None
+
+    def __load(self):
+        """Import the module, if that has not happened yet, and return it."""
+
+        module = self.__dict__['_LazyModule__module']
+        if module is None:
+            name = self.__dict__['__name__']
+            __import__(name)
+            module = self.__dict__['_LazyModule__module'] = sys.modules[name]
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self.__load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self.__load(), attr, value)
+
+    def __dir__(self):
+        return dir(self.__load())
+
+    def __repr__(self):
+        return "<lazy module '%s'>" % self.__dict__['__name__']
+
+
+def bindLazily(namespace, package, names):
+    """Bind a `LazyModule` for each of `package`'s modules in `names` that
+    `namespace`, the package's globals, does not hold yet."""
+
+    for name in names:
+        if name not in namespace:
+            namespace[name] = LazyModule(package + '.' + name)
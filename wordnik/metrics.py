@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+"""Per-endpoint instrumentation for the API client: request, cache hit and
+error counters, bytes received, and latency histograms for each stage of a
+call. Endpoints are keyed by their resource path template, e.g.
+'/word.json/{word}/definitions', so every word shares one set of numbers."""
+
+import re
+import socket
+import bisect
+import threading
+
+from cache import compileTemplate
+import endpoints
+
+# The resource path templates of the generated Api methods
+templates = sorted(set(endpoint.template for endpoint in endpoints.table))
+
+# The stages of a call that are timed, in the order they happen:
+#   connect -- opening the TCP (and TLS) connection, when one was opened
+#   firstByte -- from sending the request to receiving the response headers
+#   bodyRead -- reading the response body
+#   decode -- decoding the JSON body
+#   deserialize -- building the models, in `ApiClient.deserialize`
+stages = ('connect', 'firstByte', 'bodyRead', 'decode', 'deserialize')
+
+# Upper bounds of the histogram buckets, in seconds
+defaultBounds = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Latency histogram with fixed bucket bounds. Not thread-safe by
+    itself; `Metrics` guards it."""
+
+    def __init__(self, bounds=defaultBounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last one is unbounded
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """Estimate a percentile as the upper bound of the bucket it falls
+        in (or the largest value seen, for the unbounded bucket)."""
+
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for (i, count) in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if i == len(self.bounds):
+                    return self.max
+                return min(self.bounds[i], self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(0.5),
+            'p90': self.percentile(0.9),
+            'p99': self.percentile(0.99),
+            'buckets': [[bound, count] for (bound, count)
+                        in zip(list(self.bounds) + [None], self.counts)],
+        }
+
+
+class EndpointMetrics:
+    """The numbers recorded for one endpoint."""
+
+    def __init__(self, bounds):
+        self.requests = 0
+        self.cacheHits = 0
+        self.errors = {}
+        self.bytes = 0
+        self.histograms = dict((stage, Histogram(bounds))
+                               for stage in stages)
+
+    def snapshot(self):
+        snapshot = {
+            'requests': self.requests,
+            'cacheHits': self.cacheHits,
+            'errors': dict(self.errors),
+            'bytes': self.bytes,
+        }
+        for (stage, histogram) in self.histograms.items():
+            snapshot[stage] = histogram.snapshot()
+        return snapshot
+
+
+class Metrics:
+    """Thread-safe registry of `EndpointMetrics`, fed by `ApiClient`. Can
+    be shared by several clients.
+
+    Every recorded number is also passed on to the sinks, objects with
+    `increment(endpoint, name, value)` and `observe(endpoint, stage,
+    seconds)` methods (see `StatsdSink`), so that they can be forwarded to
+    an external metrics system as they happen.
+
+    Args:
+        templates -- resource path templates to key endpoints by; paths
+            that match none of them are counted under 'other'
+        bounds -- upper bounds of the histogram buckets, in seconds
+        sinks -- list of sinks to forward to
+    """
+
+    def __init__(self, templates=templates, bounds=defaultBounds,
+                 sinks=None):
+        self.patterns = [(compileTemplate(template), template)
+                         for template in templates]
+        self.bounds = bounds
+        self.sinks = list(sinks or [])
+        self._endpoints = {}
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    def endpointFor(self, resourcePath):
+        """Return the template a concrete resource path belongs to."""
+
+        endpoint = self._paths.get(resourcePath)
+        if endpoint is None:
+            endpoint = 'other'
+            for (pattern, template) in self.patterns:
+                if pattern.match(resourcePath):
+                    endpoint = template
+                    break
+            if len(self._paths) < 10000:
+                self._paths[resourcePath] = endpoint
+        return endpoint
+
+    def request(self, endpoint, status, size=0, timings=None):
+        """Record a request sent to an endpoint: its HTTP status, or None if
+        it got no response, the size of the response body, and the
+        `timings` dict of the stages it went through. Statuses of 400 and
+        above, and None (counted as 'network'), are errors."""
+
+        error = None
+        if status is None:
+            error = 'network'
+        elif status >= 400:
+            error = status
+        timings = timings or {}
+        with self._lock:
+            metrics = self._metricsFor(endpoint)
+            metrics.requests += 1
+            metrics.bytes += size
+            if error is not None:
+                metrics.errors[error] = metrics.errors.get(error, 0) + 1
+            for (stage, seconds) in timings.items():
+                metrics.histograms[stage].observe(seconds)
+        for sink in self.sinks:
+            sink.increment(endpoint, 'requests', 1)
+            if size:
+                sink.increment(endpoint, 'bytes', size)
+            if error is not None:
+                sink.increment(endpoint, 'errors.%s' % error, 1)
+            for (stage, seconds) in timings.items():
+                sink.observe(endpoint, stage, seconds)
+
+    def cacheHit(self, endpoint):
+        """Record a call answered from the cache."""
+
+        with self._lock:
+            self._metricsFor(endpoint).cacheHits += 1
+        for sink in self.sinks:
+            sink.increment(endpoint, 'cacheHits', 1)
+
+    def observe(self, endpoint, stage, seconds):
+        """Record how long one of the `stages` of a call took."""
+
+        with self._lock:
+            self._metricsFor(endpoint).histograms[stage].observe(seconds)
+        for sink in self.sinks:
+            sink.observe(endpoint, stage, seconds)
+
+    def snapshot(self):
+        """Return a dict of each endpoint seen so far to a dict of its
+        counters and of a histogram snapshot per stage."""
+
+        with self._lock:
+            return dict((endpoint, metrics.snapshot())
+                        for (endpoint, metrics) in self._endpoints.items())
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+
+    def _metricsFor(self, endpoint):
+        """Must be called with the lock held."""
+
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics(self.bounds)
+        return metrics
+
+
+class StatsdSink:
+    """Sink sending every number to a StatsD server over UDP, as counters
+    and timers named e.g. 'wordnik.word_json_word_definitions.firstByte'.
+
+    Args:
+        host, port -- address of the StatsD server
+        prefix -- prepended to every metric name
+    """
+
+    def __init__(self, host='localhost', port=8125, prefix='wordnik'):
+        self.address = (host, port)
+        self.prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def increment(self, endpoint, name, value):
+        self._send('%s:%d|c' % (self.name(endpoint, name), value))
+
+    def observe(self, endpoint, stage, seconds):
+        self._send('%s:%.3f|ms' % (self.name(endpoint, stage),
+                                    seconds * 1000))
+
+    def name(self, endpoint, name):
+        endpoint = re.sub('[^A-Za-z0-9]+', '_', endpoint).strip('_')
+        return '%s.%s.%s' % (self.prefix, endpoint, name)
+
+    def _send(self, line):
+        try:
+            self._socket.sendto(line, self.address)
+        except socket.error:
+            pass  # metrics must never break a call
@@ -14,27 +14,39 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class ApiTokenStatus:
+class ApiTokenStatus(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'valid': 'bool',
+        'token': 'str',
+        'resetsInMillis': 'long',
+        'remainingCalls': 'long',
+        'expiresInMillis': 'long',
+        'totalRequests': 'long'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'valid': 'bool',
-            'token': 'str',
-            'resetsInMillis': 'long',
-            'remainingCalls': 'long',
-            'expiresInMillis': 'long',
-            'totalRequests': 'long'
-
-        }
+    }
 
+    __slots__ = ('valid', 'token', 'resetsInMillis', 'remainingCalls',
+                 'expiresInMillis', 'totalRequests')
 
+    def __init__(self):
         self.valid = None # bool
         self.token = None # str
         self.resetsInMillis = None # long
         self.remainingCalls = None # long
         self.expiresInMillis = None # long
         self.totalRequests = None # long
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain ApiTokenStatus objects
+        return (ApiTokenStatus, (), self.__getstate__())
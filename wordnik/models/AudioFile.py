@@ -14,31 +14,34 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class AudioFile:
+class AudioFile(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'attributionUrl': 'str',
+        'commentCount': 'int',
+        'voteCount': 'int',
+        'fileUrl': 'str',
+        'audioType': 'str',
+        'id': 'long',
+        'duration': 'float',
+        'attributionText': 'str',
+        'createdBy': 'str',
+        'description': 'str',
+        'createdAt': 'datetime',
+        'voteWeightedAverage': 'float',
+        'voteAverage': 'float',
+        'word': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'attributionUrl': 'str',
-            'commentCount': 'int',
-            'voteCount': 'int',
-            'fileUrl': 'str',
-            'audioType': 'str',
-            'id': 'long',
-            'duration': 'float',
-            'attributionText': 'str',
-            'createdBy': 'str',
-            'description': 'str',
-            'createdAt': 'datetime',
-            'voteWeightedAverage': 'float',
-            'voteAverage': 'float',
-            'word': 'str'
-
-        }
+    }
 
+    __slots__ = ('attributionUrl', 'commentCount', 'voteCount', 'fileUrl',
+                 'audioType', 'id', 'duration', 'attributionText', 'createdBy',
+                 'description', 'createdAt', 'voteWeightedAverage',
+                 'voteAverage', 'word')
 
+    def __init__(self):
         self.attributionUrl = None # str
         self.commentCount = None # int
         self.voteCount = None # int
@@ -53,4 +56,15 @@ class AudioFile:
         self.voteWeightedAverage = None # float
         self.voteAverage = None # float
         self.word = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain AudioFile objects
+        return (AudioFile, (), self.__getstate__())
@@ -14,21 +14,32 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class AuthenticationToken:
+class AuthenticationToken(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'token': 'str',
+        'userId': 'long',
+        'userSignature': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'token': 'str',
-            'userId': 'long',
-            'userSignature': 'str'
-
-        }
+    }
 
+    __slots__ = ('token', 'userId', 'userSignature')
 
+    def __init__(self):
         self.token = None # str
         self.userId = None # long
         self.userSignature = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain AuthenticationToken objects
+        return (AuthenticationToken, (), self.__getstate__())
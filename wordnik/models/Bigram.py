@@ -14,25 +14,36 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Bigram:
+class Bigram(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'count': 'long',
+        'gram2': 'str',
+        'gram1': 'str',
+        'wlmi': 'float',
+        'mi': 'float'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'count': 'long',
-            'gram2': 'str',
-            'gram1': 'str',
-            'wlmi': 'float',
-            'mi': 'float'
-
-        }
+    }
 
+    __slots__ = ('count', 'gram2', 'gram1', 'wlmi', 'mi')
 
+    def __init__(self):
         self.count = None # long
         self.gram2 = None # str
         self.gram1 = None # str
         self.wlmi = None # float
         self.mi = None # float
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Bigram objects
+        return (Bigram, (), self.__getstate__())
@@ -14,19 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Citation:
+class Citation(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'cite': 'str',
+        'source': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'cite': 'str',
-            'source': 'str'
-
-        }
+    }
 
+    __slots__ = ('cite', 'source')
 
+    def __init__(self):
         self.cite = None # str
         self.source = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Citation objects
+        return (Citation, (), self.__getstate__())
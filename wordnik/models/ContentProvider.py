@@ -14,19 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class ContentProvider:
+class ContentProvider(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'int',
+        'name': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'int',
-            'name': 'str'
-
-        }
+    }
 
+    __slots__ = ('id', 'name')
 
+    def __init__(self):
         self.id = None # int
         self.name = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain ContentProvider objects
+        return (ContentProvider, (), self.__getstate__())
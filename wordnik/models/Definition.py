@@ -14,33 +14,36 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Definition:
+class Definition(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'extendedText': 'str',
+        'text': 'str',
+        'sourceDictionary': 'str',
+        'citations': 'list[Citation]',
+        'labels': 'list[Label]',
+        'score': 'float',
+        'exampleUses': 'list[ExampleUsage]',
+        'attributionUrl': 'str',
+        'seqString': 'str',
+        'attributionText': 'str',
+        'relatedWords': 'list[Related]',
+        'sequence': 'str',
+        'word': 'str',
+        'notes': 'list[Note]',
+        'textProns': 'list[TextPron]',
+        'partOfSpeech': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'extendedText': 'str',
-            'text': 'str',
-            'sourceDictionary': 'str',
-            'citations': 'list[Citation]',
-            'labels': 'list[Label]',
-            'score': 'float',
-            'exampleUses': 'list[ExampleUsage]',
-            'attributionUrl': 'str',
-            'seqString': 'str',
-            'attributionText': 'str',
-            'relatedWords': 'list[Related]',
-            'sequence': 'str',
-            'word': 'str',
-            'notes': 'list[Note]',
-            'textProns': 'list[TextPron]',
-            'partOfSpeech': 'str'
-
-        }
+    }
 
+    __slots__ = ('extendedText', 'text', 'sourceDictionary', 'citations',
+                 'labels', 'score', 'exampleUses', 'attributionUrl',
+                 'seqString', 'attributionText', 'relatedWords', 'sequence',
+                 'word', 'notes', 'textProns', 'partOfSpeech')
 
+    def __init__(self):
         self.extendedText = None # str
         self.text = None # str
         self.sourceDictionary = None # str
@@ -57,4 +60,15 @@ class Definition:
         self.notes = None # list[Note]
         self.textProns = None # list[TextPron]
         self.partOfSpeech = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Definition objects
+        return (Definition, (), self.__getstate__())
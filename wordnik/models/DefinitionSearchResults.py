@@ -14,19 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class DefinitionSearchResults:
+class DefinitionSearchResults(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'results': 'list[Definition]',
+        'totalResults': 'int'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'results': 'list[Definition]',
-            'totalResults': 'int'
-
-        }
+    }
 
+    __slots__ = ('results', 'totalResults')
 
+    def __init__(self):
         self.results = None # list[Definition]
         self.totalResults = None # int
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain DefinitionSearchResults objects
+        return (DefinitionSearchResults, (), self.__getstate__())
@@ -14,29 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Example:
+class Example(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'exampleId': 'long',
+        'title': 'str',
+        'text': 'str',
+        'score': 'ScoredWord',
+        'sentence': 'Sentence',
+        'word': 'str',
+        'provider': 'ContentProvider',
+        'year': 'int',
+        'rating': 'float',
+        'documentId': 'long',
+        'url': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'exampleId': 'long',
-            'title': 'str',
-            'text': 'str',
-            'score': 'ScoredWord',
-            'sentence': 'Sentence',
-            'word': 'str',
-            'provider': 'ContentProvider',
-            'year': 'int',
-            'rating': 'float',
-            'documentId': 'long',
-            'url': 'str'
-
-        }
+    }
 
+    __slots__ = ('id', 'exampleId', 'title', 'text', 'score', 'sentence',
+                 'word', 'provider', 'year', 'rating', 'documentId', 'url')
 
+    def __init__(self):
         self.id = None # long
         self.exampleId = None # long
         self.title = None # str
@@ -49,4 +50,15 @@ class Example:
         self.rating = None # float
         self.documentId = None # long
         self.url = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Example objects
+        return (Example, (), self.__getstate__())
@@ -14,19 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class ExampleSearchResults:
+class ExampleSearchResults(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'facets': 'list[Facet]',
+        'examples': 'list[Example]'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'facets': 'list[Facet]',
-            'examples': 'list[Example]'
-
-        }
+    }
 
+    __slots__ = ('facets', 'examples')
 
+    def __init__(self):
         self.facets = None # list[Facet]
         self.examples = None # list[Example]
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain ExampleSearchResults objects
+        return (ExampleSearchResults, (), self.__getstate__())
@@ -14,17 +14,28 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class ExampleUsage:
+class ExampleUsage(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'text': 'str'
+
+    }
+
+    __slots__ = ('text',)
 
     def __init__(self):
-        self.swaggerTypes = {
-            'text': 'str'
+        self.text = None # str
 
-        }
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
 
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
 
-        self.text = None # str
-        
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain ExampleUsage objects
+        return (ExampleUsage, (), self.__getstate__())
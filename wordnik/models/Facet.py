@@ -14,19 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Facet:
+class Facet(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'facetValues': 'list[FacetValue]',
+        'name': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'facetValues': 'list[FacetValue]',
-            'name': 'str'
-
-        }
+    }
 
+    __slots__ = ('facetValues', 'name')
 
+    def __init__(self):
         self.facetValues = None # list[FacetValue]
         self.name = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Facet objects
+        return (Facet, (), self.__getstate__())
@@ -14,25 +14,37 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class FrequencySummary:
+class FrequencySummary(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'unknownYearCount': 'int',
+        'totalCount': 'long',
+        'frequencyString': 'str',
+        'word': 'str',
+        'frequency': 'list[Frequency]'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'unknownYearCount': 'int',
-            'totalCount': 'long',
-            'frequencyString': 'str',
-            'word': 'str',
-            'frequency': 'list[Frequency]'
-
-        }
+    }
 
+    __slots__ = ('unknownYearCount', 'totalCount', 'frequencyString', 'word',
+                 'frequency')
 
+    def __init__(self):
         self.unknownYearCount = None # int
         self.totalCount = None # long
         self.frequencyString = None # str
         self.word = None # str
         self.frequency = None # list[Frequency]
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain FrequencySummary objects
+        return (FrequencySummary, (), self.__getstate__())
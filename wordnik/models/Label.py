@@ -14,19 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Label:
+class Label(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'text': 'str',
+        'type': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'text': 'str',
-            'type': 'str'
-
-        }
+    }
 
+    __slots__ = ('text', 'type')
 
+    def __init__(self):
         self.text = None # str
         self.type = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Label objects
+        return (Label, (), self.__getstate__())
@@ -14,23 +14,34 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Note:
+class Note(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'noteType': 'str',
+        'appliesTo': 'list[str]',
+        'value': 'str',
+        'pos': 'int'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'noteType': 'str',
-            'appliesTo': 'list[str]',
-            'value': 'str',
-            'pos': 'int'
-
-        }
+    }
 
+    __slots__ = ('noteType', 'appliesTo', 'value', 'pos')
 
+    def __init__(self):
         self.noteType = None # str
         self.appliesTo = None # list[str]
         self.value = None # str
         self.pos = None # int
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Note objects
+        return (Note, (), self.__getstate__())
@@ -14,24 +14,25 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Related:
+class Related(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'label1': 'str',
+        'relationshipType': 'str',
+        'label2': 'str',
+        'label3': 'str',
+        'words': 'list[str]',
+        'gram': 'str',
+        'label4': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'label1': 'str',
-            'relationshipType': 'str',
-            'label2': 'str',
-            'label3': 'str',
-            'words': 'list[str]',
-            'gram': 'str',
-            'label4': 'str'
-
-        }
+    }
 
+    __slots__ = ('label1', 'relationshipType', 'label2', 'label3', 'words',
+                 'gram', 'label4')
 
+    def __init__(self):
         self.label1 = None # str
         self.relationshipType = None # str
         self.label2 = None # str
@@ -39,4 +40,15 @@ class Related:
         self.words = None # list[str]
         self.gram = None # str
         self.label4 = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Related objects
+        return (Related, (), self.__getstate__())
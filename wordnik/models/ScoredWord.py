@@ -14,28 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class ScoredWord:
+class ScoredWord(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'position': 'int',
+        'id': 'long',
+        'docTermCount': 'int',
+        'lemma': 'str',
+        'wordType': 'str',
+        'score': 'float',
+        'sentenceId': 'long',
+        'word': 'str',
+        'stopword': 'bool',
+        'baseWordScore': 'float',
+        'partOfSpeech': 'str'
+
+    }
+
+    __slots__ = ('position', 'id', 'docTermCount', 'lemma', 'wordType',
+                 'score', 'sentenceId', 'word', 'stopword', 'baseWordScore',
+                 'partOfSpeech')
 
     def __init__(self):
-        self.swaggerTypes = {
-            'position': 'int',
-            'id': 'long',
-            'docTermCount': 'int',
-            'lemma': 'str',
-            'wordType': 'str',
-            'score': 'float',
-            'sentenceId': 'long',
-            'word': 'str',
-            'stopword': 'bool',
-            'baseWordScore': 'float',
-            'partOfSpeech': 'str'
-
-        }
-
-
         self.position = None # int
         self.id = None # long
         self.docTermCount = None # int
@@ -47,4 +49,15 @@ class ScoredWord:
         self.stopword = None # bool
         self.baseWordScore = None # float
         self.partOfSpeech = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain ScoredWord objects
+        return (ScoredWord, (), self.__getstate__())
@@ -14,27 +14,39 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Sentence:
+class Sentence(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'hasScoredWords': 'bool',
+        'id': 'long',
+        'scoredWords': 'list[ScoredWord]',
+        'display': 'str',
+        'rating': 'int',
+        'documentMetadataId': 'long'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'hasScoredWords': 'bool',
-            'id': 'long',
-            'scoredWords': 'list[ScoredWord]',
-            'display': 'str',
-            'rating': 'int',
-            'documentMetadataId': 'long'
-
-        }
+    }
 
+    __slots__ = ('hasScoredWords', 'id', 'scoredWords', 'display', 'rating',
+                 'documentMetadataId')
 
+    def __init__(self):
         self.hasScoredWords = None # bool
         self.id = None # long
         self.scoredWords = None # list[ScoredWord]
         self.display = None # str
         self.rating = None # int
         self.documentMetadataId = None # long
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Sentence objects
+        return (Sentence, (), self.__getstate__())
@@ -14,23 +14,34 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class SimpleDefinition:
+class SimpleDefinition(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'text': 'str',
+        'source': 'str',
+        'note': 'str',
+        'partOfSpeech': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'text': 'str',
-            'source': 'str',
-            'note': 'str',
-            'partOfSpeech': 'str'
-
-        }
+    }
 
+    __slots__ = ('text', 'source', 'note', 'partOfSpeech')
 
+    def __init__(self):
         self.text = None # str
         self.source = None # str
         self.note = None # str
         self.partOfSpeech = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain SimpleDefinition objects
+        return (SimpleDefinition, (), self.__getstate__())
@@ -14,23 +14,34 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class SimpleExample:
+class SimpleExample(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'title': 'str',
+        'text': 'str',
+        'url': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'title': 'str',
-            'text': 'str',
-            'url': 'str'
-
-        }
+    }
 
+    __slots__ = ('id', 'title', 'text', 'url')
 
+    def __init__(self):
         self.id = None # long
         self.title = None # str
         self.text = None # str
         self.url = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain SimpleExample objects
+        return (SimpleExample, (), self.__getstate__())
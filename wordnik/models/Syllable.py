@@ -14,21 +14,32 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class Syllable:
+class Syllable(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'text': 'str',
+        'seq': 'int',
+        'type': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'text': 'str',
-            'seq': 'int',
-            'type': 'str'
-
-        }
+    }
 
+    __slots__ = ('text', 'seq', 'type')
 
+    def __init__(self):
         self.text = None # str
         self.seq = None # int
         self.type = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain Syllable objects
+        return (Syllable, (), self.__getstate__())
@@ -14,21 +14,32 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class TextPron:
+class TextPron(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'raw': 'str',
+        'seq': 'int',
+        'rawType': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'raw': 'str',
-            'seq': 'int',
-            'rawType': 'str'
-
-        }
+    }
 
+    __slots__ = ('raw', 'seq', 'rawType')
 
+    def __init__(self):
         self.raw = None # str
         self.seq = None # int
         self.rawType = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain TextPron objects
+        return (TextPron, (), self.__getstate__())
@@ -14,25 +14,26 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class User:
+class User(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'username': 'str',
+        'email': 'str',
+        'status': 'int',
+        'faceBookId': 'str',
+        'userName': 'str',
+        'displayName': 'str',
+        'password': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'username': 'str',
-            'email': 'str',
-            'status': 'int',
-            'faceBookId': 'str',
-            'userName': 'str',
-            'displayName': 'str',
-            'password': 'str'
-
-        }
+    }
 
+    __slots__ = ('id', 'username', 'email', 'status', 'faceBookId', 'userName',
+                 'displayName', 'password')
 
+    def __init__(self):
         self.id = None # long
         self.username = None # str
         self.email = None # str
@@ -41,4 +42,15 @@ class User:
         self.userName = None # str
         self.displayName = None # str
         self.password = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain User objects
+        return (User, (), self.__getstate__())
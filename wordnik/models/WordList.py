@@ -14,28 +14,30 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class WordList:
+class WordList(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'permalink': 'str',
+        'name': 'str',
+        'createdAt': 'datetime',
+        'updatedAt': 'datetime',
+        'lastActivityAt': 'datetime',
+        'username': 'str',
+        'userId': 'long',
+        'description': 'str',
+        'numberWordsInList': 'long',
+        'type': 'str'
+
+    }
+
+    __slots__ = ('id', 'permalink', 'name', 'createdAt', 'updatedAt',
+                 'lastActivityAt', 'username', 'userId', 'description',
+                 'numberWordsInList', 'type')
 
     def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'permalink': 'str',
-            'name': 'str',
-            'createdAt': 'datetime',
-            'updatedAt': 'datetime',
-            'lastActivityAt': 'datetime',
-            'username': 'str',
-            'userId': 'long',
-            'description': 'str',
-            'numberWordsInList': 'long',
-            'type': 'str'
-
-        }
-
-
         self.id = None # long
         self.permalink = None # str
         self.name = None # str
@@ -47,4 +49,15 @@ class WordList:
         self.description = None # str
         self.numberWordsInList = None # long
         self.type = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain WordList objects
+        return (WordList, (), self.__getstate__())
@@ -14,24 +14,25 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class WordListWord:
+class WordListWord(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'word': 'str',
+        'username': 'str',
+        'userId': 'long',
+        'createdAt': 'datetime',
+        'numberCommentsOnWord': 'long',
+        'numberLists': 'long'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'word': 'str',
-            'username': 'str',
-            'userId': 'long',
-            'createdAt': 'datetime',
-            'numberCommentsOnWord': 'long',
-            'numberLists': 'long'
-
-        }
+    }
 
+    __slots__ = ('id', 'word', 'username', 'userId', 'createdAt',
+                 'numberCommentsOnWord', 'numberLists')
 
+    def __init__(self):
         self.id = None # long
         self.word = None # str
         self.username = None # str
@@ -39,4 +40,15 @@ class WordListWord:
         self.createdAt = None # datetime
         self.numberCommentsOnWord = None # long
         self.numberLists = None # long
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain WordListWord objects
+        return (WordListWord, (), self.__getstate__())
@@ -14,27 +14,39 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class WordObject:
+class WordObject(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'word': 'str',
+        'originalWord': 'str',
+        'suggestions': 'list[str]',
+        'canonicalForm': 'str',
+        'vulgar': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'word': 'str',
-            'originalWord': 'str',
-            'suggestions': 'list[str]',
-            'canonicalForm': 'str',
-            'vulgar': 'str'
-
-        }
+    }
 
+    __slots__ = ('id', 'word', 'originalWord', 'suggestions', 'canonicalForm',
+                 'vulgar')
 
+    def __init__(self):
         self.id = None # long
         self.word = None # str
         self.originalWord = None # str
         self.suggestions = None # list[str]
         self.canonicalForm = None # str
         self.vulgar = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain WordObject objects
+        return (WordObject, (), self.__getstate__())
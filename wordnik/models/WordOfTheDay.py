@@ -14,29 +14,31 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class WordOfTheDay:
+class WordOfTheDay(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'id': 'long',
+        'parentId': 'str',
+        'category': 'str',
+        'createdBy': 'str',
+        'createdAt': 'datetime',
+        'contentProvider': 'ContentProvider',
+        'htmlExtra': 'str',
+        'word': 'str',
+        'definitions': 'list[SimpleDefinition]',
+        'examples': 'list[SimpleExample]',
+        'note': 'str',
+        'publishDate': 'datetime'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'id': 'long',
-            'parentId': 'str',
-            'category': 'str',
-            'createdBy': 'str',
-            'createdAt': 'datetime',
-            'contentProvider': 'ContentProvider',
-            'htmlExtra': 'str',
-            'word': 'str',
-            'definitions': 'list[SimpleDefinition]',
-            'examples': 'list[SimpleExample]',
-            'note': 'str',
-            'publishDate': 'datetime'
-
-        }
+    }
 
+    __slots__ = ('id', 'parentId', 'category', 'createdBy', 'createdAt',
+                 'contentProvider', 'htmlExtra', 'word', 'definitions',
+                 'examples', 'note', 'publishDate')
 
+    def __init__(self):
         self.id = None # long
         self.parentId = None # str
         self.category = None # str
@@ -49,4 +51,15 @@ class WordOfTheDay:
         self.examples = None # list[SimpleExample]
         self.note = None # str
         self.publishDate = None # datetime
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain WordOfTheDay objects
+        return (WordOfTheDay, (), self.__getstate__())
@@ -14,21 +14,32 @@ Copyright 2012 Wordnik, Inc.
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-class WordSearchResult:
+class WordSearchResult(object):
     """NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually."""
 
+    swaggerTypes = {
+        'count': 'long',
+        'lexicality': 'float',
+        'word': 'str'
 
-    def __init__(self):
-        self.swaggerTypes = {
-            'count': 'long',
-            'lexicality': 'float',
-            'word': 'str'
-
-        }
+    }
 
+    __slots__ = ('count', 'lexicality', 'word')
 
+    def __init__(self):
         self.count = None # long
         self.lexicality = None # float
         self.word = None # str
-        
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.swaggerTypes)
+
+    def __setstate__(self, state):
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        # Slotted classes have no default pickling; lazily deserialized
+        # instances are pickled as plain WordSearchResult objects
+        return (WordSearchResult, (), self.__getstate__())
@@ -1,10 +1,44 @@
 #!/usr/bin/env python
-"""Add all of the modules in the current directory to __all__"""
-import os
+"""All of the model modules are listed in __all__. They are bound lazily
+(see `wordnik.lazy`), so `from models import *` imports none of them until
+they are used."""
 
-__all__ = []
+from ..lazy import bindLazily
 
-for module in os.listdir(os.path.dirname(__file__)):
-    if module != '__init__.py' and module[-3:] == '.py':
-        __all__.append(module[:-3])
+__all__ = [
+    'ApiTokenStatus',
+    'AudioFile',
+    'AuthenticationToken',
+    'Bigram',
+    'Citation',
+    'ContentProvider',
+    'Definition',
+    'DefinitionSearchResults',
+    'Example',
+    'ExampleSearchResults',
+    'ExampleUsage',
+    'Facet',
+    'FacetValue',
+    'Frequency',
+    'FrequencySummary',
+    'Label',
+    'Note',
+    'Related',
+    'ScoredWord',
+    'ScrabbleScoreResult',
+    'Sentence',
+    'SimpleDefinition',
+    'SimpleExample',
+    'StringValue',
+    'Syllable',
+    'TextPron',
+    'User',
+    'WordList',
+    'WordListWord',
+    'WordObject',
+    'WordOfTheDay',
+    'WordSearchResult',
+    'WordSearchResults',
+]
 
+bindLazily(globals(), __name__, __all__)
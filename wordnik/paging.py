@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""Iterators over every result of the skip/limit endpoints, such as
+searchWords or getWordListWords. Results are yielded one at a time while the
+next page is already being fetched in the background, so the caller never
+waits on a round trip it could have overlapped with its own work.
+
+For endpoints that report `totalResults`, `iterShards` goes further and
+fetches many pages at once."""
+
+import sys
+import threading
+from collections import deque
+
+from batch import reraise
+
+
+class Prefetch(threading.Thread):
+    """Calls `func(*args)` on a background thread as soon as it is created.
+    `result()` waits for the call and returns its value or re-raises its
+    exception."""
+
+    def __init__(self, func, *args):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.func = func
+        self.args = args
+        self.value = None
+        self.excInfo = None
+        self.start()
+
+    def run(self):
+        try:
+            self.value = self.func(*self.args)
+        except Exception:
+            self.excInfo = sys.exc_info()
+
+    def result(self):
+        self.join()
+        if self.excInfo is not None:
+            reraise(self.excInfo)
+        return self.value
+
+
+def iterPages(apiClient, fetchPage, itemsField=None, pageSize=50, skip=0,
+              maxResults=None):
+    """Yield the items of successive pages, starting at offset `skip`.
+
+    Paging stops at an empty or short page, once `totalResults` (when the
+    response has it) is reached, or after `maxResults` items.
+
+    Args:
+        apiClient -- the ApiClient making the calls; its call options in
+            effect here also apply to the background fetches
+        fetchPage -- function taking `skip` and `limit` and returning a page
+        itemsField -- name of the page field holding the items, or None if
+            the page is itself the list of items
+        pageSize -- items requested per call
+        skip -- offset of the first item
+        maxResults -- maximum number of items to yield, or None for all
+    """
+
+    fetch = apiClient.withCurrentOptions(fetchPage)
+    end = None if maxResults is None else skip + maxResults
+
+    def request(start):
+        limit = pageSize if end is None else min(pageSize, end - start)
+        return start, limit, Prefetch(fetch, start, limit)
+
+    pending = request(skip) if end is None or end > skip else None
+    while pending is not None:
+        start, limit, prefetch = pending
+        items, total = _unpack(prefetch.result(), itemsField)
+        if total is not None and (end is None or total < end):
+            end = total
+        pending = None
+        nextStart = start + limit
+        if len(items) >= limit and (end is None or nextStart < end):
+            pending = request(nextStart)
+        if end is not None:
+            items = items[:max(end - start, 0)]
+        for item in items:
+            yield item
+
+
+def iterShards(apiClient, fetchPage, itemsField, pageSize=100, skip=0,
+               maxResults=None, maxWorkers=8, maxPending=None):
+    """Like `iterPages`, but once the first page has revealed
+    `totalResults`, the rest of the range is split into pages that are
+    fetched on up to `maxWorkers` threads. Items are still yielded in order,
+    and at most `maxPending` pages (twice the number of workers by default)
+    are fetched ahead of the consumer.
+
+    Falls back to `iterPages` if the endpoint does not report
+    `totalResults`."""
+
+    if maxPending is None:
+        maxPending = maxWorkers * 2
+    fetch = apiClient.withCurrentOptions(fetchPage)
+    end = None if maxResults is None else skip + maxResults
+    if end is not None and end <= skip:
+        return
+
+    limit = pageSize if end is None else min(pageSize, end - skip)
+    items, total = _unpack(fetch(skip, limit), itemsField)
+    if total is not None and (end is None or total < end):
+        end = total
+    if end is not None:
+        items = items[:max(end - skip, 0)]
+    for item in items:
+        yield item
+    if len(items) < limit:
+        return
+    if total is None:
+        remaining = None if maxResults is None else maxResults - limit
+        for item in iterPages(apiClient, fetchPage, itemsField, pageSize,
+                              skip + limit, remaining):
+            yield item
+        return
+
+    shards = ((start, min(pageSize, end - start))
+              for start in xrange(skip + limit, end, pageSize))
+    # multiprocessing takes a while to import; only sharded fetches need it
+    from multiprocessing.pool import ThreadPool
+    executor = ThreadPool(maxWorkers)
+    try:
+        pending = deque()
+        for shard in shards:
+            pending.append(executor.apply_async(fetch, shard))
+            if len(pending) >= maxPending:
+                break
+        while pending:
+            page = pending.popleft().get()
+            shard = next(shards, None)
+            if shard is not None:
+                pending.append(executor.apply_async(fetch, shard))
+            for item in _unpack(page, itemsField)[0]:
+                yield item
+    finally:
+        executor.terminate()
+
+
+def _field(page, name):
+    """Read a field from a page in any of the ApiClient result modes: a
+    model, a namedtuple or a plain dict."""
+
+    if isinstance(page, dict):
+        return page.get(name)
+    return getattr(page, name, None)
+
+
+def _unpack(page, itemsField):
+    """Return (items, totalResults or None) for a page."""
+
+    if page is None:
+        return [], None
+    if itemsField is None:
+        return page, None
+    return _field(page, itemsField) or [], _field(page, 'totalResults')
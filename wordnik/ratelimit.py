@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""Client-side rate limiting driven by the API key's own quota, as reported
+by /account.json/apiTokenStatus."""
+
+import time
+import threading
+
+
+class QuotaRateLimiter:
+    """Token bucket that spreads the calls remaining on an API key evenly
+    over the time left until the quota resets.
+
+    The bucket is seeded from `getApiTokenStatus` the first time it is used
+    and refreshed every `refreshInterval` seconds, or as soon as the quota
+    window is over. Each call takes one token; when none is available the
+    calling thread sleeps until one is, so batch jobs run at the fastest
+    steady rate the key allows instead of bursting into rejections.
+
+    Args:
+        refreshInterval -- seconds between token status refreshes
+        burst -- bucket capacity, i.e. how many calls may go out back to
+            back after a quiet period
+        reserve -- calls to leave unused at the end of every window, e.g.
+            for interactive use of the same key
+    """
+
+    statusPath = '/account.json/apiTokenStatus'
+
+    def __init__(self, refreshInterval=60.0, burst=10, reserve=0):
+        self.refreshInterval = refreshInterval
+        self.burst = burst
+        self.reserve = reserve
+        self.clock = time.time
+        self.sleep = time.sleep
+
+        self.rate = None  # tokens per second; None until seeded
+        self.tokens = 0.0
+        self.budget = None  # calls left in the current window
+        self.windowEnd = None
+        self.refreshedAt = None
+        self.updatedAt = None
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {'acquired': 0, 'waits': 0, 'waitedSeconds': 0.0,
+                       'refreshes': 0, 'refreshErrors': 0}
+
+    def acquire(self, apiClient):
+        """Block until a call may be made with `apiClient`, refreshing the
+        quota through it when due."""
+
+        if getattr(self._local, 'refreshing', False):
+            return  # the token status call itself
+
+        with self._lock:
+            while True:
+                now = self.clock()
+                if self._refreshDue(now):
+                    self._refresh(apiClient, now)
+                    now = self.clock()
+                if self.rate is None:
+                    self._stats['acquired'] += 1
+                    return  # quota unknown, don't throttle
+
+                self.tokens = min(self.burst, self.tokens +
+                                  (now - self.updatedAt) * self.rate)
+                self.updatedAt = now
+                if self.tokens >= 1 and self.budget >= 1:
+                    self.tokens -= 1
+                    self.budget -= 1
+                    self._stats['acquired'] += 1
+                    return
+
+                if self.budget < 1:
+                    wait = self._nextRefresh() - now
+                else:
+                    wait = (1 - self.tokens) / self.rate
+                wait = max(wait, 0.001)
+                self._stats['waits'] += 1
+                self._stats['waitedSeconds'] += wait
+                self.sleep(wait)
+
+    def update(self, tokenStatus, now=None):
+        """Re-seed the bucket from an `ApiTokenStatus`."""
+
+        if now is None:
+            now = self.clock()
+        remaining = max((tokenStatus.remainingCalls or 0) - self.reserve, 0)
+        window = (tokenStatus.resetsInMillis or 0) / 1000.0
+
+        if self.rate is None:
+            self.tokens = self.burst  # start with a full bucket
+        self.budget = remaining
+        self.tokens = min(self.tokens, self.burst, remaining)
+        self.updatedAt = now
+        if window > 0:
+            self.windowEnd = now + window
+            self.rate = remaining / window
+        else:
+            self.windowEnd = None
+            self.rate = None
+
+    def stats(self):
+        """Return a snapshot of the limiter's counters and current rate."""
+
+        with self._lock:
+            stats = dict(self._stats)
+            stats['rate'] = self.rate
+            stats['budget'] = self.budget
+        return stats
+
+    def _nextRefresh(self):
+        nextRefresh = self.refreshedAt + self.refreshInterval
+        if self.windowEnd is not None:
+            nextRefresh = min(nextRefresh, self.windowEnd)
+        return nextRefresh
+
+    def _refreshDue(self, now):
+        return self.refreshedAt is None or now >= self._nextRefresh()
+
+    def _refresh(self, apiClient, now):
+        self.refreshedAt = now
+        self._local.refreshing = True
+        try:
+            # A cached status would be stale, and a call coalesced with
+            # another thread's, which is itself waiting for this lock,
+            # would never finish.
+            with apiClient.options(useCache=False, coalesce=False,
+                                   raw=False, lazy=False):
+                response = apiClient.callAPI(self.statusPath, 'GET', {}, None)
+                status = apiClient.deserialize(
+                    response, 'ApiTokenStatus',
+                    apiClient.metrics.endpointFor(self.statusPath))
+        except Exception:
+            # Keep throttling with what we knew and try again after the
+            # next interval rather than on every call.
+            self._stats['refreshErrors'] += 1
+            self.windowEnd = None
+            return
+        finally:
+            self._local.refreshing = False
+        self._stats['refreshes'] += 1
+        self.update(status, self.clock())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""Retry policy for transient API failures: exponential backoff with full
+jitter, a cap on attempts and an overall deadline per logical call."""
+
+import time
+import random
+import socket
+import httplib
+import urllib2
+import threading
+
+
+class RetryPolicy:
+    """Decides which failures of a call are retried, and how long to wait
+    between attempts.
+
+    Args:
+        maxAttempts -- total attempts per call, including the first
+        backoff -- base delay in seconds; attempt n waits a random time
+            between 0 and min(maxBackoff, backoff * 2 ** n) ("full jitter")
+        maxBackoff -- upper bound on a single delay
+        deadline -- seconds a logical call may take across all attempts and
+            delays, or None for no limit. Each attempt is given the time
+            left as its socket timeout, and a retry that cannot start
+            before the deadline is not made.
+        retryStatuses -- HTTP status codes that are retried
+        retryExceptions -- exception classes (other than HTTP errors) that
+            are retried, e.g. connection resets and timeouts
+        retryMethods -- HTTP methods that may be retried. Only idempotent
+            methods by default, so a POST is never sent twice.
+    """
+
+    def __init__(self, maxAttempts=3, backoff=0.1, maxBackoff=10.0,
+                 deadline=None, retryStatuses=(429, 500, 502, 503, 504),
+                 retryExceptions=(urllib2.URLError, socket.error,
+                                  httplib.HTTPException),
+                 retryMethods=('GET', 'PUT', 'DELETE')):
+        self.maxAttempts = maxAttempts
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.deadline = deadline
+        self.retryStatuses = retryStatuses
+        self.retryExceptions = retryExceptions
+        self.retryMethods = retryMethods
+        self.clock = time.time
+        self.sleep = time.sleep
+
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'attempts': 0, 'retries': 0,
+                       'giveUps': 0, 'sleptSeconds': 0.0}
+
+    def call(self, method, func, *args, **kwargs):
+        """Run `func(*args, **kwargs)`, retrying it according to the policy
+        as an HTTP `method` call. The last error is re-raised once no more
+        attempts are allowed. With a deadline, `func` is also passed the
+        seconds left as a `timeout` keyword argument."""
+
+        start = self.clock()
+        self._count('calls')
+        attempt = 0
+        while True:
+            self._count('attempts')
+            if self.deadline is not None:
+                # A timeout of 0 would make the socket non-blocking
+                kwargs['timeout'] = max(
+                    self.deadline - (self.clock() - start), 0.001)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                if not self.shouldRetry(method, e):
+                    raise
+                delay = self.delayFor(attempt - 1, e)
+                if (attempt >= self.maxAttempts or
+                        (self.deadline is not None and
+                         self.clock() + delay - start >= self.deadline)):
+                    self._count('giveUps')
+                    raise
+            self._count('retries')
+            self._count('sleptSeconds', delay)
+            self.sleep(delay)
+
+    def shouldRetry(self, method, error):
+        """Return whether `error`, raised by an HTTP `method` call, may be
+        retried."""
+
+        if method not in self.retryMethods:
+            return False
+        if isinstance(error, urllib2.HTTPError):
+            return error.code in self.retryStatuses
+        return isinstance(error, self.retryExceptions)
+
+    def delayFor(self, attempt, error=None):
+        """Return the delay before retry number `attempt` (counting from
+        0). A Retry-After header on `error` is honored as a lower bound."""
+
+        delay = random.uniform(0, min(self.maxBackoff,
+                                      self.backoff * 2 ** attempt))
+        retryAfter = None
+        if isinstance(error, urllib2.HTTPError) and error.hdrs is not None:
+            retryAfter = error.hdrs.getheader('Retry-After')
+        if retryAfter and retryAfter.isdigit():
+            delay = max(delay, float(retryAfter))
+        return delay
+
+    def stats(self):
+        """Return a snapshot of the call, attempt and retry counters."""
+
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, stat, amount=1):
+        with self._lock:
+            self._stats[stat] += amount
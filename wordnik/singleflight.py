@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Coalescing of identical concurrent calls: while a call for a key is in
+flight, other callers asking for the same key wait for it and share its
+result instead of repeating the work."""
+
+import sys
+import threading
+
+from batch import reraise
+
+
+class Call:
+    """A call in flight; `done` is set once `value` or `excInfo` is."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.excInfo = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time. Callers may be any threads,
+    including the workers of an `asyncapi.AsyncApiClient`."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'shared': 0}
+
+    def do(self, key, func, *args):
+        """Return `func(*args)`. If a call for `key` is already in flight,
+        wait for it and return its result, or raise its exception, instead
+        of calling `func` again."""
+
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = Call()
+                leader = True
+            else:
+                self._stats['shared'] += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.excInfo is not None:
+                reraise(call.excInfo)
+            return call.value
+
+        try:
+            call.value = func(*args)
+        except BaseException:
+            call.excInfo = sys.exc_info()
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def stats(self):
+        """Return the number of calls made and of calls that shared the
+        result of one already in flight."""
+
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,819 @@
+#!/usr/bin/env python
+"""A local stand-in for the Wordnik v4 API, so that the tests and benchmarks
+can run without network access or an API key.
+
+The stub implements the routes used by WordApi, WordsApi, WordListApi,
+WordListsApi and AccountApi, and serves synthetic responses shaped like the
+real ones. Any word is known; response sizes are configurable, and latency
+and errors can be injected. Accounts and word lists are kept in memory, so
+authenticating, creating lists and adding or removing words behave as they
+do against the real API. Successful GETs carry an `ETag`, and a matching
+`If-None-Match` is answered with 304 Not Modified.
+
+Run it on its own with
+
+    python -m wordnik.stubserver --port 8000 --latency 0.05
+
+and point an ApiClient at http://127.0.0.1:8000/v4 with any API key. The
+payload builders, such as `definitions(count)`, can also be used directly to
+get decoded JSON without a server.
+"""
+
+import re
+import sys
+import json
+import time
+import hashlib
+import random
+import socket
+import urllib
+import urlparse
+import threading
+import SocketServer
+import BaseHTTPServer
+from collections import OrderedDict
+
+
+partsOfSpeech = ['noun', 'verb', 'adjective', 'adverb', 'idiom']
+dictionaries = ['ahd-legacy', 'century', 'wiktionary', 'webster', 'wordnet']
+relationshipTypes = ['synonym', 'antonym', 'hypernym', 'rhyme', 'same-context']
+
+letterScores = dict(
+    [(letter, 1) for letter in 'aeilnorstu'] +
+    [(letter, 2) for letter in 'dg'] +
+    [(letter, 3) for letter in 'bcmp'] +
+    [(letter, 4) for letter in 'fhvwy'] +
+    [('k', 5), ('j', 8), ('x', 8), ('q', 10), ('z', 10)])
+
+# Number of items each endpoint has available for a word or query; `limit`
+# and `skip` then select from these.
+defaultSizes = {
+    'definitions': 20,
+    'phraseDefinitions': 1,  # for words containing a space
+    'examples': 50,
+    'relatedWords': 10,  # words per relationship type
+    'pronunciations': 5,
+    'audio': 5,
+    'phrases': 10,
+    'frequencyYears': 100,
+    'searchResults': 500,
+    'reverseDictionary': 300,
+    'randomWords': 10,  # default limit of getRandomWords
+}
+
+
+def timestamp(seconds):
+    """Format a time the way the API does."""
+
+    return time.strftime('%Y-%m-%dT%H:%M:%S.000+0000', time.gmtime(seconds))
+
+
+def definitions(count, wordName='cat'):
+    """A getDefinitions response with `count` definitions, each carrying
+    the nested citations, labels, related words, notes and text
+    pronunciations that make large responses expensive."""
+
+    return [{
+        'word': wordName,
+        'text': 'A small domesticated carnivorous mammal, sense %d, with '
+                'soft fur, a short snout and retractable claws.' % i,
+        'partOfSpeech': partsOfSpeech[i % len(partsOfSpeech)],
+        'sourceDictionary': dictionaries[i % len(dictionaries)],
+        'attributionText': 'from The Century Dictionary and Cyclopedia',
+        'attributionUrl': 'http://www.wordnik.com/about',
+        'sequence': str(i),
+        'seqString': '%d.' % (i + 1),
+        'score': 0.0,
+        'extendedText': None,
+        'citations': [{'cite': 'The cat sat on the mat, quote %d.' % j,
+                       'source': 'Anonymous'} for j in range(2)],
+        'labels': [{'text': 'informal', 'type': 'register'}],
+        'exampleUses': [{'text': 'She fed the %s.' % wordName}],
+        'relatedWords': [{'relationshipType': 'synonym',
+                          'words': ['feline', 'kitty', 'puss'],
+                          'gram': None, 'label1': None, 'label2': None,
+                          'label3': None, 'label4': None}],
+        'notes': [{'noteType': 'usage', 'value': 'Often affectionate.',
+                   'appliesTo': ['noun'], 'pos': 0}],
+        'textProns': [{'raw': '(k\xc3\xa6t)'.decode('utf8'), 'seq': 0,
+                       'rawType': 'ahd-legacy'}],
+    } for i in range(count)]
+
+
+def wordSearchResults(count, query='word', skip=0, total=None):
+    """A searchWords response with `count` results starting at `skip`. The
+    first result is the query itself."""
+
+    return {
+        'totalResults': count * 10 if total is None else total,
+        'searchResults': [{'word': query if i == 0 else '%s%d' % (query, i),
+                           'count': 1000 + i,
+                           'lexicality': (i % 100) / 100.0}
+                          for i in range(skip, skip + count)],
+    }
+
+
+def definitionSearchResults(count, query='word', skip=0, total=None):
+    """A reverseDictionary response with `count` results starting at
+    `skip`."""
+
+    results = definitions(count, query)
+    for (i, result) in enumerate(results):
+        result['word'] = '%s%d' % (query, skip + i)
+    return {'totalResults': count * 10 if total is None else total,
+            'results': results}
+
+
+def frequencySummary(years, wordName='cat'):
+    """A getWordFrequency response covering `years` years."""
+
+    return {
+        'word': wordName,
+        'totalCount': 123456,
+        'unknownYearCount': 17,
+        'frequencyString': '',
+        'frequency': [{'year': 1800 + i, 'count': 100 + i}
+                      for i in range(years)],
+    }
+
+
+def example(i, wordName='cat'):
+    return {
+        'id': i, 'exampleId': 1000 + i, 'documentId': 2000 + i,
+        'title': 'A Book About Cats, volume %d' % i,
+        'text': 'The %s, which had been asleep, opened one eye.' % wordName,
+        'word': wordName, 'year': 1900 + i % 100, 'rating': 500.0,
+        'url': 'http://api.wordnik.com/v4/mid/%d' % i,
+        'provider': {'id': 711, 'name': 'gutenberg'},
+        'score': {'word': wordName, 'position': 4, 'score': 0.5},
+        'sentence': None,
+    }
+
+
+def exampleSearchResults(count, wordName='cat', skip=0):
+    """A getExamples response with `count` examples starting at `skip`."""
+
+    return {
+        'facets': [],
+        'examples': [example(i, wordName) for i in range(skip, skip + count)],
+    }
+
+
+def relatedWords(wordName, types, count):
+    return [{'relationshipType': relationshipType,
+             'words': ['%s-%s%d' % (wordName, relationshipType, i)
+                       for i in range(count)],
+             'gram': None, 'label1': None, 'label2': None, 'label3': None,
+             'label4': None}
+            for relationshipType in types]
+
+
+def syllables(wordName):
+    """Split a word into syllables of at most three letters."""
+
+    return [{'text': wordName[i:i + 3], 'seq': i // 3, 'type': None}
+            for i in range(0, len(wordName), 3)]
+
+
+def audioFiles(count, wordName='cat'):
+    return [{'id': i, 'word': wordName, 'audioType': 'pronunciation',
+             'fileUrl': 'http://api.wordnik.com/v4/audio/%s/%d.mp3'
+                        % (urllib.quote(wordName.encode('utf8')), i),
+             'attributionText': 'from the American Heritage Dictionary',
+             'attributionUrl': 'http://www.ahdictionary.com/',
+             'createdBy': 'ahd', 'createdAt': timestamp(1325376000),
+             'duration': 1.5, 'commentCount': 0, 'voteCount': 0,
+             'voteAverage': 0.0, 'voteWeightedAverage': 0.0,
+             'description': None}
+            for i in range(count)]
+
+
+class StubError(Exception):
+    """Raised by a route to answer with an error status."""
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+        self.message = message
+
+
+class StubRequest:
+    """What a route gets to see of a request: path parameters, query
+    parameters, headers and the decoded JSON body."""
+
+    def __init__(self, params, query, headers, body):
+        self.params = params
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def word(self):
+        return self.params['word']
+
+    def intParam(self, name, default):
+        try:
+            return int(self.query.get(name, default))
+        except ValueError:
+            raise StubError(400, 'invalid %s' % name)
+
+    def flag(self, name):
+        return self.query.get(name, 'false').lower() == 'true'
+
+    def page(self, available, defaultLimit=None):
+        """Return (skip, count) for the skip and limit parameters, out of
+        `available` items."""
+
+        skip = self.intParam('skip', 0)
+        limit = self.intParam('limit', available if defaultLimit is None
+                              else defaultLimit)
+        return skip, max(min(limit, available - skip), 0)
+
+
+# (method, resource path template, name of the StubServer method handling
+# it). The templates are those of the generated Api classes.
+routes = [
+    ('GET', '/word.{format}/{word}/examples', 'getExamples'),
+    ('GET', '/word.{format}/{word}', 'getWord'),
+    ('GET', '/word.{format}/{word}/definitions', 'getDefinitions'),
+    ('GET', '/word.{format}/{word}/topExample', 'getTopExample'),
+    ('GET', '/word.{format}/{word}/relatedWords', 'getRelatedWords'),
+    ('GET', '/word.{format}/{word}/pronunciations', 'getTextPronunciations'),
+    ('GET', '/word.{format}/{word}/hyphenation', 'getHyphenation'),
+    ('GET', '/word.{format}/{word}/frequency', 'getWordFrequency'),
+    ('GET', '/word.{format}/{word}/phrases', 'getPhrases'),
+    ('GET', '/word.{format}/{word}/etymologies', 'getEtymologies'),
+    ('GET', '/word.{format}/{word}/audio', 'getAudio'),
+    ('GET', '/word.{format}/{word}/scrabbleScore', 'getScrabbleScore'),
+    ('GET', '/words.{format}/search/{query}', 'searchWords'),
+    ('GET', '/words.{format}/wordOfTheDay', 'getWordOfTheDay'),
+    ('GET', '/words.{format}/reverseDictionary', 'reverseDictionary'),
+    ('GET', '/words.{format}/randomWords', 'getRandomWords'),
+    ('GET', '/words.{format}/randomWord', 'getRandomWord'),
+    ('GET', '/account.{format}/authenticate/{username}', 'authenticate'),
+    ('POST', '/account.{format}/authenticate/{username}', 'authenticatePost'),
+    ('GET', '/account.{format}/wordLists', 'getWordListsForLoggedInUser'),
+    ('GET', '/account.{format}/apiTokenStatus', 'getApiTokenStatus'),
+    ('GET', '/account.{format}/user', 'getLoggedInUser'),
+    ('PUT', '/wordList.{format}/{permalink}', 'updateWordList'),
+    ('DELETE', '/wordList.{format}/{permalink}', 'deleteWordList'),
+    ('GET', '/wordList.{format}/{permalink}', 'getWordListByPermalink'),
+    ('POST', '/wordList.{format}/{permalink}/words', 'addWordsToWordList'),
+    ('GET', '/wordList.{format}/{permalink}/words', 'getWordListWords'),
+    ('POST', '/wordList.{format}/{permalink}/deleteWords',
+     'deleteWordsFromWordList'),
+    ('POST', '/wordLists.{format}', 'createWordList'),
+]
+
+
+def compileRoute(template):
+    """Compile a resource path template into a regex whose named groups
+    capture the path parameters."""
+
+    parts = re.split('(\{[^}]+\})', template.replace('{format}', 'json'))
+    pattern = ''.join('(?P<%s>[^/]+)' % part[1:-1] if part.startswith('{')
+                      else re.escape(part) for part in parts)
+    return re.compile(pattern + '$')
+
+
+class StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Request handler that reads the request body and answers with what
+    `server.stub.handle(method, path, headers, body)` returns, a (status,
+    JSON document, extra headers) tuple."""
+
+    protocol_version = 'HTTP/1.1'
+    # Whether successful GETs get an ETag, and a matching If-None-Match a
+    # 304
+    etags = True
+    # Buffer each response and send it in one write, flushed after the
+    # request is handled; line-by-line writes of the headers run into
+    # delayed ACKs and cost ~40ms per request.
+    wbufsize = -1
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        # Bodies larger than the write buffer still go out in several
+        # writes; without this the last one waits on a delayed ACK.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        length = int(self.headers.getheader('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        status, doc, headers = self.server.stub.handle(
+            self.command, self.path, self.headers, body)
+        data = json.dumps(doc) if doc is not None else ''
+        if self.etags and self.command == 'GET' and status == 200:
+            etag = '"%s"' % hashlib.sha1(data).hexdigest()
+            headers = dict(headers, ETag=etag)
+            if self.headers.getheader('If-None-Match') == etag:
+                status, data = 304, ''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for (name, value) in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def log_message(self, *args):
+        if self.server.stub.verbose:
+            BaseHTTPServer.BaseHTTPRequestHandler.log_message(self, *args)
+
+
+class StubHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, *args):
+        BaseHTTPServer.HTTPServer.__init__(self, *args)
+        self.connections = set()
+        self.connectionsChanged = threading.Condition()
+
+    def process_request(self, request, clientAddress):
+        with self.connectionsChanged:
+            self.connections.add(request)
+        SocketServer.ThreadingMixIn.process_request(self, request,
+                                                    clientAddress)
+
+    def handle_error(self, request, clientAddress):
+        # Clients hanging up early, e.g. after a timeout, are expected
+        if not isinstance(sys.exc_info()[1], socket.error):
+            BaseHTTPServer.HTTPServer.handle_error(self, request,
+                                                   clientAddress)
+
+    def shutdown_request(self, request):
+        BaseHTTPServer.HTTPServer.shutdown_request(self, request)
+        with self.connectionsChanged:
+            self.connections.discard(request)
+            self.connectionsChanged.notifyAll()
+
+    def closeConnections(self, timeout=1.0):
+        """Disconnect the clients still holding keep-alive connections, and
+        wait for their handler threads to finish."""
+
+        deadline = time.time() + timeout
+        with self.connectionsChanged:
+            for request in self.connections:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except socket.error:
+                    pass
+            while self.connections and time.time() < deadline:
+                self.connectionsChanged.wait(deadline - time.time())
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server answering like api.wordnik.com/v4.
+
+    Args:
+        host, port -- address to listen on; port 0 picks a free port
+        sizes -- dict overriding entries of `defaultSizes`, the number of
+            items each endpoint has available
+        latency -- seconds to wait before answering each request
+        jitter -- extra random delay of up to this many seconds
+        errorRate -- fraction of requests, between 0 and 1, answered with
+            `errorStatus` instead
+        errorStatus -- HTTP status of the injected errors
+        quota -- calls per hour reported by getApiTokenStatus
+        seed -- seed for the latency jitter and error injection
+        verbose -- True to log every request to stderr
+    """
+
+    basePath = '/v4'
+
+    def __init__(self, host='127.0.0.1', port=0, sizes=None, latency=0.0,
+                 jitter=0.0, errorRate=0.0, errorStatus=503, quota=100000,
+                 seed=None, verbose=False):
+        self.sizes = dict(defaultSizes)
+        self.sizes.update(sizes or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.errorStatus = errorStatus
+        self.quota = quota
+        self.verbose = verbose
+        self.routes = [(method, compileRoute(template), getattr(self, name))
+                       for (method, template, name) in routes]
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'injectedErrors': 0}
+        self._users = {}  # username -> user
+        self._tokens = {}  # auth token -> username
+        self._wordLists = OrderedDict()  # permalink -> (word list, words)
+        self._nextId = 1
+
+        self.server = StubHTTPServer((host, port), StubHandler)
+        self.server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL to pass to ApiClient as the apiServer."""
+
+        host, port = self.server.server_address[:2]
+        return 'http://%s:%d%s' % (host, port, self.basePath)
+
+    def start(self):
+        """Serve on a background daemon thread. Returns the server."""
+
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        args=(0.01,))
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and disconnect all clients."""
+
+        self.server.shutdown()
+        self.server.closeConnections()
+        self.server.server_close()
+
+    def stats(self):
+        """Return the number of requests served and of injected errors."""
+
+        with self._lock:
+            return dict(self._stats)
+
+    def handle(self, method, path, headers, body):
+        """Answer one request. Returns (status, JSON document, extra
+        response headers)."""
+
+        with self._lock:
+            self._stats['requests'] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            injectError = self._random.random() < self.errorRate
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            url = urlparse.urlsplit(path)
+            if not url.path.startswith(self.basePath + '/'):
+                raise StubError(404, 'not found')
+            route, params = self._route(method, url.path[len(self.basePath):])
+            if route is None:
+                return 200, self._listing(params), {}
+            if not headers.getheader('api_key'):
+                raise StubError(401, 'unauthorized')
+            if injectError:
+                with self._lock:
+                    self._stats['injectedErrors'] += 1
+                raise StubError(self.errorStatus, 'injected error')
+            query = dict((name, value.decode('utf8')) for (name, value)
+                         in urlparse.parse_qsl(url.query, True))
+            try:
+                doc = json.loads(body) if body else None
+            except ValueError:
+                raise StubError(400, 'invalid JSON body')
+            response = route(StubRequest(params, query, headers, doc))
+        except StubError as e:
+            return e.status, {'type': 'error', 'message': e.message}, {}
+        if len(response) == 2:
+            return response + ({},)
+        return response
+
+    def _route(self, method, path):
+        """Return (route, path parameters) for a request. A GET of a
+        resource such as '/word.json' returns (None, resource name), for the
+        resource listing."""
+
+        allowed = False
+        for (routeMethod, pattern, route) in self.routes:
+            match = pattern.match(path)
+            if match:
+                if routeMethod == method:
+                    params = dict((name, urllib.unquote(value).decode('utf8'))
+                                  for (name, value)
+                                  in match.groupdict().items())
+                    return route, params
+                allowed = True
+        if method == 'GET' and re.match('/\w+\.json$', path):
+            return None, path[1:-len('.json')]
+        if allowed:
+            raise StubError(405, 'method not allowed')
+        raise StubError(404, 'not found')
+
+    def _listing(self, resource):
+        """The Swagger listing of a resource's operations."""
+
+        apis = OrderedDict()
+        for (method, template, name) in routes:
+            if template.startswith('/%s.{format}' % resource):
+                operations = apis.setdefault(template, [])
+                operations.append({'httpMethod': method, 'nickname': name})
+        if not apis:
+            raise StubError(404, 'not found')
+        return {'apiVersion': '4.0', 'swaggerVersion': '1.1',
+                'basePath': self.url, 'resourcePath': '/' + resource,
+                'apis': [{'path': template, 'operations': operations}
+                         for (template, operations) in apis.items()]}
+
+    # WordApi
+
+    def getExamples(self, request):
+        skip, count = request.page(self.sizes['examples'], 5)
+        return 200, exampleSearchResults(count, request.word(), skip)
+
+    def getWord(self, request):
+        word = request.word()
+        if request.flag('useCanonical'):
+            word = word.lower()
+        doc = {'id': 0, 'word': word, 'canonicalForm': word.lower(),
+               'originalWord': request.word(), 'vulgar': None,
+               'suggestions': []}
+        if request.flag('includeSuggestions'):
+            doc['suggestions'] = [word.lower()]
+        return 200, doc
+
+    def getDefinitions(self, request):
+        word = request.word()
+        if ' ' in word:
+            available = self.sizes['phraseDefinitions']
+        else:
+            available = self.sizes['definitions']
+        skip, count = request.page(available, 200)
+        return 200, definitions(count, word)
+
+    def getTopExample(self, request):
+        return 200, example(0, request.word())
+
+    def getRelatedWords(self, request):
+        types = request.query.get('relationshipTypes')
+        types = types.split(',') if types else relationshipTypes
+        count = min(request.intParam('limitPerRelationshipType', 10),
+                    self.sizes['relatedWords'])
+        return 200, relatedWords(request.word(), types, count)
+
+    def getTextPronunciations(self, request):
+        skip, count = request.page(self.sizes['pronunciations'], 50)
+        return 200, [{'raw': '(%s)' % request.word(), 'seq': i,
+                      'rawType': 'ahd-legacy'} for i in range(count)]
+
+    def getHyphenation(self, request):
+        parts = syllables(request.word())
+        skip, count = request.page(len(parts), 50)
+        return 200, parts[skip:skip + count]
+
+    def getWordFrequency(self, request):
+        return 200, frequencySummary(self.sizes['frequencyYears'],
+                                     request.word())
+
+    def getPhrases(self, request):
+        skip, count = request.page(self.sizes['phrases'], 5)
+        word = request.word()
+        return 200, [{'gram1': word, 'gram2': 'phrase%d' % i,
+                      'count': 100 - i, 'mi': 5.0, 'wlmi': 7.5}
+                     for i in range(count)]
+
+    def getEtymologies(self, request):
+        return 200, ['<ety>[Middle English %s, from Old English, from '
+                     'Latin, perhaps of Scythian origin.]</ety>'
+                     % request.word()]
+
+    def getAudio(self, request):
+        skip, count = request.page(self.sizes['audio'], 50)
+        return 200, audioFiles(count, request.word())
+
+    def getScrabbleScore(self, request):
+        return 200, {'value': sum(letterScores.get(letter, 0)
+                                  for letter in request.word().lower())}
+
+    # WordsApi
+
+    def searchWords(self, request):
+        total = self.sizes['searchResults']
+        skip, count = request.page(total, 10)
+        return 200, wordSearchResults(count, request.params['query'], skip,
+                                      total)
+
+    def getWordOfTheDay(self, request):
+        now = time.time()
+        return 200, {
+            'id': 1, 'word': 'serendipity', 'parentId': None,
+            'category': None, 'createdBy': 'wordnik',
+            'createdAt': timestamp(now), 'publishDate': timestamp(now),
+            'contentProvider': {'id': 711, 'name': 'wordnik'},
+            'htmlExtra': None, 'note': 'A happy accident.',
+            'definitions': [{'text': 'The faculty of making fortunate '
+                             'discoveries by accident.',
+                             'source': 'ahd-legacy', 'note': None,
+                             'partOfSpeech': 'noun'}],
+            'examples': [{'id': 1, 'title': 'An Example',
+                          'text': 'It was pure serendipity.',
+                          'url': 'http://www.wordnik.com/'}],
+        }
+
+    def reverseDictionary(self, request):
+        query = request.query.get('query')
+        if not query:
+            raise StubError(400, 'query is required')
+        total = self.sizes['reverseDictionary']
+        skip, count = request.page(total, 10)
+        return 200, definitionSearchResults(count, query, skip, total)
+
+    def getRandomWords(self, request):
+        count = request.intParam('limit', self.sizes['randomWords'])
+        return 200, [self._randomWord() for i in range(count)]
+
+    def getRandomWord(self, request):
+        return 200, self._randomWord()
+
+    def _randomWord(self):
+        with self._lock:
+            i = self._random.randint(0, 99999)
+        word = 'random%d' % i
+        return {'id': i, 'word': word, 'canonicalForm': word,
+                'originalWord': None, 'vulgar': None, 'suggestions': []}
+
+    # AccountApi
+
+    def authenticate(self, request):
+        return 200, self._login(request.params['username'])
+
+    def authenticatePost(self, request):
+        if request.body is None:
+            raise StubError(400, 'password is required')
+        return 200, self._login(request.params['username'])
+
+    def getWordListsForLoggedInUser(self, request):
+        user = self._user(request)
+        with self._lock:
+            wordLists = [dict(wordList) for (wordList, words)
+                         in self._wordLists.values()
+                         if wordList['username'] == user['username']]
+        skip, count = request.page(len(wordLists), 50)
+        return 200, wordLists[skip:skip + count]
+
+    def getApiTokenStatus(self, request):
+        with self._lock:
+            served = self._stats['requests']
+        return 200, {'valid': True, 'token': request.headers.getheader(
+                         'api_key'),
+                     'resetsInMillis': 3600 * 1000,
+                     'remainingCalls': max(self.quota - served, 0),
+                     'expiresInMillis': 0, 'totalRequests': served}
+
+    def getLoggedInUser(self, request):
+        user = self._user(request)
+        return 200, dict(user)
+
+    def _login(self, username):
+        """Return a new AuthenticationToken for `username`, creating the
+        user, with one word list, on first login."""
+
+        with self._lock:
+            user = self._users.get(username)
+            if user is None:
+                user = {'id': self._newId(), 'username': username,
+                        'userName': username, 'displayName': username,
+                        'email': '%s@example.com' % username, 'status': 0,
+                        'faceBookId': None, 'password': None}
+                self._users[username] = user
+                wordList = self._createWordList(user, {'name': 'stub list',
+                                                       'type': 'PUBLIC'})
+                self._addWords(user, wordList, ['cat', 'dog', 'serendipity'])
+            token = '%032x' % self._random.getrandbits(128)
+            self._tokens[token] = username
+        return {'token': token, 'userId': user['id'],
+                'userSignature': 'signature-%s' % token[:8]}
+
+    def _user(self, request):
+        token = request.headers.getheader('auth_token')
+        with self._lock:
+            username = self._tokens.get(token)
+            if username is None:
+                raise StubError(401, 'invalid auth_token')
+            return self._users[username]
+
+    # WordListApi and WordListsApi
+
+    def createWordList(self, request):
+        user = self._user(request)
+        with self._lock:
+            wordList = self._createWordList(user, request.body or {})
+            return 200, dict(wordList)
+
+    def getWordListByPermalink(self, request):
+        wordList, words = self._wordList(request)
+        with self._lock:
+            return 200, dict(wordList)
+
+    def updateWordList(self, request):
+        wordList, words = self._wordList(request)
+        with self._lock:
+            for field in ('name', 'description', 'type'):
+                if request.body and request.body.get(field) is not None:
+                    wordList[field] = request.body[field]
+            wordList['updatedAt'] = timestamp(time.time())
+        return 200, None
+
+    def deleteWordList(self, request):
+        wordList, words = self._wordList(request)
+        with self._lock:
+            del self._wordLists[wordList['permalink']]
+        return 200, None
+
+    def addWordsToWordList(self, request):
+        wordList, words = self._wordList(request)
+        user = self._user(request)
+        with self._lock:
+            self._addWords(user, wordList, [value['word'] for value
+                                            in request.body or []])
+        return 200, None
+
+    def getWordListWords(self, request):
+        wordList, words = self._wordList(request)
+        with self._lock:
+            skip, count = request.page(len(words), 100)
+            return 200, [dict(word) for word in words[skip:skip + count]]
+
+    def deleteWordsFromWordList(self, request):
+        wordList, words = self._wordList(request)
+        removed = set(value['word'] for value in request.body or [])
+        with self._lock:
+            words[:] = [word for word in words if word['word'] not in removed]
+            wordList['numberWordsInList'] = len(words)
+        return 200, None
+
+    def _wordList(self, request):
+        """Return (word list, words) for the permalink of a request, after
+        checking its auth token."""
+
+        self._user(request)
+        with self._lock:
+            try:
+                return self._wordLists[request.params['permalink']]
+            except KeyError:
+                raise StubError(404, 'word list not found')
+
+    def _createWordList(self, user, fields):
+        """Must be called with the lock held."""
+
+        listId = self._newId()
+        now = timestamp(time.time())
+        wordList = {'id': listId, 'permalink': 'stub-list-%d' % listId,
+                    'name': fields.get('name') or 'list %d' % listId,
+                    'description': fields.get('description'),
+                    'type': fields.get('type') or 'PRIVATE',
+                    'username': user['username'], 'userId': user['id'],
+                    'createdAt': now, 'updatedAt': now,
+                    'lastActivityAt': now, 'numberWordsInList': 0}
+        self._wordLists[wordList['permalink']] = (wordList, [])
+        return wordList
+
+    def _addWords(self, user, wordList, newWords):
+        """Must be called with the lock held."""
+
+        words = self._wordLists[wordList['permalink']][1]
+        now = timestamp(time.time())
+        for word in newWords:
+            words.append({'id': self._newId(), 'word': word,
+                          'username': user['username'], 'userId': user['id'],
+                          'createdAt': now, 'numberCommentsOnWord': 0,
+                          'numberLists': 1})
+        wordList['numberWordsInList'] = len(words)
+
+    def _newId(self):
+        """Must be called with the lock held."""
+
+        self._nextId += 1
+        return self._nextId
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(
+        description='Serve a local stub of the Wordnik v4 API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds to wait before each response')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='extra random delay of up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests to fail')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--size', action='append', default=[],
+                        metavar='NAME=COUNT',
+                        help='override a response size, e.g. definitions=200')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    sizes = {}
+    for size in args.size:
+        name, count = size.split('=')
+        if name not in defaultSizes:
+            parser.error('unknown size %r, expected one of %s'
+                         % (name, ', '.join(sorted(defaultSizes))))
+        sizes[name] = int(count)
+    stub = StubServer(args.host, args.port, sizes, args.latency, args.jitter,
+                      args.error_rate, args.error_status,
+                      verbose=args.verbose)
+    sys.stderr.write('Serving the Wordnik API stub at %s\n' % stub.url)
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
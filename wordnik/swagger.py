@@ -8,24 +8,209 @@ import sys
 import os
 import re
 import urllib
+import socket
 import urllib2
 import httplib
-import json
+import urlparse
+import time
 import datetime
+import threading
+from StringIO import StringIO
+from contextlib import contextmanager
 
 from models import *
-
-
-class ApiClient:
-    """Generic API client for Swagger client library builds"""
-
-    def __init__(self, apiKey=None, apiServer=None):
+from transport import ConnectionPool
+from cache import cacheKey, headerTag, resourceRoot
+from singleflight import SingleFlight
+from metrics import Metrics
+import deserializer
+import jsoncodec
+
+# Finds a character that urllib.quote would escape
+needsQuoting = re.compile('[^A-Za-z0-9_.\-/]').search
+
+
+class ApiClient(object):
+    """Generic API client for Swagger client library builds.
+
+    A client can be shared by any number of threads. The connection pool,
+    cache, rate limiter and retry policy are all thread-safe, and session
+    state (the cookie set by the server, and the call options) is kept per
+    thread."""
+
+    # Options that can be set for a block of calls with `options()`
+    callOptions = ('useCache', 'raw', 'lazy', 'coalesce', 'serveStale')
+    # Threads refreshing stale cache entries in the background
+    refreshWorkers = 4
+    # Redirects followed for a GET or HEAD before giving up, as urllib2
+    # allows
+    maxRedirects = 10
+    redirectStatuses = (301, 302, 303, 307, 308)
+
+    def __init__(self, apiKey=None, apiServer=None, pool=None,
+                 rateLimiter=None, retryPolicy=None, cache=None, raw=False,
+                 lazy=False, coalesce=True, metrics=None,
+                 jsonBackend=None, serveStale=False):
+        """Args:
+            apiKey -- Wordnik API key sent with every request
+            apiServer -- base URL, e.g. 'http://api.wordnik.com/v4'
+            pool -- `transport.ConnectionPool` to send requests through. A
+                private keep-alive pool is created when omitted; pass a
+                shared one to reuse connections across clients.
+            rateLimiter -- optional `ratelimit.QuotaRateLimiter`; every call
+                waits for it before going out
+            retryPolicy -- optional `retry.RetryPolicy` for transient
+                failures; without one, errors propagate immediately
+            cache -- optional cache for GET responses, e.g. an in-memory
+                `cache.ResponseCache` or an on-disk `diskcache.DiskCache`
+            raw -- what the Api methods return instead of model objects:
+                True for the decoded JSON as-is, 'namedtuple' for light
+                namedtuples. Raw results may be shared with the cache, so
+                treat them as read-only.
+            lazy -- True to return models whose nested list and model
+                fields (e.g. Definition.citations, Example.provider) are
+                only deserialized when first read
+            coalesce -- when True, identical GETs made concurrently by
+                several threads share one request and its decoded result
+            metrics -- `metrics.Metrics` to record per-endpoint counters
+                and latencies in. A private one is created when omitted;
+                read it with `client.metrics.snapshot()`.
+            jsonBackend -- name of the `jsoncodec` backend to encode and
+                decode JSON with, e.g. 'json' for the standard library, or
+                a `jsoncodec.Backend`. The fastest installed one is used
+                when omitted.
+            serveStale -- True to answer from an expired cache entry still
+                inside the cache's grace period at once, and refresh it in
+                the background. Only one refresh per entry runs at a time.
+                If it fails, the entry keeps being served, up to the cache's
+                `maxStale`."""
         if apiKey == None:
             raise Exception('You must pass an apiKey when instantiating the '
                             'APIClient')
+        self._local = threading.local()
         self.apiKey = apiKey
         self.apiServer = apiServer
-        self.cookie = None
+        self.pool = pool if pool is not None else ConnectionPool()
+        self.rateLimiter = rateLimiter
+        self.retryPolicy = retryPolicy
+        self.cache = cache
+        self.raw = raw
+        self.lazy = lazy
+        self.inFlight = SingleFlight() if coalesce else None
+        self.metrics = metrics if metrics is not None else Metrics()
+        if isinstance(jsonBackend, jsoncodec.Backend):
+            self.json = jsonBackend
+        else:
+            self.json = jsoncodec.backend(jsonBackend)
+        self.serveStale = serveStale
+        self._refresher = None  # thread pool, created on first use
+        self._refreshing = set()  # keys of the entries being refreshed
+        self._refreshLock = threading.Lock()
+
+    @property
+    def cookie(self):
+        """The session cookie the server last set for the current thread."""
+
+        return getattr(self._local, 'cookie', None)
+
+    @cookie.setter
+    def cookie(self, value):
+        self._local.cookie = value
+
+    @contextmanager
+    def options(self, **options):
+        """Apply call options to every call the current thread makes
+        inside the `with` block, e.g.
+
+            with client.options(useCache=False):
+                definitions = wordApi.getDefinitions('cat')
+
+        Options:
+            useCache -- False to bypass the client's cache
+            raw -- overrides the client's `raw` setting
+            lazy -- overrides the client's `lazy` setting
+            coalesce -- False to send GETs even if an identical one is
+                already in flight
+            serveStale -- overrides the client's `serveStale` setting
+        """
+
+        for name in options:
+            if name not in self.callOptions:
+                raise TypeError("Got an unexpected call option '%s'" % name)
+        previous = self.currentOptions()
+        current = dict(previous)
+        current.update(options)
+        self._local.options = current
+        try:
+            yield
+        finally:
+            self._local.options = previous
+
+    def currentOptions(self):
+        """Return the call options in effect for the current thread."""
+
+        return getattr(self._local, 'options', {})
+
+    def withCurrentOptions(self, func):
+        """Return a wrapper of `func` that applies the current thread's call
+        options, for handing work over to another thread."""
+
+        options = self.currentOptions()
+
+        def run(*args, **kwargs):
+            with self.options(**options):
+                return func(*args, **kwargs)
+
+        return run
+
+    def dispatch(self, endpoint, args, kwargs):
+        """Make the call an `endpoints.Endpoint` describes, with the
+        positional `args` and keyword `kwargs` a generated Api method was
+        called with, and return its deserialized response."""
+
+        toPathValue = self.toPathValue
+        pathValues = []
+        queryParams = {}
+        headerParams = {}
+        postData = None
+
+        for ((name, kind), value) in zip(endpoint.positional, args):
+            if kind == 'path':
+                pathValues.append(toPathValue(value))
+            elif kind == 'query':
+                queryParams[name] = toPathValue(value)
+            elif kind == 'header':
+                headerParams[name] = value
+            else:
+                postData = value
+
+        if kwargs:
+            kinds = endpoint.kinds
+            for (name, value) in kwargs.iteritems():
+                kind = kinds.get(name)
+                if kind == 'query':
+                    queryParams[name] = toPathValue(value)
+                elif kind == 'header':
+                    headerParams[name] = value
+                elif kind == 'body':
+                    postData = value
+                else:
+                    raise TypeError("Got an unexpected keyword argument '%s' "
+                                    "to method %s" % (name, endpoint.name))
+
+        resourcePath = endpoint.path
+        if pathValues:
+            resourcePath = resourcePath % tuple(pathValues)
+
+        response = self.callAPI(resourcePath, endpoint.method, queryParams,
+                                postData, headerParams)
+
+        if endpoint.returns is None or not response:
+            return None
+        # Passed on rather than looked up by `deserialize`, as calls made
+        # while this one was out, e.g. by the rate limiter, have their own
+        return self.deserialize(response, endpoint.returns,
+                                self.metrics.endpointFor(resourcePath))
 
     def callAPI(self, resourcePath, method, queryParams, postData,
                 headerParams=None):
@@ -39,47 +224,190 @@ class ApiClient:
         headers['Content-type'] = 'application/json'
         headers['api_key'] = self.apiKey
 
-        if self.cookie:
-            headers['Cookie'] = self.cookie
+        cookie = self.cookie
+        if cookie:
+            headers['Cookie'] = cookie
 
         data = None
+        key = None
+        storeKey = None
+        endpoint = self.metrics.endpointFor(resourcePath)
 
         if method == 'GET':
 
-            if queryParams:
-                # Need to remove None values, these should not be sent
-                sentQueryParams = {}
-                for param, value in queryParams.items():
-                    if value != None:
-                        sentQueryParams[param] = value
-                url = url + '?' + urllib.urlencode(sentQueryParams)
+            if self.cache is not None or self.inFlight is not None:
+                key = cacheKey(resourcePath, queryParams, headerParams)
+            options = self.currentOptions()
+            if self.cache is not None and options.get('useCache', True):
+                serveStale = options.get('serveStale', self.serveStale)
+                entry = self.cache.get(key, serveStale)
+                if entry is not None:
+                    self.metrics.cacheHit(endpoint)
+                    if serveStale and not entry.isFresh(self.cache.clock()):
+                        self._refreshInBackground(
+                            key, self._withQuery(url, queryParams), headers,
+                            resourcePath, endpoint, cookie)
+                    return entry.data
+                storeKey = key
+                # Ask for a 304 instead of the body if a stale copy is kept
+                headers.update(self.cache.conditionalHeaders(key))
+
+            url = self._withQuery(url, queryParams)
 
         elif method in ['POST', 'PUT', 'DELETE']:
 
             if postData:
                 headers['Content-type'] = 'application/json'
                 data = self.sanitizeForSerialization(postData)
-                data = json.dumps(data)
+                data = self.json.dumps(data)
 
         else:
             raise Exception('Method ' + method + ' is not recognized.')
 
-        request = MethodRequest(method=method, url=url, headers=headers,
-                                data=data)
-
-        # Make the request
-        response = urllib2.urlopen(request)
-        if 'Set-Cookie' in response.headers:
-            self.cookie = response.headers['Set-Cookie']
-        string = response.read()
+        if (key is not None and self.inFlight is not None and
+                self.currentOptions().get('coalesce', True)):
+            return self.inFlight.do((key, cookie), self._fetch, method, url,
+                                    data, headers, resourcePath, storeKey,
+                                    endpoint)
+        data = self._fetch(method, url, data, headers, resourcePath, storeKey,
+                           endpoint)
+        if method != 'GET' and self.cache is not None:
+            # The write may have changed what cached GETs of the resource,
+            # or of the user whose auth_token it carried, would return
+            self.cache.invalidateUnder(resourceRoot(resourcePath),
+                                       headerTag(headerParams))
+        return data
 
+    def _withQuery(self, url, queryParams):
+        """Return `url` with the non-None `queryParams` appended."""
+
+        if queryParams:
+            # Need to remove None values, these should not be sent
+            sentQueryParams = {}
+            for param, value in queryParams.items():
+                if value != None:
+                    sentQueryParams[param] = value
+            url = url + '?' + urllib.urlencode(sentQueryParams)
+        return url
+
+    def _refreshInBackground(self, key, url, headers, resourcePath, endpoint,
+                             cookie):
+        """Refresh the stale cache entry stored under `key` on a background
+        thread, unless that is already under way."""
+
+        with self._refreshLock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                # Imported here, as most clients never serve stale entries
+                from multiprocessing.pool import ThreadPool
+                self._refresher = ThreadPool(self.refreshWorkers)
+        self._refresher.apply_async(self._refresh, (key, url, headers,
+                                                    resourcePath, endpoint,
+                                                    cookie))
+
+    def _refresh(self, key, url, headers, resourcePath, endpoint, cookie):
         try:
-            data = json.loads(string)
+            headers = dict(headers)
+            headers.update(self.cache.conditionalHeaders(key))
+            if self.inFlight is not None:
+                self.inFlight.do((key, cookie), self._fetch, 'GET', url, None,
+                                 headers, resourcePath, key, endpoint)
+            else:
+                self._fetch('GET', url, None, headers, resourcePath, key,
+                            endpoint)
+        except Exception:
+            # Errors have been recorded in the metrics; keep answering with
+            # the old value meanwhile
+            self.cache.keepStale(key)
+        finally:
+            with self._refreshLock:
+                self._refreshing.discard(key)
+
+    def _fetch(self, method, url, data, headers, resourcePath, storeKey,
+               endpoint):
+        """Send a request and return its decoded JSON body, storing it in
+        the cache under `storeKey` unless that is None. A 304 Not Modified
+        answer to a conditional GET returns the cached data instead."""
+
+        response = self._request(method, url, data, headers, endpoint)
+
+        if response.status == 304 and storeKey is not None:
+            entry = self.cache.refresh(storeKey, resourcePath,
+                                       response.headers)
+            if entry is not None:
+                return entry.data
+            # Evicted while the request was out; fetch the body after all
+            headers = dict(headers)
+            headers.pop('If-None-Match', None)
+            headers.pop('If-Modified-Since', None)
+            response = self._request(method, url, data, headers, endpoint)
+
+        string = response.body
+
+        start = time.time()
+        try:
+            data = self.json.loads(string)
         except ValueError:  # PUT requests don't return anything
             data = None
+        self.metrics.observe(endpoint, 'decode', time.time() - start)
+
+        if storeKey is not None:
+            self.cache.set(storeKey, data, string, resourcePath,
+                           response.headers)
 
         return data
 
+    def _request(self, method, url, data, headers, endpoint):
+        """Send a request, retrying it as the retry policy allows, and keep
+        the session cookie the server sets."""
+
+        if self.retryPolicy is not None:
+            response = self.retryPolicy.call(method, self._send, method, url,
+                                             data, headers, endpoint)
+        else:
+            response = self._send(method, url, data, headers, endpoint)
+        if 'Set-Cookie' in response.headers:
+            self.cookie = response.headers['Set-Cookie']
+        return response
+
+    def _send(self, method, url, data, headers, endpoint, timeout=None):
+        """Make a single attempt at a request over a pooled keep-alive
+        connection, recording it under `endpoint`. `timeout` overrides the
+        pool's socket timeout. Redirects are followed for GET and HEAD;
+        errors, and any other 3xx answer but 304, are raised the way
+        urllib2.urlopen raises them."""
+
+        redirects = 0
+        while True:
+            if self.rateLimiter is not None:
+                self.rateLimiter.acquire(self)
+
+            try:
+                response = self.pool.request(method, url, data, headers,
+                                             timeout)
+            except socket.error as e:
+                self.metrics.request(endpoint, None)
+                raise urllib2.URLError(e)
+            except httplib.HTTPException:
+                self.metrics.request(endpoint, None)
+                raise
+            self.metrics.request(endpoint, response.status,
+                                 len(response.body), response.timings)
+            location = response.getheader('Location')
+            if (response.status in self.redirectStatuses and location and
+                    method in ('GET', 'HEAD') and
+                    redirects < self.maxRedirects):
+                url = urlparse.urljoin(url, location)
+                redirects += 1
+                continue
+            if response.status >= 300 and response.status != 304:
+                raise urllib2.HTTPError(url, response.status, response.reason,
+                                        response.headers,
+                                        StringIO(response.body))
+            return response
+
     def toPathValue(self, obj):
         """Convert a string or object to a path-friendly value
         Args:
@@ -87,12 +415,17 @@ class ApiClient:
         Returns:
             string -- quoted value
         """
-        if type(obj) == list:
-            return urllib.quote(','.join(obj))
+        if type(obj) == str:
+            value = obj
+        elif type(obj) == list:
+            value = ','.join(obj)
         elif type(obj) == unicode:
-            return urllib.quote(obj.encode('utf8'))
+            value = obj.encode('utf8')
         else:
-            return urllib.quote(str(obj))
+            value = str(obj)
+        if needsQuoting(value) is None:
+            return value  # what urllib.quote would return, only faster
+        return urllib.quote(value)
 
     def sanitizeForSerialization(self, obj):
         """Dump an object into JSON for POSTing."""
@@ -110,86 +443,41 @@ class ApiClient:
         else:
             if type(obj) == dict:
                 objDict = obj
+            elif hasattr(obj, 'swaggerTypes'):
+                # Models keep their fields in slots, not in a __dict__
+                objDict = dict((attr, getattr(obj, attr))
+                               for attr in obj.swaggerTypes)
             else:
                 objDict = obj.__dict__
             return {key: self.sanitizeForSerialization(val)
-                    for (key, val) in objDict.iteritems()
-                    if key != 'swaggerTypes'}
-
-        if type(postData) == list:
-            # Could be a list of objects
-            if type(postData[0]) in safeToDump:
-                data = json.dumps(postData)
-            else:
-                data = json.dumps([datum.__dict__ for datum in postData])
-        elif type(postData) not in safeToDump:
-            data = json.dumps(postData.__dict__)
+                    for (key, val) in objDict.iteritems()}
 
-    def deserialize(self, obj, objClass):
+    def deserialize(self, obj, objClass, endpoint='other'):
         """Derialize a JSON string into an object.
 
         Args:
             obj -- string or object to be deserialized
             objClass -- class literal for deserialzied object, or string
                 of class name
+            endpoint -- endpoint template to record the time taken under
+                in the metrics
         Returns:
             object -- deserialized object"""
 
-        # Have to accept objClass as string or actual type. Type could be a
-        # native Python type, or one of the model classes.
-        if type(objClass) == str:
-            if 'list[' in objClass:
-                match = re.match('list\[(.*)\]', objClass)
-                subClass = match.group(1)
-                return [self.deserialize(subObj, subClass) for subObj in obj]
-
-            if (objClass in ['int', 'float', 'long', 'dict', 'list', 'str', 'bool', 'datetime']):
-                objClass = eval(objClass)
-            else:  # not a native type, must be model class
-                objClass = eval(objClass + '.' + objClass)
-
-        if objClass == str:
+        options = self.currentOptions()
+        raw = options.get('raw', self.raw)
+        if raw == 'namedtuple':
+            mode = 'namedtuple'
+        elif raw:
             return obj
-        elif objClass in [int, long, float, dict, list, bool]:
-            return objClass(obj)
-        elif objClass == datetime:
-            # Server will always return a time stamp in UTC, but with
-            # trailing +0000 indicating no offset from UTC. So don't process
-            # last 5 characters.
-            return datetime.datetime.strptime(obj[:-5],
-                                              "%Y-%m-%dT%H:%M:%S.%f")
-
-        instance = objClass()
-
-        for attr, attrType in instance.swaggerTypes.iteritems():
-            if attr in obj:
-                value = obj[attr]
-                if attrType in ['str', 'int', 'long', 'float', 'bool']:
-                    attrType = eval(attrType)
-                    try:
-                        value = attrType(value)
-                    except UnicodeEncodeError:
-                        value = unicode(value)
-                    setattr(instance, attr, value)
-                elif (attrType == 'datetime'):
-                    setattr(instance, attr, datetime.datetime.strptime(value[:-5],
-                                              "%Y-%m-%dT%H:%M:%S.%f"))
-                elif 'list[' in attrType:
-                    match = re.match('list\[(.*)\]', attrType)
-                    subClass = match.group(1)
-                    subValues = []
-                    if not value:
-                        setattr(instance, attr, None)
-                    else:
-                        for subValue in value:
-                            subValues.append(self.deserialize(subValue,
-                                                              subClass))
-                    setattr(instance, attr, subValues)
-                else:
-                    setattr(instance, attr, self.deserialize(value,
-                                                             objClass))
-
-        return instance
+        elif options.get('lazy', self.lazy):
+            mode = 'lazy'
+        else:
+            mode = 'model'
+        start = time.time()
+        result = deserializer.deserialize(obj, objClass, mode)
+        self.metrics.observe(endpoint, 'deserialize', time.time() - start)
+        return result
 
 
 class MethodRequest(urllib2.Request):
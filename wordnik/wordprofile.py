@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""The result of `WordApi.getWordProfile`. It is assembled on the client
+from several calls rather than returned by the API, so it is not one of the
+generated models and is never deserialized or sent back."""
+
+
+class WordProfile(object):
+    """Everything the WordApi knows about one word. Parts that were not
+    requested stay None, as do parts whose call failed.
+
+    Attributes:
+        word -- the word looked up
+        wordObject, definitions, examples, textPronunciations, hyphenation,
+            audio, etymologies, relatedWords, frequency -- the results of
+            the corresponding WordApi calls
+        errors -- dict mapping each part whose call raised to the
+            exception, or None if every call succeeded. Not pickled, as
+            exceptions such as urllib2.HTTPError hold the response they
+            came with.
+    """
+
+    parts = ('wordObject', 'definitions', 'examples', 'textPronunciations',
+             'hyphenation', 'audio', 'etymologies', 'relatedWords',
+             'frequency')
+
+    __slots__ = ('word', 'errors') + parts
+
+    def __init__(self, word=None):
+        self.word = word
+        for part in self.parts:
+            setattr(self, part, None)
+        self.errors = None
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr))
+                    for attr in ('word',) + self.parts)
+
+    def __setstate__(self, state):
+        self.errors = None
+        for (attr, value) in state.iteritems():
+            setattr(self, attr, value)
+
+    def __repr__(self):
+        return 'WordProfile(%r)' % self.word